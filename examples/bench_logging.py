@@ -0,0 +1,73 @@
+"""
+로깅 오버헤드 벤치마크
+order() 1건이 남기는 로그(주문 요청 INFO + 주문 접수 DEBUG)를 반복 기록하여
+동기 모드와 큐(백그라운드 스레드) 모드의 호출 스레드 비용을 비교합니다.
+
+실행: python examples/bench_logging.py [반복횟수]
+"""
+
+import os
+import sys
+import time
+import logging
+import tempfile
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from systock.logger import setup_logger
+
+
+def bench(name: str, use_queue: bool, json_format: bool, n: int) -> float:
+    log_dir = tempfile.mkdtemp(prefix="systock_bench_")
+
+    # 콘솔 출력은 측정에서 제외하기 위해 stderr를 잠시 /dev/null로 돌림
+    stderr = sys.stderr
+    sys.stderr = open(os.devnull, "w")
+    try:
+        logger = setup_logger(
+            f"bench.{name}", use_queue=use_queue, json_format=json_format, log_dir=log_dir
+        )
+
+        started = time.perf_counter()
+        for i in range(n):
+            logger.info(
+                "주문 요청: %s %s %d주 @ %s원 (유형: %s/%s)",
+                "buy", "005930", 10, 60000, "지정가", "00",
+                extra={"symbol": "005930"},
+            )
+            logger.debug(
+                "주문 접수: %s (%.1fms)", f"{i:010d}", 12.3,
+                extra={"tr_id": "VTTC0802U", "order_id": f"{i:010d}", "latency_ms": 12.3},
+            )
+        elapsed = time.perf_counter() - started
+
+        # 큐 모드는 백그라운드 기록이 끝날 때까지 대기 (측정 시간에는 미포함)
+        listener = getattr(logger, "listener", None)
+        if listener is not None:
+            listener.stop()
+        for handler in logger.handlers:
+            handler.close()
+    finally:
+        sys.stderr.close()
+        sys.stderr = stderr
+
+    return elapsed / n * 1e6
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    logging.raiseExceptions = False
+
+    print(f"주문 1건당 로깅 비용 (호출 스레드 기준, {n:,}회 평균)")
+    for name, use_queue, json_format in [
+        ("sync_text", False, False),
+        ("sync_json", False, True),
+        ("queue_text", True, False),
+        ("queue_json", True, True),
+    ]:
+        us = bench(name, use_queue, json_format, n)
+        print(f" - {name:<11}: {us:8.2f} us/order")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import os
 from dotenv import load_dotenv
 from .interfaces.broker import Broker
 from .token_store import TokenStore
+from .snapshot_store import SnapshotStore
 from .exceptions import ConfigError
 from .contexts import StockContext, AccountContext
 
@@ -13,10 +14,14 @@ def create_broker(
     mode: str = "virtual",
     account_name: str = None,  # [추가] 계좌 별칭 (예: 'sub', 'mom')
     token_store: TokenStore = None,
+    snapshot_store: SnapshotStore = None,  # [추가] 재시작 warm start용 스냅샷 저장소
+    **options,
 ) -> Broker:
     """
     브로커 인스턴스 생성 팩토리
     :param account_name: .env에 설정된 계좌 별칭 (None이면 기본값 사용)
+    :param snapshot_store: 지정 시 저장된 시세/잔고/주문 상태를 즉시 적용하고 백그라운드에서 갱신
+    :param options: 브로커별 추가 옵션 (kis: base_url / sim: cash, fee_rate, tax_rate, slippage)
     """
 
     mode = mode.lower()
@@ -54,12 +59,22 @@ def create_broker(
         # 계좌번호가 다르면 TokenStore는 알아서 별도의 키로 저장하므로
         # 같은 store 객체를 써도 꼬이지 않습니다.
 
-        return KisBroker(
+        broker = KisBroker(
             app_key=app_key,
             app_secret=app_secret,
             acc_no=acc_no,
             is_real=is_real,
             token_store=token_store,
+            base_url=options.get("base_url"),
         )
+        if snapshot_store is not None:
+            snapshot_store.attach(broker)
+        return broker
+
+    if broker_name.lower() == "sim":
+        # 백테스트용 시뮬레이션 브로커 (API Key 불필요, numpy 필요)
+        from .brokers.sim.client import SimBroker
+
+        return SimBroker(**options)
 
     raise ValueError(f"지원하지 않는 증권사입니다: {broker_name}")
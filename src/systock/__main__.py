@@ -0,0 +1,6 @@
+# python -m systock 실행 지원
+import sys
+
+from .cli import main
+
+sys.exit(main())
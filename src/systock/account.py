@@ -0,0 +1,150 @@
+# src/systock/account.py
+import time
+import logging
+import threading
+from typing import Callable, Dict, Optional
+
+from .models import Balance, Holding
+
+
+class _Flight:
+    """진행 중인 잔고 조회 1건 (같은 시점의 다른 요청들이 결과를 공유)"""
+
+    __slots__ = ("done", "balance", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.balance: Optional[Balance] = None
+        self.error: Optional[BaseException] = None
+
+
+class AccountSnapshot:
+    """
+    계좌 잔고 스냅샷 (계좌 단위 공유)
+    - max_age(초) 이내의 조회 결과는 API 호출 없이 재사용합니다.
+    - 여러 스레드가 동시에 갱신을 요청하면 실제 조회는 한 번만 수행합니다. (single-flight)
+    - 주문/취소/체결 후 invalidate()로 무효화되어, 다음 조회 시 새로 가져옵니다.
+    - 종목별 보유 정보는 dict로 색인하여 O(1)로 조회합니다.
+
+    사용 예:
+        balance = broker.account_snapshot.get()
+        holding = broker.account_snapshot.holding("005930")
+    """
+
+    def __init__(self, fetch_fn: Callable[[], Balance], max_age: float = 1.0):
+        self._fetch = fetch_fn
+        self.max_age = max_age
+        self.logger = logging.getLogger("systock.account")
+
+        self._balance: Optional[Balance] = None
+        self._by_symbol: Dict[str, Holding] = {}
+        self._fetched_at = 0.0  # time.monotonic() 기준 (0이면 무효)
+        self._version = 0  # invalidate() 호출마다 증가
+        self._flight: Optional[_Flight] = None
+        self._lock = threading.Lock()
+        self.fetch_count = 0
+
+    @property
+    def age(self) -> Optional[float]:
+        """마지막 조회 후 경과 시간 (조회 전이거나 무효화된 경우 None)"""
+        if not self._fetched_at:
+            return None
+        return time.monotonic() - self._fetched_at
+
+    def seed(self, balance: Balance):
+        """
+        [추가] 저장된 잔고로 초기화 (재시작 직후 warm start용)
+        - 만료된 상태로 채워지므로 get()은 새로 조회하고, get(stale=True)는 즉시 반환합니다.
+        """
+        with self._lock:
+            if self._balance is not None:
+                return
+            self._balance = balance
+            self._by_symbol = {h.symbol: h for h in balance.holdings}
+            self._fetched_at = 0.0
+
+    def get(self, max_age: float = None, stale: bool = False) -> Balance:
+        """
+        잔고 반환 (필요 시 갱신)
+        :param max_age: 이번 호출에 허용할 최대 경과 시간 (기본값: self.max_age, 0이면 항상 갱신)
+        :param stale: True면 만료된 잔고라도 즉시 반환하고 갱신은 백그라운드에서 수행
+        """
+        max_age = self.max_age if max_age is None else max_age
+
+        with self._lock:
+            if self._balance is not None and (
+                self._fetched_at and time.monotonic() - self._fetched_at <= max_age
+            ):
+                return self._balance
+            if stale and self._balance is not None:
+                if self._flight is None:
+                    threading.Thread(
+                        target=self._refresh_quietly, name="systock-account-refresh", daemon=True
+                    ).start()
+                return self._balance
+
+            flight = self._flight
+            leader = flight is None
+            if leader:
+                flight = self._flight = _Flight()
+                version = self._version
+
+        if not leader:
+            # 이미 다른 스레드가 조회 중이면 그 결과를 함께 사용
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.balance
+
+        try:
+            balance = self._fetch()
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                if self._flight is flight:
+                    self._flight = None
+            flight.done.set()
+            raise
+
+        with self._lock:
+            self.fetch_count += 1
+            # 조회 도중 주문이 나갔다면 결과는 돌려주되 캐시는 갱신하지 않음 (이후 조회가 새로 채움)
+            if version == self._version:
+                self._balance = balance
+                self._by_symbol = {h.symbol: h for h in balance.holdings}
+                self._fetched_at = time.monotonic()
+            elif self._balance is None:
+                self._balance = balance
+                self._by_symbol = {h.symbol: h for h in balance.holdings}
+            if self._flight is flight:
+                self._flight = None
+
+        flight.balance = balance
+        flight.done.set()
+        return balance
+
+    def _refresh_quietly(self):
+        try:
+            self.get(max_age=0)
+        except Exception as e:
+            self.logger.warning("잔고 백그라운드 갱신 실패: %s", e)
+
+    def holding(self, symbol: str, max_age: float = None) -> Optional[Holding]:
+        """종목별 보유 정보 (미보유 시 None)"""
+        self.get(max_age)
+        return self._by_symbol.get(symbol)
+
+    @property
+    def balance(self) -> Optional[Balance]:
+        """마지막으로 조회(또는 seed)한 잔고 (조회하지 않고 그대로 반환, 없으면 None)"""
+        return self._balance
+
+    def invalidate(self):
+        """
+        캐시 무효화 (주문/취소/체결 후 호출)
+        - 진행 중인 조회는 주문 이전 상태일 수 있으므로, 이후 get()은 그 결과에 합류하지 않고 새로 조회합니다.
+        """
+        with self._lock:
+            self._version += 1
+            self._fetched_at = 0.0
+            self._flight = None
@@ -0,0 +1,238 @@
+# src/systock/bars.py
+import time
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+# [선택] 라이브러리가 설치되어 있을 때만 import
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .models import Quote
+from .indicators import Indicator
+
+BAR_FIELDS = ("ts", "open", "high", "low", "close", "volume")
+_CURRENT_FIELDS = (
+    "_cur_ts", "_cur_open", "_cur_high", "_cur_low", "_cur_close", "_vol_base", "_last_cum",
+)
+
+
+class BarAggregator:
+    """
+    시세/틱 스트림 → OHLCV 봉 집계기
+    - 종목별 진행 중인 봉과 완성된 봉 이력을 미리 할당한 배열(종목 x capacity 링 버퍼)에 보관합니다.
+    - 시세 1건마다 해당 종목의 봉을 O(1)로 갱신하며, update_many()로 여러 종목을 한 번에 갱신할 수 있습니다.
+    - 봉이 완성되면 등록된 지표(add_indicator)를 완성된 종목들에 대해 한 번에 갱신하고 on_bar 콜백을 호출합니다.
+    - 거래량은 누적 거래량(Quote.volume)의 차이로 계산합니다.
+
+    사용 예:
+        bars = BarAggregator(interval=60)
+        ema = bars.add_indicator(EMA(20))
+        bars.attach(broker)                  # 시세 조회 결과로 자동 갱신
+        bars.update("005930", 60000, 1_234_567)
+        bars.bars("005930", 30)["close"]
+        ema.value[bars.index("005930")]
+    """
+
+    def __init__(
+        self,
+        interval: float = 60.0,
+        capacity: int = 512,
+        symbols: Sequence[str] = (),
+        on_bar: Optional[Callable[[str, dict], None]] = None,
+    ):
+        """
+        :param interval: 봉 주기 (초, 예: 60=1분봉, 300=5분봉)
+        :param capacity: 종목별로 보관할 완성 봉 개수 (초과 시 오래된 봉부터 덮어씀)
+        :param on_bar: 봉 완성 콜백 callback(symbol, bar_dict)
+        """
+        if np is None:
+            raise ImportError("numpy 라이브러리가 필요합니다. (pip install numpy)")
+
+        self.interval = float(interval)
+        self.capacity = capacity
+        self.symbols: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._indicators: List[Indicator] = []
+        self.bar_listeners: List[Callable[[str, dict], None]] = [on_bar] if on_bar else []
+        self._lock = threading.Lock()
+
+        self._size = 0
+        for name in _CURRENT_FIELDS:
+            setattr(self, name, None)
+        self._hist: Dict[str, "np.ndarray"] = {}
+        self._count = None
+        self._alloc(max(16, len(symbols)))
+        for symbol in symbols:
+            self.index(symbol)
+
+    # -----------------------------------------------------------
+    # 배열 관리
+    # -----------------------------------------------------------
+    def _alloc(self, n: int):
+        """종목 수 n 기준으로 배열 할당 (기존 값 유지)"""
+
+        def grow(arr, fill, width=None, dtype=np.float64):
+            new = np.full(n if width is None else (n, width), fill, dtype=dtype)
+            if arr is not None:
+                new[: len(arr)] = arr
+            return new
+
+        # 진행 중인 봉 (+ 봉 시작 시점의 누적 거래량, 마지막 누적 거래량)
+        for name in _CURRENT_FIELDS:
+            setattr(self, name, grow(getattr(self, name), np.nan))
+        # 완성 봉 이력 (종목 x capacity 링 버퍼)
+        self._hist = {
+            name: grow(self._hist.get(name), np.nan, self.capacity) for name in BAR_FIELDS
+        }
+        self._count = grow(self._count, 0, dtype=np.int64)
+
+    def index(self, symbol: str) -> int:
+        """종목 번호 (처음 보는 종목이면 등록)"""
+        i = self._index.get(symbol)
+        if i is None:
+            i = self._size
+            if i >= len(self._cur_ts):
+                self._alloc(len(self._cur_ts) * 2)
+            self._index[symbol] = i
+            self.symbols.append(symbol)
+            self._size += 1
+        return i
+
+    def add_indicator(self, indicator: Indicator) -> Indicator:
+        """봉 완성 시 함께 갱신할 지표 등록 (등록한 지표 반환)"""
+        self._indicators.append(indicator)
+        return indicator
+
+    # -----------------------------------------------------------
+    # 갱신
+    # -----------------------------------------------------------
+    def update(self, symbol: str, price: float, volume: int, ts: float = None):
+        """
+        시세 1건 반영
+        :param volume: 누적 거래량
+        :param ts: 수신 시각 (epoch 초, 생략 시 현재 시각)
+        """
+        ts = time.time() if ts is None else ts
+        with self._lock:
+            i = self.index(symbol)
+            start = ts - ts % self.interval
+            if self._cur_ts[i] != start:
+                self._roll(np.array([i]), start)
+                self._cur_open[i] = self._cur_high[i] = self._cur_low[i] = price
+                base = self._vol_base[i]
+                if np.isnan(base):
+                    self._vol_base[i] = volume  # 처음 보는 종목
+                elif volume < base:
+                    self._vol_base[i] = 0.0  # 누적 거래량 초기화 (일자 변경)
+            elif price > self._cur_high[i]:
+                self._cur_high[i] = price
+            elif price < self._cur_low[i]:
+                self._cur_low[i] = price
+            self._cur_close[i] = price
+            self._last_cum[i] = volume
+
+    def update_many(self, symbols, prices, volumes, ts: float = None):
+        """
+        여러 종목 시세를 한 번에 반영 (같은 시각, 종목 중복 없음)
+        :param symbols: 종목코드 목록 또는 index()로 얻은 종목 번호 배열
+        :param volumes: 누적 거래량 배열
+        """
+        ts = time.time() if ts is None else ts
+        prices = np.asarray(prices, dtype=np.float64)
+        volumes = np.asarray(volumes, dtype=np.float64)
+        with self._lock:
+            if len(symbols) and isinstance(symbols[0], str):
+                idx = np.fromiter((self.index(s) for s in symbols), dtype=np.int64, count=len(symbols))
+            else:
+                idx = np.asarray(symbols, dtype=np.int64)
+
+            start = ts - ts % self.interval
+            new_bar = self._cur_ts[idx] != start
+            if new_bar.any():
+                rolled = idx[new_bar]
+                self._roll(rolled, start)
+                p = prices[new_bar]
+                self._cur_open[rolled] = p
+                self._cur_high[rolled] = p
+                self._cur_low[rolled] = p
+                base = self._vol_base[rolled]
+                v = volumes[new_bar]
+                self._vol_base[rolled] = np.where(np.isnan(base), v, np.where(v < base, 0.0, base))
+
+            self._cur_high[idx] = np.fmax(self._cur_high[idx], prices)
+            self._cur_low[idx] = np.fmin(self._cur_low[idx], prices)
+            self._cur_close[idx] = prices
+            self._last_cum[idx] = volumes
+
+    def on_quote(self, symbol: str, quote: Quote, ts: float = None):
+        """quote_listeners 콜백 형식 (callback(symbol, quote))"""
+        self.update(symbol, quote.price, quote.volume, ts)
+
+    def attach(self, broker):
+        """브로커의 시세 조회 결과(quote_listeners)로 자동 갱신"""
+        broker.quote_listeners.append(self.on_quote)
+
+    def _roll(self, idx, start: float):
+        """idx 종목들의 진행 중인 봉을 마감하고 start 시각의 새 봉을 시작"""
+        done = idx[~np.isnan(self._cur_ts[idx])]
+        if len(done):
+            last = self._last_cum[done]
+            volume = np.maximum(last - self._vol_base[done], 0.0)
+            pos = self._count[done] % self.capacity
+            bar = {
+                "ts": self._cur_ts[done],
+                "open": self._cur_open[done],
+                "high": self._cur_high[done],
+                "low": self._cur_low[done],
+                "close": self._cur_close[done],
+                "volume": volume,
+            }
+            for name, values in bar.items():
+                self._hist[name][done, pos] = values
+            self._count[done] += 1
+
+            for indicator in self._indicators:
+                indicator.update_bars(
+                    done, bar["open"], bar["high"], bar["low"], bar["close"], volume
+                )
+            if self.bar_listeners:
+                for k, i in enumerate(done):
+                    row = {name: float(values[k]) for name, values in bar.items()}
+                    for listener in self.bar_listeners:
+                        listener(self.symbols[i], row)
+
+        # 새 봉의 거래량 기준점: 직전 누적 거래량 (처음 보는 종목은 NaN → 호출부에서 보정)
+        self._vol_base[idx] = self._last_cum[idx]
+        self._cur_ts[idx] = start
+
+    # -----------------------------------------------------------
+    # 조회
+    # -----------------------------------------------------------
+    def bars(self, symbol: str, n: int = None) -> Dict[str, "np.ndarray"]:
+        """완성된 봉 이력 (오래된 순, 최대 capacity개)"""
+        i = self._index.get(symbol)
+        if i is None:
+            return {name: np.zeros(0) for name in BAR_FIELDS}
+        with self._lock:
+            count = int(self._count[i])
+            size = min(count, self.capacity if n is None else min(n, self.capacity))
+            pos = (np.arange(count - size, count) % self.capacity)
+            return {name: self._hist[name][i, pos].copy() for name in BAR_FIELDS}
+
+    def current(self, symbol: str) -> Optional[dict]:
+        """진행 중인 봉 (없으면 None)"""
+        i = self._index.get(symbol)
+        if i is None or np.isnan(self._cur_ts[i]):
+            return None
+        with self._lock:
+            base = self._vol_base[i]
+            return {
+                "ts": float(self._cur_ts[i]),
+                "open": float(self._cur_open[i]),
+                "high": float(self._cur_high[i]),
+                "low": float(self._cur_low[i]),
+                "close": float(self._cur_close[i]),
+                "volume": float(max(self._last_cum[i] - base, 0.0)) if not np.isnan(base) else 0.0,
+            }
@@ -1,12 +1,15 @@
 import requests
 import json
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Optional, Dict
+from urllib.parse import urlparse
 
 # [수정] 외부 모듈 임포트 (경로 주의)
-from ...utils import RateLimiter
-from ...exceptions import AuthError
+from ...utils import RateLimiter, CircuitBreaker
+from ...clock import Clock, SYSTEM_CLOCK
+from ...exceptions import AuthError, NetworkError, DeadlineExceededError
 from ...token_store import TokenStore, FileTokenStore
 
 
@@ -21,6 +24,28 @@ class KisAuthMixin:
     # 1초에 1회 발급 제한 (데코레이터 대신 static 변수로 관리)
     _token_limiter = RateLimiter(max_calls=1, period=1.0)
 
+    # [추가] 요청 기한 기본값 (초, 유량 제한 대기 시간 포함) / 연결 수립 제한 시간
+    DEFAULT_TIMEOUT = 10.0
+    CONNECT_TIMEOUT = 3.05
+
+    # [추가] 요청 기한/지연 측정용 시계 (시뮬레이션 시 인스턴스에 VirtualClock 주입)
+    clock: Clock = SYSTEM_CLOCK
+
+    # KIS 유량 초과 에러 코드 ("초당 거래건수를 초과하였습니다.", HTTP 500으로 내려옴)
+    THROTTLE_CODE = "EGW00201"
+
+    # [추가] 엔드포인트별 서킷 브레이커 (서버 단위로 모든 인스턴스 공유)
+    # 구조: {(base_url, '/uapi/domestic-stock/v1/quotations/inquire-price'): CircuitBreaker객체, ...}
+    # (실제 시계가 아닌 clock을 주입한 인스턴스는 (base_url, path, clock) 키로 따로 보관)
+    _breakers = {}
+    _breakers_lock = threading.Lock()
+
+    # 엔드포인트별 브레이커 설정 (경로의 마지막 이름 기준, 없으면 CircuitBreaker 기본값)
+    BREAKER_OPTIONS = {
+        "tokenP": {"slow_call_threshold": 10.0},
+        "order-cash": {"slow_call_threshold": 2.0},
+    }
+
     def __init__(
         self,
         app_key: str,
@@ -28,32 +53,35 @@ class KisAuthMixin:
         acc_no: str,
         is_real: bool = False,
         token_store: TokenStore = None,
+        base_url: str = None,
     ):
         self.app_key = app_key
         self.app_secret = app_secret
+        self.logger = logging.getLogger("systock.kis")
 
         # [수정] 사용자가 "12345678-01"로 넣든 "1234567801"로 넣든
         # 하이픈(-)과 공백을 모두 제거하여 숫자 10자리만 남김
         clean_acc = acc_no.replace("-", "").strip()
 
         if len(clean_acc) != 10:
-            # 혹시라도 자릿수가 안 맞으면 경고 (로그나 print로 확인 추천)
-            print(
-                f"⚠️ [경고] 계좌번호 포맷이 이상합니다 ({len(clean_acc)}자리). KIS는 보통 10자리(8+2)입니다."
+            # 혹시라도 자릿수가 안 맞으면 경고
+            self.logger.warning(
+                "계좌번호 포맷이 이상합니다 (%d자리). KIS는 보통 10자리(8+2)입니다.",
+                len(clean_acc),
             )
 
         self.acc_no_prefix = clean_acc[:8]  # 앞 8자리 (종합계좌번호)
         self.acc_no_suffix = clean_acc[8:]  # 뒤 2자리 (계좌상품코드)
 
         self.is_real = is_real
-        self.base_url = self.URL_REAL if is_real else self.URL_VIRTUAL
+        # [추가] base_url: 로컬 모의 서버 등 다른 주소 (기본값: 실전/모의 서버)
+        self.base_url = base_url.rstrip("/") if base_url else (self.URL_REAL if is_real else self.URL_VIRTUAL)
 
         # [변경] 저장소 설정 (기본값: 파일 저장소)
         self.token_store = token_store if token_store else FileTokenStore()
 
         self.access_token: Optional[str] = None
         self._session = requests.Session()
-        self.logger = logging.getLogger("systock.kis")
 
     def connect(self) -> bool:
         """토큰 발급 (캐싱 우선 확인 -> API 호출)"""
@@ -76,9 +104,6 @@ class KisAuthMixin:
                 )
 
         # 2. 토큰이 없거나 만료된 경우 API 호출 준비
-        # 전역 제한기 대기 (다른 객체가 발급 중이면 기다림)
-        KisAuthMixin._token_limiter.wait()
-
         self.logger.debug("토큰 신규 발급 시도 (API 요청)...")
         url = f"{self.base_url}/oauth2/tokenP"
         body = {
@@ -87,7 +112,8 @@ class KisAuthMixin:
             "appsecret": self.app_secret,
         }
 
-        resp = requests.post(url, json=body)
+        # 전역 제한기 대기 (다른 객체가 발급 중이면 기다림)
+        resp = self._send("POST", url, limiter=KisAuthMixin._token_limiter, json=body)
 
         if resp.status_code == 200:
             data = resp.json()
@@ -132,16 +158,107 @@ class KisAuthMixin:
     def _generate_hash(self, data: dict) -> str:
         """Hash Key 생성"""
 
-        # [추가] HashKey 발급도 API 호출이므로 RateLimiter 적용
-        # Mixin이므로 self.limiter가 존재할 때만 동작하도록 처리
-        if hasattr(self, "limiter") and self.limiter:
-            self.limiter.wait()
-
         url = f"{self.base_url}/uapi/hashkey"
         headers = {
             "content-type": "application/json; charset=utf-8",
             "appkey": self.app_key,
             "appsecret": self.app_secret,
         }
-        resp = requests.post(url, headers=headers, data=json.dumps(data))
+        # [추가] HashKey 발급도 API 호출이므로 RateLimiter 적용
+        # Mixin이므로 self.limiter가 존재할 때만 동작하도록 처리
+        resp = self._send(
+            "POST", url, limiter=getattr(self, "limiter", None), headers=headers, data=json.dumps(data)
+        )
         return resp.json()["HASH"]
+
+    def _breaker(self, url: str) -> CircuitBreaker:
+        """
+        URL 경로(엔드포인트)에 해당하는 서킷 브레이커 반환
+        - 국내/해외 'inquire-price'처럼 마지막 이름이 같은 엔드포인트도 경로 전체로 구분합니다.
+        """
+        path = urlparse(url).path.rstrip("/")
+        key = (self.base_url, path) + self._clock_key()
+        breaker = KisAuthMixin._breakers.get(key)
+        if breaker is None:
+            with KisAuthMixin._breakers_lock:
+                breaker = KisAuthMixin._breakers.get(key)
+                if breaker is None:
+                    name = path.rsplit("/", 1)[-1]
+                    breaker = CircuitBreaker(
+                        path, clock=self.clock, **self.BREAKER_OPTIONS.get(name, {})
+                    )
+                    KisAuthMixin._breakers[key] = breaker
+        return breaker
+
+    def _clock_key(self) -> tuple:
+        """공유 저장소 키 접미사 (주입한 시계의 브레이커가 실제 브로커와 섞이지 않도록 분리)"""
+        return () if self.clock is SYSTEM_CLOCK else (self.clock,)
+
+    def breaker_metrics(self) -> Dict[str, dict]:
+        """엔드포인트(경로)별 서킷 브레이커 상태 (모니터링용)"""
+        suffix = self._clock_key()
+        return {
+            key[1]: breaker.metrics()
+            for key, breaker in list(KisAuthMixin._breakers.items())
+            if key[0] == self.base_url and key[2:] == suffix
+        }
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        limiter: Optional[RateLimiter] = None,
+        deadline: Optional[float] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        [공통 전송] 서킷 브레이커 확인 -> 유량 제한 대기 -> 전송
+        :param deadline: 요청 완료 기한 (self.clock.monotonic() 기준, 기본값: 지금 + DEFAULT_TIMEOUT)
+        기한 안에 유량 제한을 통과할 수 없으면 호출 슬롯을 쓰지 않고 DeadlineExceededError를 던집니다.
+        """
+        clock = self.clock
+        if deadline is None:
+            deadline = clock.monotonic() + self.DEFAULT_TIMEOUT
+
+        # 1. 장애 중인 엔드포인트는 대기 없이 즉시 실패
+        breaker = self._breaker(url)
+        breaker.allow()
+
+        # 2. 유량 제한 대기 (남은 기한까지만)
+        remaining = deadline - clock.monotonic()
+        if remaining <= 0 or (limiter is not None and not limiter.wait(timeout=remaining)):
+            breaker.release()
+            raise DeadlineExceededError(f"요청 기한 초과 (유량 제한 대기): {breaker.name}")
+
+        remaining = deadline - clock.monotonic()
+        if remaining <= 0:
+            breaker.release()
+            raise DeadlineExceededError(f"요청 기한 초과 (유량 제한 대기): {breaker.name}")
+
+        # 3. 전송 (남은 기한을 소켓 타임아웃으로 사용)
+        started = clock.monotonic()
+        try:
+            resp = self._session.request(
+                method, url, timeout=(min(self.CONNECT_TIMEOUT, remaining), remaining), **kwargs
+            )
+        except requests.exceptions.Timeout as e:
+            breaker.record(clock.monotonic() - started, failed=True)
+            raise DeadlineExceededError(f"요청 기한 초과 (응답 대기): {breaker.name}") from e
+        except requests.exceptions.RequestException as e:
+            breaker.record(clock.monotonic() - started, failed=True)
+            # requests 에러를 NetworkError로 감싸서 던짐
+            raise NetworkError(f"네트워크 요청 실패: {e}") from e
+
+        breaker.record(clock.monotonic() - started, failed=self._is_server_failure(resp))
+        return resp
+
+    def _is_throttled(self, resp) -> bool:
+        """유량 초과 응답 여부 (본문 파싱 없이 바이트 검색)"""
+        return self.THROTTLE_CODE.encode() in resp.content
+
+    def _is_server_failure(self, resp) -> bool:
+        """
+        서킷 브레이커에 실패로 기록할 응답 여부
+        - 유량 초과(EGW00201)도 HTTP 500으로 오지만 서버 장애가 아니므로 제외합니다. (RateLimiter가 처리)
+        """
+        return resp.status_code >= 500 and not self._is_throttled(resp)
@@ -1,20 +1,28 @@
+import time
+import random
 import threading
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 # 인터페이스 및 유틸리티
 from ...interfaces.broker import Broker
-from ...utils import RateLimiter
+from ...utils import AdaptiveRateLimiter
+from ...clock import Clock, SYSTEM_CLOCK
 from ...contexts import StockContext, AccountContext
+from ...models import Quote
 
 # 기능별 Mixin
 from .auth import KisAuthMixin
 from .domestic import KisDomesticMixin
 from .overseas import KisOverseasMixin
 from .realtime import KisRealtimeMixin
+from .fastlane import KisOrderFastLane
 
-import requests
-from ...exceptions import ConfigError, NetworkError  # [추가]
+from ...exceptions import ConfigError, ApiError  # [추가]
 from ...token_store import TokenStore
+from ...order_tracker import OrderTracker
+from ...account import AccountSnapshot
+from ...master import StockMaster
 
 
 class KisBroker(
@@ -30,11 +38,24 @@ class KisBroker(
     - 계좌 단위 API 유량 제한(Rate Limit)을 전역적으로 관리 (Thread-Safe)
     """
 
+    # 유량 초과 시 멱등(조회) 요청 자동 재시도 횟수
+    THROTTLE_RETRIES = 3
+    # 재시도 전 대기 시간 = limiter.period * (1 ~ 1 + THROTTLE_JITTER) (서버 윈도가 비워질 때까지)
+    THROTTLE_JITTER = 0.5
+
     # [핵심] 계좌번호별 RateLimiter를 공유하기 위한 클래스 변수 (저장소)
     # 구조: {'12345678-01': RateLimiter객체, ...}
+    # (실제 시계가 아닌 clock을 주입한 인스턴스는 ('12345678-01', clock) 키로 따로 보관)
     _rate_limiters = {}
     _limiters_lock = threading.Lock()  # 동시 접근 제어용 락
 
+    # [추가] 계좌번호별 주문 추적기 (RateLimiter와 동일하게 계좌 단위 공유)
+    _order_trackers = {}
+    # [추가] 계좌번호별 잔고 스냅샷 (broker.my 컨텍스트들이 공유)
+    _account_snapshots = {}
+    # 잔고 스냅샷 최대 재사용 시간 (초)
+    ACCOUNT_MAX_AGE = 1.0
+
     def __init__(
         self,
         app_key: str,
@@ -42,12 +63,20 @@ class KisBroker(
         acc_no: str,
         is_real: bool = False,
         token_store: TokenStore = None,
+        clock: Clock = None,
+        base_url: str = None,
     ):
+        """
+        :param clock: [추가] 유량 제한/요청 기한용 시계 (기본값: 실제 시계, 시뮬레이션 시 VirtualClock)
+        :param base_url: [추가] API 주소 변경 (로컬 모의 서버 등, 토큰 저장소도 따로 지정하세요)
+        """
         if not app_key or not app_secret or not acc_no:
             raise ConfigError("API Key 또는 계좌번호가 설정되지 않았습니다.")
 
         # 1. 부모 클래스(KisAuthMixin) 초기화 -> self.session, self.logger 등 생성
-        super().__init__(app_key, app_secret, acc_no, is_real, token_store)
+        super().__init__(app_key, app_secret, acc_no, is_real, token_store, base_url)
+        if clock is not None:
+            self.clock = clock
 
         # 2. 유량 제한 설정 (계좌 단위 공유 로직)
         # 실전: 초당 20건 / 모의: 초당 2건
@@ -57,35 +86,258 @@ class KisBroker(
         # [방어 로직]
         # 이미 이 계좌에 할당된 Limiter가 있다면 그것을 쓰고, 없다면 새로 만듭니다.
         # Lock을 사용하여 여러 스레드/객체가 동시에 접근해도 안전합니다.
+        # 주입한 시계(VirtualClock 등)의 limiter가 실제 브로커와 섞이지 않도록 시계별로 분리
+        limiter_key = account_key if self.clock is SYSTEM_CLOCK else (account_key, self.clock)
         with KisBroker._limiters_lock:
-            if account_key not in KisBroker._rate_limiters:
-                KisBroker._rate_limiters[account_key] = RateLimiter(
-                    max_calls=max_calls, period=1.0
+            if limiter_key not in KisBroker._rate_limiters:
+                # [변경] 서버 유량 초과 응답(EGW00201)에 따라 속도를 자동 조절
+                KisBroker._rate_limiters[limiter_key] = AdaptiveRateLimiter(
+                    max_calls=max_calls, period=1.0, clock=self.clock
                 )
 
             # 내 인스턴스의 limiter로 할당 (참조 복사)
-            self.limiter = KisBroker._rate_limiters[account_key]
+            self.limiter = KisBroker._rate_limiters[limiter_key]
+
+            if account_key not in KisBroker._order_trackers:
+                KisBroker._order_trackers[account_key] = OrderTracker()
+            self.order_tracker = KisBroker._order_trackers[account_key]
+
+            if account_key not in KisBroker._account_snapshots:
+                KisBroker._account_snapshots[account_key] = AccountSnapshot(
+                    self._fetch_balance, max_age=self.ACCOUNT_MAX_AGE
+                )
+            self.account_snapshot = KisBroker._account_snapshots[account_key]
+
+        # [추가] 종목 마스터 (설정 시 order()에서 호가단위 사전 검증)
+        self.master: Optional[StockMaster] = None
+        self._fast_lane: Optional[KisOrderFastLane] = None
+
+        # [추가] 시세 조회 결과 콜백 목록: callback(symbol, quote)
+        self.quote_listeners: List[Callable[[str, Quote], None]] = []
 
         self.logger.info(
             f"KIS Broker 생성 완료 ({'실전' if is_real else '모의'}, 계좌: {acc_no})"
         )
 
-    def request(self, method: str, url: str, **kwargs):
+    def request(
+        self, method: str, url: str, idempotent: bool = None, timeout: float = None, **kwargs
+    ):
         """
         [통합 요청 메서드]
         모든 Mixin에서 requests.get/post 대신 이 메서드를 사용해야 합니다.
         자동으로 유량 제한을 체크하고 대기(Wait)합니다.
+        :param idempotent: 유량 초과 시 자동 재시도 여부 (기본값: GET이면 True)
+        :param timeout: 요청 기한(초). 유량 제한 대기와 재시도 시간을 모두 포함 (기본값: DEFAULT_TIMEOUT)
+        """
+        if idempotent is None:
+            idempotent = method.upper() == "GET"
+
+        # [추가] 재시도를 포함한 전체 기한
+        deadline = self.clock.monotonic() + (timeout or self.DEFAULT_TIMEOUT)
+
+        attempt = 0
+        while True:
+            # 1. 서킷 확인 -> 유량 제한 대기 -> 전송 (KisAuthMixin._send)
+            resp = self._send(method, url, limiter=self.limiter, deadline=deadline, **kwargs)
+
+            # 2. [추가] 유량 초과 응답이면 속도를 낮추고, 조회성 요청은 재시도
+            if not self._is_throttled(resp):
+                self.limiter.on_success()
+                return resp
+
+            self.limiter.on_throttle()
+            if not idempotent or attempt >= self.THROTTLE_RETRIES:
+                return resp
+
+            # 3. 서버 측 윈도가 비워질 때까지 대기 후 재시도 (동시에 밀린 요청들이 몰리지 않도록 지터 적용)
+            backoff = self.limiter.period * (1 + random.random() * self.THROTTLE_JITTER)
+            if self.clock.monotonic() + backoff >= deadline:
+                return resp
+
+            attempt += 1
+            self.logger.warning(
+                "유량 초과 감지 (%s). %.2f초 후 재시도 %d/%d (현재 제한: 초당 %.1f건)",
+                self.THROTTLE_CODE,
+                backoff,
+                attempt,
+                self.THROTTLE_RETRIES,
+                self.limiter.current_rate,
+            )
+            self.clock.sleep(backoff)
+
+    def sync_orders(self, interval: Optional[float] = None):
+        """
+        주문 추적기를 REST 미체결 조회 결과와 대사합니다.
+        :param interval: None이면 1회만 수행, 값이 있으면 해당 주기(초)로 백그라운드 반복
+        마지막 대사가 order_tracker.max_sync_age 이내인 동안 cancel()은 로컬 상태를 사용합니다.
+        """
+        if interval is None:
+            fetched_at = time.time()
+            self.order_tracker.reconcile(self._fetch_open_orders(), fetched_at=fetched_at)
+        else:
+            self.order_tracker.start_reconcile(self._fetch_open_orders, interval)
+
+    def fast_lane(self, **options) -> KisOrderFastLane:
+        """
+        저지연 주문 경로 반환 (최초 호출 시 생성 및 연결 예열)
+        - keep-alive 스레드가 시작되므로 사용 후 broker.close()로 정리하세요.
+        :param options: KisOrderFastLane 옵션 (keepalive_interval, use_hashkey, max_qty, max_notional, timeout)
+        """
+        if self._fast_lane is None:
+            self._fast_lane = KisOrderFastLane(self, **options)
+            self._fast_lane.warm()
+        return self._fast_lane
+
+    def close(self):
+        """
+        [추가] 브로커 자원 정리 (fast_lane keep-alive 스레드, 주문 전용/조회 세션)
+        - 계좌 단위로 공유되는 RateLimiter/주문 추적기/잔고 스냅샷은 다른 인스턴스가 쓸 수 있으므로 그대로 둡니다.
         """
+        if self._fast_lane is not None:
+            self._fast_lane.close()
+            self._fast_lane = None
+        self._session.close()
 
-        # 1. 호출 가능할 때까지 대기 (다른 객체가 사용 중이면 기다림)
-        self.limiter.wait()
+    def __enter__(self):
+        return self
 
-        # 2. 실제 API 요청 전송 (KisAuthMixin의 self._session 사용)
-        try:
-            return self._session.request(method, url, **kwargs)
-        except requests.exceptions.RequestException as e:
-            # requests 에러를 NetworkError로 감싸서 던짐
-            raise NetworkError(f"네트워크 요청 실패: {e}") from e
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def warmup(
+        self,
+        watchlist: Iterable[str] = (),
+        master: Union[StockMaster, Dict[str, str], None] = None,
+        connections: int = 4,
+        fast_lane: bool = False,
+        account: bool = True,
+        orders: bool = False,
+    ) -> dict:
+        """
+        [추가] 장 시작 전 예열 (첫 주문이 천 번째 주문만큼 빠르도록)
+        - 토큰을 확인/발급한 뒤, 나머지 단계를 동시에 수행합니다. (API 호출은 계좌 RateLimiter를 따름)
+        - 실패한 단계는 건너뛰고 리포트의 'errors'에 기록합니다.
+          (시세는 일부 종목만 조회된 경우에도 'errors'에 남깁니다)
+        :param watchlist: 시세를 미리 조회할 종목 (quote_listeners로 캐시/기록기 등에 전달)
+        :param master: 종목 마스터 (StockMaster 또는 {'KOSPI': 경로, ...}), 지정 시 self.master로 설정
+        :param connections: 미리 열어 둘 조회용 연결 수 (fetch_prices의 max_workers와 맞추세요)
+        :param fast_lane: 주문 전용 경로(fast_lane) 생성 및 연결 예열 (keep-alive 스레드가 시작되므로 선택 사항)
+        :param orders: 미체결 주문 대사 1회 수행 (주기 대사는 sync_orders(interval=...)로 따로 시작)
+        :return: {'timings': 단계별 소요 시간(ms) {'token': .., ..., 'total': ..},
+                  'counts': {'quotes_requested': .., 'quotes_loaded': ..} (watchlist 지정 시),
+                  'errors': {단계: 메시지} (실패 시)}
+        """
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
+        counts: Dict[str, int] = {}
+        errors: Dict[str, str] = {}
+        report = {"timings": timings, "counts": counts}
+
+        def _timed(name: str, fn: Callable[[], object]):
+            t = time.perf_counter()
+            try:
+                fn()
+            except Exception as e:
+                errors[name] = str(e)
+                self.logger.warning("예열 실패 (%s): %s", name, e)
+            timings[name] = (time.perf_counter() - t) * 1000
+
+        # 1. 토큰 (다른 단계가 모두 토큰을 필요로 하므로 먼저 수행)
+        _timed("token", self.connect)
+        if "token" in errors:
+            timings["total"] = (time.perf_counter() - started) * 1000
+            report["errors"] = errors
+            return report
+
+        # 2. 나머지 단계 동시 수행
+        def _connections():
+            def _head(_):
+                self._session.head(self.base_url, timeout=self.CONNECT_TIMEOUT)
+
+            with ThreadPoolExecutor(max_workers=max(1, connections)) as pool:
+                list(pool.map(_head, range(max(1, connections))))
+
+        def _master():
+            self.master = StockMaster(master) if isinstance(master, dict) else master
+
+        def _quotes():
+            # fetch_prices는 실패 종목을 결과에서 빼고 반환하므로 요청 대비 조회 수를 확인
+            loaded = len(self.fetch_prices(watchlist))
+            counts["quotes_loaded"] = loaded
+            if loaded < len(watchlist):
+                raise ApiError(message=f"시세 일부만 조회됨 ({loaded}/{len(watchlist)}종목)")
+
+        steps = [("connections", _connections)]
+        if fast_lane:
+            steps.append(("fast_lane", self.fast_lane))
+        if master is not None:
+            steps.append(("master", _master))
+        watchlist = list(dict.fromkeys(watchlist))
+        if watchlist:
+            counts["quotes_requested"] = len(watchlist)
+            steps.append(("quotes", _quotes))
+        if account:
+            steps.append(("account", lambda: self.account_snapshot.get(max_age=0)))
+        if orders:
+            steps.append(("orders", self.sync_orders))
+
+        with ThreadPoolExecutor(max_workers=len(steps)) as pool:
+            list(pool.map(lambda step: _timed(*step), steps))
+
+        timings["total"] = (time.perf_counter() - started) * 1000
+        if errors:
+            report["errors"] = errors
+        self.logger.info(
+            "예열 완료: %s", ", ".join(f"{k} {v:.0f}ms" for k, v in timings.items())
+        )
+        return report
+
+        # 2. 나머지 단계 동시 수행
+        def _connections():
+            def _head(_):
+                self._session.head(self.base_url, timeout=self.CONNECT_TIMEOUT)
+
+            with ThreadPoolExecutor(max_workers=max(1, connections)) as pool:
+                list(pool.map(_head, range(max(1, connections))))
+
+        def _master():
+            self.master = StockMaster(master) if isinstance(master, dict) else master
+
+        steps = [("connections", _connections)]
+        if fast_lane:
+            steps.append(("fast_lane", self.fast_lane))
+        if master is not None:
+            steps.append(("master", _master))
+        def _quotes():
+            # fetch_prices는 실패 종목을 결과에서 빼고 반환하므로 요청 대비 조회 수를 확인
+            loaded = len(self.fetch_prices(watchlist))
+            report["quotes_loaded"] = loaded
+            if loaded < len(watchlist):
+                raise ApiError(message=f"시세 일부만 조회됨 ({loaded}/{len(watchlist)}종목)")
+
+        watchlist = list(dict.fromkeys(watchlist))
+        if watchlist:
+            report["quotes_requested"] = len(watchlist)
+            steps.append(("quotes", _quotes))
+        if account:
+            steps.append(("account", lambda: self.account_snapshot.get(max_age=0)))
+        if orders:
+            steps.append(("orders", self.sync_orders))
+
+        with ThreadPoolExecutor(max_workers=len(steps)) as pool:
+            list(pool.map(lambda step: _timed(*step), steps))
+
+        report["total"] = (time.perf_counter() - started) * 1000
+        if errors:
+            report["errors"] = errors
+        self.logger.info(
+            "예열 완료: %s",
+            ", ".join(
+                f"{k} {v:.0f}ms" for k, v in report.items()
+                if k not in ("errors", "quotes_requested", "quotes_loaded")
+            ),
+        )
+        return report
 
     def symbol(self, symbol_code: str) -> StockContext:
         """종목 컨텍스트 반환"""
@@ -97,4 +349,5 @@ class KisBroker(
         # 매번 새로운 Context를 만들어서 리턴할지, 캐싱할지 결정해야 합니다.
         # 여기서는 호출 시점마다 상태를 새로 확인하기 위해 매번 생성하되,
         # AccountContext 내부에서 Lazy Loading을 수행합니다.
+        # [변경] 잔고는 계좌 스냅샷(account_snapshot)을 공유하므로 max_age 이내 재조회는 생략됩니다.
         return AccountContext(self)
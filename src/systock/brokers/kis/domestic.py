@@ -1,9 +1,14 @@
 import json
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Union
+
+import requests
+
 from ...models import Quote, Order, Balance, Holding
-from ...constants import Side
-from ...exceptions import ApiError
+from ...constants import Side, OrderStatus
+from ...exceptions import ApiError, NetworkError, CircuitOpenError
 
 KIS_ORDER_TYPE_MAP = {
     "지정가": "00",
@@ -26,6 +31,19 @@ KIS_ORDER_TYPE_MAP = {
     "중간가FOK": "24",
 }
 
+# 가격을 지정하는 주문 유형 (종목 마스터 기반 사전 가격 검증 대상)
+KIS_PRICED_ORDER_TYPES = {"지정가", "조건부지정가", "IOC지정가", "FOK지정가", "스톱지정가"}
+
+# 관심종목(멀티종목) 시세조회 1회 최대 종목 수
+KIS_MULTI_PRICE_MAX = 30
+
+# TR 자체를 지원하지 않는다는 응답 코드 (모의투자 미지원 TR 등)
+# - 이 코드가 오면 이후 묶음 조회를 시도하지 않고, 그 외 오류는 해당 묶음만 단건 조회로 대체합니다.
+KIS_TR_UNSUPPORTED_CODES = {"OPSQ0002"}
+
+# 일괄 조회에서 종목/묶음 단위로 건너뛰는 오류 (CircuitOpenError는 NetworkError의 하위 클래스)
+_BATCH_SKIP_ERRORS = (ApiError, NetworkError, CircuitOpenError, requests.HTTPError)
+
 
 class KisDomesticMixin:
     """국내 주식 매매/조회 기능"""
@@ -48,19 +66,197 @@ class KisDomesticMixin:
 
         output = data["output"]
 
-        return Quote(
+        quote = Quote(
             price=int(output["stck_prpr"]),
             volume=int(output["acml_vol"]),
             change=float(output["prdy_ctrt"]),
         )
 
+        # [추가] 시세 수신 콜백 (기록기, 캐시 등)
+        for listener in getattr(self, "quote_listeners", ()):
+            listener(symbol, quote)
+
+        return quote
+
+    def _fetch_price_chunk(self, symbols: List[str]) -> Dict[str, Quote]:
+        """(Internal) 관심종목(멀티종목) 시세조회 1회 호출 (최대 30종목)"""
+        url = f"{self.base_url}/uapi/domestic-stock/v1/quotations/intstock-multprice"
+        headers = self._get_headers(tr_id="FHKST11300006")
+        params = {}
+        for i, symbol in enumerate(symbols, 1):
+            params[f"FID_COND_MRKT_DIV_CODE_{i}"] = "J"
+            params[f"FID_INPUT_ISCD_{i}"] = symbol
+
+        resp = self.request("GET", url, headers=headers, params=params)
+        resp.raise_for_status()
+        data = resp.json()
+
+        if data["rt_cd"] != "0":
+            raise ApiError(message=data["msg1"], code=data.get("msg_cd"))
+
+        quotes = {}
+        for item in data.get("output") or []:
+            symbol = item.get("inter_shrn_iscd", "")
+            # 조회되지 않은 종목은 가격이 비어서 내려옵니다. (호출부에서 단건 조회로 대체)
+            if not symbol or not item.get("inter2_prpr"):
+                continue
+            quotes[symbol] = Quote(
+                price=int(item["inter2_prpr"]),
+                volume=int(item.get("acml_vol") or 0),
+                change=float(item.get("prdy_ctrt") or 0),
+            )
+        return quotes
+
+    def fetch_prices(
+        self, symbols: Iterable[str], max_workers: int = 4, columnar: bool = False
+    ) -> Union[Dict[str, Quote], Dict[str, list]]:
+        """
+        [추가] 국내주식 현재가 일괄 조회
+        - 관심종목(멀티종목) 시세조회 TR로 30종목씩 묶어 호출합니다. (300종목 = 10회)
+        - 묶음 호출은 계좌 RateLimiter를 공유하며 병렬로 전송됩니다.
+        - 묶음 조회에서 빠지거나 실패한 묶음의 종목은 단건 조회로 대체합니다.
+          (묶음 TR을 지원하지 않는 환경(모의투자 등)이면 이후 묶음 조회를 생략)
+        - 조회에 실패한 종목은 결과에서 제외됩니다. (로그로 기록)
+
+        :param columnar: True면 {'symbol': [...], 'price': [...], 'volume': [...], 'change': [...]} 형태로 반환
+        :return: {종목코드: Quote}
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {} if not columnar else {"symbol": [], "price": [], "volume": [], "change": []}
+
+        # 토큰 발급이 스레드마다 중복되지 않도록 미리 연결
+        if not self.access_token:
+            self.connect()
+
+        chunks = [
+            symbols[i: i + KIS_MULTI_PRICE_MAX] for i in range(0, len(symbols), KIS_MULTI_PRICE_MAX)
+        ]
+        quotes: Dict[str, Quote] = {}
+
+        def _fetch_chunk(chunk: List[str]) -> Dict[str, Quote]:
+            if not getattr(self, "_multi_price_supported", True):
+                return {}
+            try:
+                return self._fetch_price_chunk(chunk)
+            except _BATCH_SKIP_ERRORS as e:
+                # 해당 묶음만 단건 조회로 대체 (묶음 TR 자체가 거부된 경우에만 이후 시도 중단)
+                self.logger.warning("멀티종목 시세조회 실패, 단건 조회로 대체합니다: %s", e)
+                if isinstance(e, ApiError) and e.code in KIS_TR_UNSUPPORTED_CODES:
+                    self._multi_price_supported = False
+                return {}
+
+        def _fetch_one(symbol: str):
+            try:
+                return symbol, self._fetch_price(symbol)
+            except _BATCH_SKIP_ERRORS as e:
+                self.logger.warning("시세 조회 실패 (%s): %s", symbol, e)
+                return symbol, None
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            for result in pool.map(_fetch_chunk, chunks):
+                quotes.update(result)
+
+            # 묶음 결과도 단건 조회와 동일하게 시세 수신 콜백 호출
+            listeners = getattr(self, "quote_listeners", ())
+            if listeners:
+                for symbol, quote in quotes.items():
+                    for listener in listeners:
+                        listener(symbol, quote)
+
+            missing = [s for s in symbols if s not in quotes]
+            for symbol, quote in pool.map(_fetch_one, missing):
+                if quote is not None:
+                    quotes[symbol] = quote
+
+        if not columnar:
+            return {s: quotes[s] for s in symbols if s in quotes}
+
+        found = [s for s in symbols if s in quotes]
+        return {
+            "symbol": found,
+            "price": [quotes[s].price for s in found],
+            "volume": [quotes[s].volume for s in found],
+            "change": [quotes[s].change for s in found],
+        }
+
+    def fetch_daily_chart(
+        self, symbol: str, start: str, end: str, period: str = "D", adjusted: bool = True
+    ) -> List[dict]:
+        """
+        [추가] 국내주식 기간별 시세 (일/주/월/년봉)
+        - 1회 최대 100건이므로 조회 종료일을 앞당기며 반복 조회합니다.
+        :param start: 조회 시작일 (YYYYMMDD)
+        :param end: 조회 종료일 (YYYYMMDD)
+        :param period: 'D'(일), 'W'(주), 'M'(월), 'Y'(년)
+        :param adjusted: 수정주가 적용 여부
+        :return: 날짜 오름차순 [{'date', 'open', 'high', 'low', 'close', 'volume', 'amount'}, ...]
+        """
+        if not self.access_token:
+            self.connect()
+
+        url = f"{self.base_url}/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
+        tr_id = "FHKST03010100"
+
+        rows = []
+        while True:
+            headers = self._get_headers(tr_id=tr_id)
+            params = {
+                "FID_COND_MRKT_DIV_CODE": "J",
+                "FID_INPUT_ISCD": symbol,
+                "FID_INPUT_DATE_1": start,
+                "FID_INPUT_DATE_2": end,
+                "FID_PERIOD_DIV_CODE": period,
+                "FID_ORG_ADJ_PRC": "0" if adjusted else "1",
+            }
+
+            resp = self.request("GET", url, headers=headers, params=params)
+            resp.raise_for_status()
+            data = resp.json()
+
+            if data["rt_cd"] != "0":
+                raise ApiError(message=data["msg1"], code=data.get("msg_cd"))
+
+            # 최신순 응답 (빈 행은 제외)
+            items = [item for item in data.get("output2") or [] if item.get("stck_bsop_date")]
+            for item in items:
+                rows.append({
+                    "date": item["stck_bsop_date"],
+                    "open": int(item["stck_oprc"]),
+                    "high": int(item["stck_hgpr"]),
+                    "low": int(item["stck_lwpr"]),
+                    "close": int(item["stck_clpr"]),
+                    "volume": int(item["acml_vol"]),
+                    "amount": int(item.get("acml_tr_pbmn") or 0),
+                })
+
+            if len(items) < 100:
+                break
+
+            # 가장 오래된 날짜 하루 전까지로 종료일을 당겨 다음 구간 조회
+            oldest = datetime.strptime(items[-1]["stck_bsop_date"], "%Y%m%d")
+            end = (oldest - timedelta(days=1)).strftime("%Y%m%d")
+            if end < start:
+                break
+
+        rows.reverse()
+        return rows
+
     def order(self, symbol: str, side: Side, qty: int, price: int = 0, order_type: str = "지정가") -> Order:
         """주문 전송"""
         dvsn_code = KIS_ORDER_TYPE_MAP.get(order_type, "00")
 
+        # [변경] %-스타일 지연 포맷팅 (로그가 실제로 기록될 때만 문자열 생성)
         self.logger.info(
-            f"주문 요청: {side.value} {symbol} {qty}주 @ {price}원 (유형: {order_type}/{dvsn_code})"
+            "주문 요청: %s %s %d주 @ %s원 (유형: %s/%s)",
+            side.value, symbol, qty, price, order_type, dvsn_code,
+            extra={"symbol": symbol},
         )
+
+        # [추가] 종목 마스터가 설정되어 있으면 호가단위를 로컬에서 먼저 검증 (API 호출 절약)
+        master = getattr(self, "master", None)
+        if master is not None and order_type in KIS_PRICED_ORDER_TYPES:
+            master.validate_price(symbol, price)
         
         if not self.access_token:
             self.connect()
@@ -81,16 +277,21 @@ class KisDomesticMixin:
             "ORD_UNPR": str(price),
         }
 
+        started = time.perf_counter()
         headers = self._get_headers(tr_id=tr_id, data=order_data)
         resp = self.request("POST", url, headers=headers, data=json.dumps(order_data))
         resp.raise_for_status()
         data = resp.json()
+        latency_ms = (time.perf_counter() - started) * 1000
 
         if data["rt_cd"] != "0":
-            self.logger.error(f"주문 실패: {data['msg1']}")
+            self.logger.error(
+                "주문 실패: %s", data["msg1"],
+                extra={"tr_id": tr_id, "symbol": symbol, "latency_ms": latency_ms},
+            )
             raise ApiError(message=data["msg1"], code=data.get("msg_cd"))
 
-        return Order(
+        order = Order(
             order_id=data["output"]["ODNO"],
             symbol=symbol,
             side=side,
@@ -99,19 +300,53 @@ class KisDomesticMixin:
             order_type=order_type
         )
 
+        self.logger.debug(
+            "주문 접수: %s (%.1fms)", order.order_id, latency_ms,
+            extra={
+                "tr_id": tr_id,
+                "order_id": order.order_id,
+                "symbol": symbol,
+                "latency_ms": latency_ms,
+            },
+        )
+
+        # [추가] 로컬 주문 추적기에 기록
+        tracker = getattr(self, "order_tracker", None)
+        if tracker is not None:
+            tracker.record_order(
+                order, org_no=data["output"].get("KRX_FWDG_ORD_ORGNO", "")
+            )
+        # [추가] 주문이 나갔으므로 잔고 스냅샷 무효화
+        self._invalidate_account()
+
+        return order
+
+    def _invalidate_account(self):
+        snapshot = getattr(self, "account_snapshot", None)
+        if snapshot is not None:
+            snapshot.invalidate()
+
     def cancel(self, symbol: str) -> List[str]:
         """
         특정 종목의 미체결 주문을 조회하여 모두 취소합니다.
         (_cancel_one 메서드 로직을 여기에 통합했습니다.)
         """
-        self.logger.info(f"[{symbol}] 종목의 미체결 주문 전량 취소 시도...")
+        self.logger.info("[%s] 종목의 미체결 주문 전량 취소 시도...", symbol)
         
         # 1. 미체결 내역 조회
-        open_orders = self._fetch_open_orders()
-        target_orders = [o for o in open_orders if o['pdno'] == symbol]
+        # [추가] 주문 추적기가 최근(max_sync_age 이내) REST와 대사된 상태라면 로컬 상태를 사용 (API 호출 생략)
+        tracker = getattr(self, "order_tracker", None)
+        if tracker is not None and tracker.synced:
+            target_orders = [
+                {"odno": o.order_id, "pdno": o.symbol, "psbl_qty": str(o.remaining)}
+                for o in tracker.open_orders(symbol)
+            ]
+        else:
+            open_orders = self._fetch_open_orders()
+            target_orders = [o for o in open_orders if o['pdno'] == symbol]
         
         if not target_orders:
-            self.logger.info(f"[{symbol}] 취소할 미체결 주문이 없습니다.")
+            self.logger.info("[%s] 취소할 미체결 주문이 없습니다.", symbol)
             return []
 
         cancelled_ids = []
@@ -147,16 +382,188 @@ class KisDomesticMixin:
                     raise ApiError(f"취소 실패: {data['msg1']}")
 
                 cancelled_ids.append(orgn_odno)
-                self.logger.info(f"주문취소 완료: 원주문번호 {orgn_odno}, 수량 {qty}")
+                if tracker is not None:
+                    tracker.record_cancel(orgn_odno)
+                self.logger.info(
+                    "주문취소 완료: 원주문번호 %s, 수량 %d", orgn_odno, qty,
+                    extra={"tr_id": tr_id, "order_id": orgn_odno, "symbol": symbol},
+                )
                 
                 # 연속 호출 시 API 제한 고려 (안전장치)
                 time.sleep(0.05) 
 
             except ApiError as e:
-                self.logger.error(f"주문취소 실패 ({orgn_odno}): {e}")
+                self.logger.error(
+                    "주문취소 실패 (%s): %s", orgn_odno, e,
+                    extra={"tr_id": tr_id, "order_id": orgn_odno, "symbol": symbol},
+                )
+
+        if cancelled_ids:
+            self._invalidate_account()
 
         return cancelled_ids
 
+    def _find_open_orders(self, order_ids: Iterable[str]) -> Dict[str, dict]:
+        """(Internal) 정정 대상 원주문 정보 (추적기 우선, 없으면 미체결 조회 1회)"""
+        order_ids = list(order_ids)
+        found = {}
+
+        tracker = getattr(self, "order_tracker", None)
+        if tracker is not None:
+            for order_id in order_ids:
+                state = tracker.get(order_id)
+                if state is not None and state.status == OrderStatus.OPEN:
+                    found[order_id] = {
+                        "odno": state.order_id,
+                        "pdno": state.symbol,
+                        "psbl_qty": str(state.remaining),
+                        "ord_unpr": str(state.price),
+                        "sll_buy_dvsn_cd": "01" if state.side == Side.SELL else "02",
+                        "ord_gno_brno": state.org_no,
+                    }
+
+        missing = set(order_ids) - set(found)
+        if missing and not (tracker is not None and tracker.synced):
+            for item in self._fetch_open_orders():
+                if item["odno"] in missing:
+                    found[item["odno"]] = item
+        return found
+
+    def _modify_one(self, target: dict, price: int = None, qty: int = None, order_type: str = "지정가") -> Order:
+        """(Internal) 원주문 1건 정정 (order-rvsecncl, RVSE_CNCL_DVSN_CD=01)"""
+        orgn_odno = target["odno"]
+        symbol = target["pdno"]
+        remaining = int(target["psbl_qty"])
+        new_price = int(float(target.get("ord_unpr") or 0)) if price is None else price
+        # 수량 미지정 또는 잔량 이상이면 잔량 전부 정정
+        qty_all = qty is None or qty >= remaining
+        new_qty = remaining if qty_all else qty
+
+        master = getattr(self, "master", None)
+        if master is not None and order_type in KIS_PRICED_ORDER_TYPES:
+            master.validate_price(symbol, new_price)
+
+        url = f"{self.base_url}/uapi/domestic-stock/v1/trading/order-rvsecncl"
+        tr_id = "TTTC0013U" if self.is_real else "VTTC0013U"
+        order_data = {
+            "CANO": self.acc_no_prefix,
+            "ACNT_PRDT_CD": self.acc_no_suffix,
+            "KRX_FWDG_ORD_ORGNO": target.get("ord_gno_brno", ""),
+            "ORGN_ODNO": orgn_odno,
+            "ORD_DVSN": KIS_ORDER_TYPE_MAP.get(order_type, "00"),
+            "RVSE_CNCL_DVSN_CD": "01",  # 01: 정정
+            "ORD_QTY": str(new_qty),
+            "ORD_UNPR": str(new_price),
+            "QTY_ALL_ORD_YN": "Y" if qty_all else "N",
+        }
+
+        started = time.perf_counter()
+        headers = self._get_headers(tr_id=tr_id, data=order_data)
+        resp = self.request("POST", url, headers=headers, data=json.dumps(order_data))
+        resp.raise_for_status()
+        data = resp.json()
+        latency_ms = (time.perf_counter() - started) * 1000
+
+        if data["rt_cd"] != "0":
+            raise ApiError(message=data["msg1"], code=data.get("msg_cd"))
+
+        output = data["output"]
+        order = Order(
+            order_id=output["ODNO"],
+            symbol=symbol,
+            side=Side.SELL if target.get("sll_buy_dvsn_cd") == "01" else Side.BUY,
+            qty=new_qty,
+            price=new_price,
+            order_type=order_type,
+        )
+
+        tracker = getattr(self, "order_tracker", None)
+        if tracker is not None:
+            tracker.record_replace(
+                orgn_odno, order, org_no=output.get("KRX_FWDG_ORD_ORGNO", ""), partial=not qty_all
+            )
+        self.logger.info(
+            "주문정정 완료: 원주문번호 %s -> %s, %d주 @ %s원 (%.1fms)",
+            orgn_odno, order.order_id, new_qty, new_price, latency_ms,
+            extra={
+                "tr_id": tr_id,
+                "order_id": order.order_id,
+                "symbol": symbol,
+                "latency_ms": latency_ms,
+            },
+        )
+        return order
+
+    def modify(self, order_id: str, price: int = None, qty: int = None, order_type: str = "지정가") -> Order:
+        """
+        미체결 주문 정정 (취소 후 재주문 없이 한 번의 호출로 가격/수량 변경)
+        :param price: 정정 가격 (생략 시 원주문 가격 유지)
+        :param qty: 정정 수량 (생략 시 미체결 잔량 전부)
+        :return: 정정 주문 (새 주문번호)
+        """
+        if price is None and qty is None:
+            raise ValueError("정정할 가격 또는 수량을 지정해야 합니다.")
+        if not self.access_token:
+            self.connect()
+
+        target = self._find_open_orders([order_id]).get(order_id)
+        if target is None:
+            raise ApiError(message=f"정정 가능한 미체결 주문이 없습니다: {order_id}")
+
+        order = self._modify_one(target, price, qty, order_type)
+        self._invalidate_account()
+        return order
+
+    def modify_many(
+        self,
+        changes: Union[Dict[str, int], Iterable[tuple]],
+        order_type: str = "지정가",
+        max_workers: int = 1,
+    ) -> Dict[str, Order]:
+        """
+        여러 미체결 주문 일괄 정정 (유량 제한에 맞춰 순차 전송)
+        - 원주문 정보는 주문 추적기에서 찾고, 없으면 미체결 조회를 한 번만 수행합니다.
+        - 실패한 주문은 로그만 남기고 건너뜁니다. (API/통신/서킷 차단/기한 초과 오류)
+        :param changes: {원주문번호: 정정가격} 또는 [(원주문번호, 정정가격[, 정정수량]), ...]
+        :param max_workers: 동시 전송 수 (1이면 순차, 실제 전송 속도는 계좌 RateLimiter가 결정)
+        :return: {원주문번호: 정정 주문}
+        """
+        items = list(changes.items()) if isinstance(changes, dict) else [tuple(c) for c in changes]
+        if not items:
+            return {}
+        if not self.access_token:
+            self.connect()
+
+        targets = self._find_open_orders(item[0] for item in items)
+
+        def _modify(item) -> tuple:
+            order_id, price = item[0], item[1]
+            qty = item[2] if len(item) > 2 else None
+            target = targets.get(order_id)
+            if target is None:
+                self.logger.warning("정정 가능한 미체결 주문이 없습니다: %s", order_id)
+                return order_id, None
+            try:
+                return order_id, self._modify_one(target, price, qty, order_type)
+            except _BATCH_SKIP_ERRORS as e:
+                self.logger.error(
+                    "주문정정 실패 (%s): %s", order_id, e,
+                    extra={"order_id": order_id, "symbol": target["pdno"]},
+                )
+                return order_id, None
+
+        try:
+            if max_workers > 1 and len(items) > 1:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+                    results = list(pool.map(_modify, items))
+            else:
+                results = [_modify(item) for item in items]
+        finally:
+            # 예상하지 못한 오류로 중단되더라도 이미 접수된 정정은 잔고에 반영되도록 무효화
+            self._invalidate_account()
+
+        return {order_id: order for order_id, order in results if order is not None}
+
     def _fetch_open_orders(self) -> List[dict]:
         """(Internal) 주식 정정/취소 가능 주문 조회 (미체결 내역)"""
         if not self.access_token:
@@ -193,7 +600,11 @@ class KisDomesticMixin:
                 orders.append({
                     "odno": item["odno"],
                     "pdno": item["pdno"],
-                    "psbl_qty": item["psbl_qty"]
+                    "psbl_qty": item["psbl_qty"],
+                    "ord_qty": item.get("ord_qty", ""),
+                    "ord_unpr": item.get("ord_unpr", ""),
+                    "sll_buy_dvsn_cd": item.get("sll_buy_dvsn_cd", ""),
+                    "ord_gno_brno": item.get("ord_gno_brno", ""),
                 })
 
             tr_cont = resp.headers.get("tr_cont", "M")
@@ -255,6 +666,7 @@ class KisDomesticMixin:
                         name=item["prdt_name"],
                         qty=int(item["hldg_qty"]),
                         profit_rate=float(item["evlu_pfls_rt"]),
+                        avg_price=float(item.get("pchs_avg_pric") or 0),
                     )
                 )
 
@@ -0,0 +1,274 @@
+# src/systock/brokers/kis/fastlane.py
+from __future__ import annotations
+
+import json
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ...models import Order
+from ...constants import Side
+from ...exceptions import ApiError, NetworkError, ValidationError, DeadlineExceededError
+from ...utils import LatencyStats
+from .domestic import KIS_ORDER_TYPE_MAP, KIS_PRICED_ORDER_TYPES
+
+if TYPE_CHECKING:
+    from .client import KisBroker
+
+
+@dataclass
+class OrderTiming:
+    """주문 1건의 단계별 소요 시간 (마이크로초)"""
+
+    check_us: float  # 사전 검증
+    build_us: float  # 헤더/본문 생성
+    limiter_us: float  # RateLimiter 대기
+    send_us: float  # 전송 ~ 응답 수신
+    parse_us: float  # 응답 파싱
+    total_us: float
+
+
+class KisOrderFastLane:
+    """
+    저지연 주문 전용 경로 (opt-in)
+    - 계좌별 URL, TR ID, 헤더, 본문 공통부를 미리 만들어 두고 주문마다 값만 채웁니다.
+    - 주문 전용 세션을 두고 주기적으로 keep-alive 요청을 보내 연결을 항상 열어 둡니다.
+    - 사전 검증(수량/금액 한도, 호가단위)은 API 호출 없이 로컬에서 수행합니다.
+    - 단계별(check, build, limiter, send, parse) 소요 시간을 기록합니다.
+
+    사용 예:
+        lane = broker.fast_lane(max_notional=50_000_000)
+        order = lane.order("005930", Side.BUY, qty=10, price=60000)
+        print(lane.last_timing, lane.stats())
+    """
+
+    def __init__(
+        self,
+        broker: KisBroker,
+        keepalive_interval: float = 30.0,
+        use_hashkey: bool = False,
+        max_qty: Optional[int] = None,
+        max_notional: Optional[int] = None,
+        timeout: float = 5.0,
+    ):
+        """
+        :param keepalive_interval: 연결 유지 요청 주기 (초, 0이면 사용 안 함, 스레드는 close()로 종료)
+        :param use_hashkey: HashKey 헤더 사용 여부 (KIS 주문 API에서 선택 항목, 사용 시 왕복 1회 추가)
+        :param max_qty: 1회 주문 최대 수량 (초과 시 ValidationError)
+        :param max_notional: 1회 주문 최대 금액 (초과 시 ValidationError)
+        :param timeout: 주문 기한 (초, 유량 제한 대기 시간 포함)
+        """
+        self.broker = broker
+        self.use_hashkey = use_hashkey
+        self.max_qty = max_qty
+        self.max_notional = max_notional
+        self.timeout = timeout
+        self.logger = logging.getLogger("systock.kis.fastlane")
+
+        self.url = f"{broker.base_url}/uapi/domestic-stock/v1/trading/order-cash"
+        prefix = "TTTC" if broker.is_real else "VTTC"
+        self._tr_ids = {Side.BUY: f"{prefix}0802U", Side.SELL: f"{prefix}0801U"}
+        self._headers: Dict[Side, Dict[str, str]] = {}
+        self._headers_token: Optional[str] = None
+        # 일반 주문 경로와 같은 order-cash 서킷 브레이커 공유
+        self._breaker = broker._breaker(self.url)
+
+        # 본문 공통부 (계좌 정보)
+        self._cano = broker.acc_no_prefix
+        self._acnt_prdt_cd = broker.acc_no_suffix
+
+        # 주문 전용 세션 (시세 조회 트래픽과 연결 풀 분리)
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+        self.last_timing: Optional[OrderTiming] = None
+        self._stats = {
+            name: LatencyStats()
+            for name in ("check", "build", "limiter", "send", "parse", "total")
+        }
+
+        self._keepalive_stop = threading.Event()
+        self._keepalive_thread: Optional[threading.Thread] = None
+        if keepalive_interval > 0:
+            self._start_keepalive(keepalive_interval)
+
+    # -----------------------------------------------------------
+    # 준비 (템플릿/연결)
+    # -----------------------------------------------------------
+    def _prepare_headers(self):
+        """토큰이 바뀌었을 때만 매도/매수 헤더를 다시 만듭니다."""
+        if not self.broker.access_token:
+            self.broker.connect()
+        token = self.broker.access_token
+        if token == self._headers_token:
+            return
+        self._headers = {
+            side: self.broker._get_headers(tr_id=tr_id)
+            for side, tr_id in self._tr_ids.items()
+        }
+        self._headers_token = token
+
+    def warm(self):
+        """토큰/헤더 준비 및 주문 서버 연결 수립 (TCP/TLS 핸드셰이크를 미리 수행)"""
+        self._prepare_headers()
+        try:
+            self.session.head(self.broker.base_url, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            self.logger.debug("연결 예열 실패: %s", e)
+
+    def _start_keepalive(self, interval: float):
+        def _loop():
+            while not self._keepalive_stop.wait(interval):
+                try:
+                    self.session.head(self.broker.base_url, timeout=self.timeout)
+                except requests.exceptions.RequestException as e:
+                    self.logger.debug("keep-alive 실패: %s", e)
+
+        self._keepalive_thread = threading.Thread(
+            target=_loop, name="systock-order-keepalive", daemon=True
+        )
+        self._keepalive_thread.start()
+
+    def close(self):
+        """keep-alive 스레드 중지 및 주문 전용 세션 종료 (KisBroker.close()에서 호출)"""
+        self._keepalive_stop.set()
+        if self._keepalive_thread:
+            self._keepalive_thread.join(timeout=5)
+            self._keepalive_thread = None
+        self.session.close()
+
+    # -----------------------------------------------------------
+    # 사전 검증
+    # -----------------------------------------------------------
+    def check(self, symbol: str, side: Side, qty: int, price: int, order_type: str):
+        """로컬 사전 검증 (위반 시 ValidationError)"""
+        if qty <= 0:
+            raise ValidationError(f"주문수량 오류: {qty}")
+        if order_type not in KIS_ORDER_TYPE_MAP:
+            raise ValidationError(f"지원하지 않는 주문 유형입니다: {order_type}")
+        if self.max_qty is not None and qty > self.max_qty:
+            raise ValidationError(f"1회 최대 주문수량 초과: {qty} > {self.max_qty}")
+
+        if order_type in KIS_PRICED_ORDER_TYPES:
+            if self.max_notional is not None and qty * price > self.max_notional:
+                raise ValidationError(
+                    f"1회 최대 주문금액 초과: {qty * price} > {self.max_notional}"
+                )
+            master = self.broker.master
+            if master is not None:
+                master.validate_price(symbol, price)
+
+    # -----------------------------------------------------------
+    # 주문
+    # -----------------------------------------------------------
+    def order(
+        self, symbol: str, side: Side, qty: int, price: int = 0, order_type: str = "지정가"
+    ) -> Order:
+        t0 = time.perf_counter()
+        self.check(symbol, side, qty, price, order_type)
+
+        t1 = time.perf_counter()
+        self._prepare_headers()
+        order_data = {
+            "CANO": self._cano,
+            "ACNT_PRDT_CD": self._acnt_prdt_cd,
+            "PDNO": symbol,
+            "ORD_DVSN": KIS_ORDER_TYPE_MAP[order_type],
+            "ORD_QTY": str(qty),
+            "ORD_UNPR": str(price),
+        }
+        headers = self._headers[side]
+        if self.use_hashkey:
+            headers = dict(headers, hashkey=self.broker._generate_hash(order_data))
+        body = json.dumps(order_data)
+
+        t2 = time.perf_counter()
+        self._breaker.allow()
+        # 기한(timeout, 검증/헤더 준비 시간 포함) 안에 유량 제한을 통과할 수 없으면 보내지 않음
+        remaining = self.timeout - (t2 - t0)
+        if remaining <= 0 or not self.broker.limiter.wait(timeout=remaining):
+            self._breaker.release()
+            raise DeadlineExceededError("요청 기한 초과 (유량 제한 대기): order-cash")
+
+        t3 = time.perf_counter()
+        remaining = max(0.001, self.timeout - (t3 - t0))
+        try:
+            resp = self.session.post(self.url, headers=headers, data=body, timeout=remaining)
+        except requests.exceptions.Timeout as e:
+            self._breaker.record(time.perf_counter() - t3, failed=True)
+            raise DeadlineExceededError("요청 기한 초과 (응답 대기): order-cash") from e
+        except requests.exceptions.RequestException as e:
+            self._breaker.record(time.perf_counter() - t3, failed=True)
+            raise NetworkError(f"네트워크 요청 실패: {e}") from e
+
+        t4 = time.perf_counter()
+        self._breaker.record(t4 - t3, failed=self.broker._is_server_failure(resp))
+        if self.broker._is_throttled(resp):
+            self.broker.limiter.on_throttle()
+        else:
+            self.broker.limiter.on_success()
+
+        resp.raise_for_status()
+        data = resp.json()
+        if data["rt_cd"] != "0":
+            self.logger.error(
+                "주문 실패: %s", data["msg1"],
+                extra={"tr_id": self._tr_ids[side], "symbol": symbol},
+            )
+            raise ApiError(message=data["msg1"], code=data.get("msg_cd"))
+
+        output = data["output"]
+        order = Order(
+            order_id=output["ODNO"],
+            symbol=symbol,
+            side=side,
+            qty=qty,
+            price=price,
+            order_type=order_type,
+        )
+        t5 = time.perf_counter()
+
+        self._record(t0, t1, t2, t3, t4, t5)
+        self.broker.order_tracker.record_order(
+            order, org_no=output.get("KRX_FWDG_ORD_ORGNO", "")
+        )
+        self.broker.account_snapshot.invalidate()
+        self.logger.debug(
+            "주문 접수: %s (%.1fms)", order.order_id, (t5 - t0) * 1000,
+            extra={
+                "tr_id": self._tr_ids[side],
+                "order_id": order.order_id,
+                "symbol": symbol,
+                "latency_ms": (t5 - t0) * 1000,
+            },
+        )
+        return order
+
+    def _record(self, t0, t1, t2, t3, t4, t5):
+        timing = OrderTiming(
+            check_us=(t1 - t0) * 1e6,
+            build_us=(t2 - t1) * 1e6,
+            limiter_us=(t3 - t2) * 1e6,
+            send_us=(t4 - t3) * 1e6,
+            parse_us=(t5 - t4) * 1e6,
+            total_us=(t5 - t0) * 1e6,
+        )
+        self.last_timing = timing
+        for name, start, end in (
+            ("check", t0, t1),
+            ("build", t1, t2),
+            ("limiter", t2, t3),
+            ("send", t3, t4),
+            ("parse", t4, t5),
+            ("total", t0, t5),
+        ):
+            self._stats[name].add(end - start)
+
+    def stats(self) -> Dict[str, dict]:
+        """단계별 지연 통계 (ms)"""
+        return {name: s.summary() for name, s in self._stats.items()}
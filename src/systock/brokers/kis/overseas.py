@@ -1,9 +1,313 @@
 # src/systock/brokers/kis/overseas.py
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Tuple, Union
+
+import requests
+
+from ...models import Quote, Order, Balance, Holding
+from ...constants import Side
+from ...exceptions import ApiError, NetworkError, CircuitOpenError
+
+# 시세 조회용 거래소 코드(EXCD) -> 주문/잔고용 거래소 코드(OVRS_EXCG_CD)
+KIS_OVERSEAS_EXCHANGE_MAP = {
+    "NAS": "NASD",  # 나스닥
+    "NYS": "NYSE",  # 뉴욕
+    "AMS": "AMEX",  # 아멕스
+    "HKS": "SEHK",  # 홍콩
+    "TSE": "TKSE",  # 도쿄
+}
+
+# 거래소별 거래 통화
+KIS_OVERSEAS_CURRENCY_MAP = {
+    "NAS": "USD",
+    "NYS": "USD",
+    "AMS": "USD",
+    "HKS": "HKD",
+    "TSE": "JPY",
+}
+
+# 거래소별 주문 TR ID (매수, 매도) - 실전 기준
+# 모의투자는 앞자리 'T'가 'V'로 바뀌며, 미국 매도만 번호가 다릅니다.
+KIS_OVERSEAS_ORDER_TR_MAP = {
+    "USD": ("TTTT1002U", "TTTT1006U"),
+    "HKD": ("TTTS1002U", "TTTS1001U"),
+    "JPY": ("TTTS0308U", "TTTS0307U"),
+}
+KIS_OVERSEAS_ORDER_TR_MAP_VIRTUAL = {
+    "USD": ("VTTT1002U", "VTTT1001U"),
+    "HKD": ("VTTS1002U", "VTTS1001U"),
+    "JPY": ("VTTS0308U", "VTTS0307U"),
+}
 
 
 class KisOverseasMixin:
-    """해외 주식 기능 (미국, 홍콩 등)"""
+    """해외 주식 기능 (미국, 홍콩, 일본)"""
+
+    # 환율 캐시 유효 시간 (초)
+    FX_CACHE_TTL = 60.0
+
+    # [핵심] 환율은 계좌와 무관하므로 모든 인스턴스가 공유
+    # 구조: {'USD': (환율, 조회시각), ...}
+    _fx_cache: Dict[str, Tuple[float, float]] = {}
+    _fx_lock = threading.Lock()
+
+    @staticmethod
+    def _check_market(market_code: str) -> str:
+        market_code = market_code.upper()
+        if market_code not in KIS_OVERSEAS_EXCHANGE_MAP:
+            raise ValueError(
+                f"지원하지 않는 해외 거래소입니다: {market_code} "
+                f"(지원: {', '.join(KIS_OVERSEAS_EXCHANGE_MAP)})"
+            )
+        return market_code
+
+    def fetch_overseas_price(self, symbol: str, market_code: str = "NAS") -> Quote:
+        """
+        해외 주식 현재가 조회
+        :param market_code: 'NAS', 'NYS', 'AMS', 'HKS', 'TSE'
+        :return: Quote (price는 현지 통화 기준 float)
+        """
+        market_code = self._check_market(market_code)
+
+        if not self.access_token:
+            self.connect()
+
+        url = f"{self.base_url}/uapi/overseas-price/v1/quotations/price"
+        headers = self._get_headers(tr_id="HHDFS00000300")
+        params = {"AUTH": "", "EXCD": market_code, "SYMB": symbol}
+
+        resp = self.request("GET", url, headers=headers, params=params)
+        resp.raise_for_status()
+        data = resp.json()
+
+        if data["rt_cd"] != "0":
+            raise ApiError(message=data["msg1"], code=data.get("msg_cd"))
+
+        output = data["output"]
+
+        # 장 시작 전 등 체결이 없으면 빈 문자열이 내려옵니다.
+        quote = Quote(
+            price=float(output["last"] or 0),
+            volume=int(output["tvol"] or 0),
+            change=float(output["rate"] or 0),
+        )
+
+        for listener in getattr(self, "quote_listeners", ()):
+            listener(symbol, quote)
+
+        return quote
+
+    def fetch_overseas_prices(
+        self,
+        symbols: Iterable[Union[str, Tuple[str, str]]],
+        market_code: str = "NAS",
+        max_workers: int = 8,
+    ) -> Dict[Tuple[str, str], Quote]:
+        """
+        해외 주식 현재가 일괄 조회
+        - 계좌 단위 RateLimiter를 공유하므로 동시 실행해도 유량 제한을 넘지 않습니다.
+        - 조회에 실패한 종목은 결과에서 제외됩니다. (API/통신/서킷 차단 오류 모두 종목 단위로 건너뛰고 로그로 기록)
+
+        :param symbols: 종목코드 목록. (종목코드, 거래소) 튜플을 섞어 여러 거래소를 한 번에 조회 가능
+        :param market_code: 거래소가 지정되지 않은 종목에 적용할 기본 거래소
+        :return: {(거래소, 종목코드): Quote} (거래소가 달라도 종목코드가 같을 수 있으므로 함께 키로 사용)
+        """
+        targets: List[Tuple[str, str]] = [
+            (s, market_code.upper()) if isinstance(s, str) else (s[0], s[1].upper()) for s in symbols
+        ]
+        if not targets:
+            return {}
+
+        # 토큰 발급이 스레드마다 중복되지 않도록 미리 연결
+        if not self.access_token:
+            self.connect()
+
+        def _fetch(target: Tuple[str, str]):
+            symbol, market = target
+            try:
+                return (market, symbol), self.fetch_overseas_price(symbol, market)
+            except (
+                ApiError, ValueError, NetworkError, CircuitOpenError, requests.HTTPError
+            ) as e:
+                self.logger.warning("해외 시세 조회 실패 (%s:%s): %s", market, symbol, e)
+                return (market, symbol), None
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            results = pool.map(_fetch, dict.fromkeys(targets))
+
+        return {key: quote for key, quote in results if quote is not None}
+
+    def get_fx_rate(self, market_code: str = "NAS", symbol: str = None) -> float:
+        """
+        원화 환산용 환율 조회 (FX_CACHE_TTL 동안 캐싱)
+        - 현재가 상세(price-detail) 응답의 당일환율(t_rate)을 사용합니다.
+        :param symbol: 환율 조회에 사용할 기준 종목 (생략 시 거래소별 대표 종목)
+        """
+        market_code = self._check_market(market_code)
+        currency = KIS_OVERSEAS_CURRENCY_MAP[market_code]
+
+        now = time.time()
+        with KisOverseasMixin._fx_lock:
+            cached = KisOverseasMixin._fx_cache.get(currency)
+            if cached and now - cached[1] < self.FX_CACHE_TTL:
+                return cached[0]
+
+        if not self.access_token:
+            self.connect()
+
+        default_symbols = {"USD": "AAPL", "HKD": "00700", "JPY": "7203"}
+        ref_market = {"USD": "NAS", "HKD": "HKS", "JPY": "TSE"}[currency]
+
+        url = f"{self.base_url}/uapi/overseas-price/v1/quotations/price-detail"
+        headers = self._get_headers(tr_id="HHDFS76200200")
+        params = {
+            "AUTH": "",
+            "EXCD": market_code if symbol else ref_market,
+            "SYMB": symbol or default_symbols[currency],
+        }
+
+        resp = self.request("GET", url, headers=headers, params=params)
+        resp.raise_for_status()
+        data = resp.json()
+
+        if data["rt_cd"] != "0":
+            raise ApiError(message=data["msg1"], code=data.get("msg_cd"))
+
+        rate = float(data["output"]["t_rate"])
+
+        with KisOverseasMixin._fx_lock:
+            KisOverseasMixin._fx_cache[currency] = (rate, time.time())
+
+        return rate
+
+    def overseas_order(
+        self,
+        symbol: str,
+        side: Side,
+        qty: int,
+        price: float,
+        market_code: str = "NAS",
+    ) -> Order:
+        """
+        해외 주식 주문 전송 (지정가)
+        - KIS 해외주식 주문은 지정가만 공통 지원하므로 price는 필수입니다.
+        """
+        market_code = self._check_market(market_code)
+        currency = KIS_OVERSEAS_CURRENCY_MAP[market_code]
+
+        self.logger.info(
+            "해외 주문 요청: %s %s:%s %d주 @ %s %s",
+            side.value, market_code, symbol, qty, price, currency,
+            extra={"symbol": symbol},
+        )
+
+        if not self.access_token:
+            self.connect()
+
+        url = f"{self.base_url}/uapi/overseas-stock/v1/trading/order"
+        tr_map = (
+            KIS_OVERSEAS_ORDER_TR_MAP if self.is_real else KIS_OVERSEAS_ORDER_TR_MAP_VIRTUAL
+        )
+        buy_tr, sell_tr = tr_map[currency]
+        tr_id = buy_tr if side == Side.BUY else sell_tr
+
+        order_data = {
+            "CANO": self.acc_no_prefix,
+            "ACNT_PRDT_CD": self.acc_no_suffix,
+            "OVRS_EXCG_CD": KIS_OVERSEAS_EXCHANGE_MAP[market_code],
+            "PDNO": symbol,
+            "ORD_QTY": str(qty),
+            "OVRS_ORD_UNPR": str(price),
+            "SLL_TYPE": "00" if side == Side.SELL else "",
+            "ORD_SVR_DVSN_CD": "0",
+            "ORD_DVSN": "00",  # 지정가
+        }
+
+        headers = self._get_headers(tr_id=tr_id, data=order_data)
+        resp = self.request("POST", url, headers=headers, data=json.dumps(order_data))
+        resp.raise_for_status()
+        data = resp.json()
+
+        if data["rt_cd"] != "0":
+            self.logger.error("해외 주문 실패: %s", data["msg1"], extra={"tr_id": tr_id})
+            raise ApiError(message=data["msg1"], code=data.get("msg_cd"))
+
+        return Order(
+            order_id=data["output"]["ODNO"],
+            symbol=symbol,
+            side=side,
+            qty=qty,
+            price=price,
+            order_type="지정가",
+        )
+
+    def fetch_overseas_balance(self, market_code: str = "NAS") -> Balance:
+        """
+        해외 주식 잔고 조회
+        - total_asset: 보유 종목 외화평가금액을 캐싱된 환율로 환산한 원화 금액
+        - deposit: 외화 예수금은 별도 TR이므로 0으로 반환합니다.
+        """
+        market_code = self._check_market(market_code)
+
+        if not self.access_token:
+            self.connect()
+
+        url = f"{self.base_url}/uapi/overseas-stock/v1/trading/inquire-balance"
+        tr_id = "TTTS3012R" if self.is_real else "VTTS3012R"
+
+        holdings = []
+        eval_amount = 0.0
+        ctx_area_fk200 = ""
+        ctx_area_nk200 = ""
+        tr_cont = None
+
+        while True:
+            headers = self._get_headers(tr_id=tr_id, tr_cont=tr_cont)
+            params = {
+                "CANO": self.acc_no_prefix,
+                "ACNT_PRDT_CD": self.acc_no_suffix,
+                "OVRS_EXCG_CD": KIS_OVERSEAS_EXCHANGE_MAP[market_code],
+                "TR_CRCY_CD": KIS_OVERSEAS_CURRENCY_MAP[market_code],
+                "CTX_AREA_FK200": ctx_area_fk200,
+                "CTX_AREA_NK200": ctx_area_nk200,
+            }
+
+            resp = self.request("GET", url, headers=headers, params=params)
+            resp.raise_for_status()
+            data = resp.json()
+
+            if data["rt_cd"] != "0":
+                raise ApiError(f"해외 잔고 조회 실패: {data['msg1']}")
+
+            for item in data["output1"]:
+                qty = int(float(item["ovrs_cblc_qty"]))
+                if qty == 0:
+                    continue
+
+                eval_amount += float(item.get("ovrs_stck_evlu_amt") or 0)
+                holdings.append(
+                    Holding(
+                        symbol=item["ovrs_pdno"],
+                        name=item["ovrs_item_name"],
+                        qty=qty,
+                        profit_rate=float(item["evlu_pfls_rt"]),
+                        avg_price=float(item.get("pchs_avg_pric") or 0),
+                    )
+                )
+
+            tr_cont = resp.headers.get("tr_cont", "M")
+            if tr_cont in ["N", "D"]:
+                ctx_area_fk200 = data.get("ctx_area_fk200", "")
+                ctx_area_nk200 = data.get("ctx_area_nk200", "")
+                time.sleep(0.1)
+            else:
+                break
+
+        total_asset = 0
+        if eval_amount:
+            total_asset = int(eval_amount * self.get_fx_rate(market_code))
 
-    def fetch_overseas_price(self, symbol: str, market_code: str = "NAS") -> dict:
-        """해외 주식 현재가 (구현 예정)"""
-        pass
+        return Balance(deposit=0, total_asset=total_asset, holdings=holdings)
@@ -1,4 +1,5 @@
 # src/systock/brokers/kis/realtime.py
+from ...order_tracker import parse_execution_notice
 
 
 class KisRealtimeMixin:
@@ -8,3 +9,19 @@ class KisRealtimeMixin:
         """웹소켓 연결 (구현 예정)"""
         self.logger.info("웹소켓 연결 시도...")
         pass
+
+    def handle_execution_notice(self, message: str):
+        """
+        실시간 체결통보(H0STCNI0) 처리
+        - 복호화된 본문('^' 구분)을 파싱하여 주문 추적기에 반영합니다.
+        """
+        tracker = getattr(self, "order_tracker", None)
+        if tracker is None:
+            return
+        notice = parse_execution_notice(message)
+        tracker.apply_notice(notice)
+
+        # [추가] 체결이 발생하면 잔고 스냅샷 무효화
+        snapshot = getattr(self, "account_snapshot", None)
+        if snapshot is not None and notice.get("CNTG_YN") == "2":
+            snapshot.invalidate()
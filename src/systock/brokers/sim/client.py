@@ -0,0 +1,406 @@
+# src/systock/brokers/sim/client.py
+import logging
+from typing import Callable, Dict, List, Optional, Sequence
+
+# [선택] 라이브러리가 설치되어 있을 때만 import
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ...interfaces.broker import Broker
+from ...contexts import StockContext, AccountContext
+from ...models import Quote, Order, Balance, Holding
+from ...constants import Side
+from ...exceptions import ApiError
+
+# 지정가로 처리되는 주문 유형 (그 외는 시장가로 체결)
+SIM_LIMIT_ORDER_TYPES = {"지정가", "조건부지정가", "IOC지정가", "FOK지정가", "스톱지정가"}
+
+
+class SimBroker(Broker):
+    """
+    백테스트용 시뮬레이션 브로커
+    - 과거 봉(OHLCV) 배열을 입력받아 Broker 인터페이스 그대로 주문/조회를 흉내냅니다.
+    - 틱 데이터는 open/high/low/close에 같은 체결가 배열을 넣으면 됩니다.
+    - 미체결 주문은 배열로 관리하며, 매 시점 체결 판정은 벡터 연산으로 한 번에 처리합니다.
+
+    체결 규칙 (다음 봉 기준):
+    - 시장가: 다음 봉 시가 ± 슬리피지
+    - 지정가 매수: 저가 <= 주문가 이면 min(시가, 주문가)
+    - 지정가 매도: 고가 >= 주문가 이면 max(시가, 주문가)
+    """
+
+    def __init__(
+        self,
+        cash: int = 10_000_000,
+        fee_rate: float = 0.00015,
+        tax_rate: float = 0.0018,
+        slippage: float = 0.0,
+    ):
+        """
+        :param cash: 초기 예수금
+        :param fee_rate: 매매 수수료율 (매수/매도 공통)
+        :param tax_rate: 매도 시 거래세율
+        :param slippage: 시장가 체결 슬리피지 비율 (예: 0.001 = 0.1%)
+        """
+        if np is None:
+            raise ImportError("numpy 라이브러리가 필요합니다. (pip install numpy)")
+
+        self.initial_cash = cash
+        self.fee_rate = fee_rate
+        self.tax_rate = tax_rate
+        self.slippage = slippage
+        self.logger = logging.getLogger("systock.sim")
+
+        self.symbols: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.timestamps = None
+        self._open = self._high = self._low = self._close = self._volume = None
+        self._mark = None  # 평가용 종가 (거래정지 등 빈 봉은 직전 유효 종가로 채움)
+        self.t = 0
+        self._ref_close = None  # 전일 종가 (등락률 계산용)
+        self._day_start = None  # 일자별 첫 봉 인덱스
+        self._day_starts: set = set()
+
+        self._reset_account()
+
+    def _reset_account(self):
+        n = len(self.symbols)
+        self.cash = float(self.initial_cash)
+        self.positions = np.zeros(n, dtype=np.int64)
+        self.cost_basis = np.zeros(n, dtype=np.float64)  # 보유 수량의 총 매입금액
+
+        # 미체결 주문 (배열 기반)
+        self._o_id = np.zeros(0, dtype=np.int64)
+        self._o_sym = np.zeros(0, dtype=np.int64)
+        self._o_side = np.zeros(0, dtype=np.int8)  # +1 매수, -1 매도
+        self._o_qty = np.zeros(0, dtype=np.int64)
+        self._o_price = np.zeros(0, dtype=np.float64)  # 0이면 시장가
+        self._next_id = 1
+
+        # 체결 기록 (시점별 배열 묶음, fills()에서 합침)
+        self._fill_chunks: list = []
+        self.fill_listeners: List[Callable[[dict], None]] = []
+
+    # -----------------------------------------------------------
+    # 데이터 로드 및 시계
+    # -----------------------------------------------------------
+    def load_bars(
+        self,
+        symbols: Sequence[str],
+        timestamps,
+        open,
+        high,
+        low,
+        close,
+        volume=None,
+    ):
+        """
+        과거 데이터 로드 (계좌 상태는 초기화됩니다)
+        :param timestamps: (T,) 배열 (datetime64 권장 - 일자 경계로 전일 종가 계산)
+        :param open/high/low/close/volume: (T, N) 배열, N = len(symbols)
+        """
+        self.symbols = list(symbols)
+        self._index = {s: i for i, s in enumerate(self.symbols)}
+        self.timestamps = np.asarray(timestamps)
+
+        self._close = np.asarray(close, dtype=np.float64)
+        self._open = np.asarray(open, dtype=np.float64)
+        self._high = np.asarray(high, dtype=np.float64)
+        self._low = np.asarray(low, dtype=np.float64)
+        self._volume = (
+            np.zeros_like(self._close, dtype=np.int64)
+            if volume is None
+            else np.asarray(volume, dtype=np.int64)
+        )
+
+        expected = (len(self.timestamps), len(self.symbols))
+        for arr in (self._open, self._high, self._low, self._close, self._volume):
+            if arr.shape != expected:
+                raise ValueError(f"배열 크기가 맞지 않습니다: {arr.shape} != {expected}")
+
+        # 일자 경계 (datetime64인 경우만)
+        if np.issubdtype(self.timestamps.dtype, np.datetime64):
+            days = self.timestamps.astype("datetime64[D]")
+            self._day_start = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+        else:
+            self._day_start = np.array([0])
+        self._day_starts = set(self._day_start.tolist())
+
+        # 직전 유효 종가 (NaN/0 봉은 앞 봉 값으로 채우고, 한 번도 없으면 0)
+        valid = self._close > 0
+        rows = np.where(valid, np.arange(expected[0])[:, None], 0)
+        np.maximum.accumulate(rows, axis=0, out=rows)
+        self._mark = self._close[rows, np.arange(expected[1])]
+        self._mark[~np.maximum.accumulate(valid, axis=0)] = 0.0
+
+        self.t = 0
+        self._ref_close = np.nan_to_num(self._open[0], nan=0.0)
+        self._reset_account()
+
+    @property
+    def now(self):
+        """현재 시뮬레이션 시각"""
+        return self.timestamps[self.t]
+
+    def _on_new_day(self):
+        self._ref_close = self._mark[self.t - 1].copy()
+
+    def step(self, n: int = 1) -> bool:
+        """
+        시계를 n봉 전진시키며, 각 봉에서 미체결 주문 체결을 처리합니다.
+        :return: 데이터가 남아 있으면 True
+        """
+        last = len(self.timestamps) - 1
+        for _ in range(n):
+            if self.t >= last:
+                return False
+            self.t += 1
+            if self.t in self._day_starts:
+                self._on_new_day()
+            if len(self._o_id):
+                self._match()
+        return self.t < last
+
+    def run(self, on_bar: Callable[["SimBroker"], None] = None, until=None):
+        """
+        데이터 끝(또는 until 시각)까지 빠르게 재생
+        :param on_bar: 매 봉마다 호출되는 콜백 (전략 로직, 주문 가능)
+        """
+        last = len(self.timestamps) - 1
+        if until is not None:
+            last = min(last, int(np.searchsorted(self.timestamps, until, side="right")) - 1)
+
+        day_starts = self._day_starts
+        while True:
+            if on_bar is not None:
+                on_bar(self)
+            if self.t >= last:
+                break
+            self.t += 1
+            if self.t in day_starts:
+                self._on_new_day()
+            if len(self._o_id):
+                self._match()
+
+    # -----------------------------------------------------------
+    # 체결 엔진 (벡터화)
+    # -----------------------------------------------------------
+    def _match(self):
+        t = self.t
+        sym, side, price = self._o_sym, self._o_side, self._o_price
+        o = self._open[t, sym]
+        h = self._high[t, sym]
+        l = self._low[t, sym]
+
+        is_market = price <= 0
+        is_buy = side > 0
+
+        fill_px = np.where(
+            is_market,
+            o * (1 + side * self.slippage),
+            np.where(is_buy, np.minimum(o, price), np.maximum(o, price)),
+        )
+        filled = is_market | np.where(is_buy, l <= price, h >= price)
+        # 거래정지 등 가격이 없는 봉(NaN/0)은 체결하지 않음
+        filled &= o > 0
+
+        if not filled.any():
+            return
+
+        f_sym = sym[filled]
+        f_side = side[filled].astype(np.int64)
+        f_qty = self._o_qty[filled]
+        f_px = fill_px[filled]
+        notional = f_qty * f_px
+        fee = notional * self.fee_rate + np.where(f_side < 0, notional * self.tax_rate, 0.0)
+
+        # 매도분 매입원가 차감 (평균단가 기준) → 매수분 매입원가 가산
+        avg = np.divide(
+            self.cost_basis, self.positions, out=np.zeros_like(self.cost_basis),
+            where=self.positions != 0,
+        )
+        sells = f_side < 0
+        np.add.at(self.cost_basis, f_sym[sells], -avg[f_sym[sells]] * f_qty[sells])
+        np.add.at(self.cost_basis, f_sym[~sells], notional[~sells])
+        np.add.at(self.positions, f_sym, f_side * f_qty)
+        self.cash -= float((f_side * notional).sum() + fee.sum())
+
+        chunk = {
+            "t": np.full(len(f_sym), t, dtype=np.int64),
+            "order_id": self._o_id[filled],
+            "sym": f_sym,
+            "side": f_side,
+            "qty": f_qty,
+            "price": f_px,
+            "fee": fee,
+        }
+        self._fill_chunks.append(chunk)
+        for listener in self.fill_listeners:
+            listener(chunk)
+
+        keep = ~filled
+        self._o_id = self._o_id[keep]
+        self._o_sym = self._o_sym[keep]
+        self._o_side = self._o_side[keep]
+        self._o_qty = self._o_qty[keep]
+        self._o_price = self._o_price[keep]
+
+    def fills(self) -> dict:
+        """전체 체결 내역 (컬럼별 배열)"""
+        keys = ("t", "order_id", "sym", "side", "qty", "price", "fee")
+        if not self._fill_chunks:
+            return {k: np.zeros(0) for k in keys}
+        return {k: np.concatenate([c[k] for c in self._fill_chunks]) for k in keys}
+
+    # -----------------------------------------------------------
+    # Broker 인터페이스
+    # -----------------------------------------------------------
+    def connect(self) -> bool:
+        return True
+
+    def symbol(self, symbol_code: str) -> StockContext:
+        return StockContext(self, symbol_code)
+
+    @property
+    def my(self) -> AccountContext:
+        return AccountContext(self)
+
+    def _sym_index(self, symbol: str) -> int:
+        i = self._index.get(symbol)
+        if i is None:
+            raise ApiError(message=f"시뮬레이션 데이터에 없는 종목입니다: {symbol}")
+        return i
+
+    def _fetch_price(self, symbol: str) -> Quote:
+        i = self._sym_index(symbol)
+        price = float(self._mark[self.t, i])
+        ref = float(self._ref_close[i])
+        # 당일 누적 거래량
+        day_start = self._day_start[np.searchsorted(self._day_start, self.t, side="right") - 1]
+        volume = int(self._volume[day_start : self.t + 1, i].sum())
+        return Quote(
+            price=int(price),
+            volume=volume,
+            change=round((price / ref - 1) * 100, 2) if ref > 0 and price > 0 else 0.0,
+        )
+
+    def _fetch_balance(self) -> Balance:
+        prices = self._mark[self.t]
+        held = np.flatnonzero(self.positions)
+        holdings = []
+        for i in held:
+            value = self.positions[i] * prices[i]
+            cost = self.cost_basis[i]
+            holdings.append(
+                Holding(
+                    symbol=self.symbols[i],
+                    name=self.symbols[i],
+                    qty=int(self.positions[i]),
+                    profit_rate=float(round((value / cost - 1) * 100, 2)) if cost else 0.0,
+                    avg_price=float(cost / self.positions[i]),
+                )
+            )
+        total = self.cash + float((self.positions[held] * prices[held]).sum())
+        return Balance(deposit=int(self.cash), total_asset=int(total), holdings=holdings)
+
+    def order(
+        self, symbol: str, side: Side, qty: int, price: int = 0, order_type: str = "지정가"
+    ) -> Order:
+        i = self._sym_index(symbol)
+        if qty <= 0:
+            raise ApiError(message="주문수량이 0 이하입니다.")
+
+        is_limit = order_type in SIM_LIMIT_ORDER_TYPES and price > 0
+        side_sign = 1 if side == Side.BUY else -1
+
+        # 주문 가능 여부 (미체결 주문까지 반영)
+        pending = self._o_sym == i
+        if side_sign > 0:
+            est = (price if is_limit else self._mark[self.t, i]) * qty * (1 + self.fee_rate)
+            reserved = float(
+                (self._o_qty * np.where(self._o_price > 0, self._o_price, self._mark[self.t, self._o_sym]))[
+                    self._o_side > 0
+                ].sum()
+            )
+            if est > self.cash - reserved:
+                raise ApiError(message="주문가능금액을 초과 했습니다", code="APBK0952")
+        else:
+            selling = int(self._o_qty[pending & (self._o_side < 0)].sum())
+            if qty > self.positions[i] - selling:
+                raise ApiError(message="주문가능수량을 초과 했습니다", code="APBK0400")
+
+        order_id = f"{self._next_id:010d}"
+        self._o_id = np.append(self._o_id, self._next_id)
+        self._o_sym = np.append(self._o_sym, i)
+        self._o_side = np.append(self._o_side, np.int8(side_sign))
+        self._o_qty = np.append(self._o_qty, qty)
+        self._o_price = np.append(self._o_price, float(price) if is_limit else 0.0)
+        self._next_id += 1
+
+        return Order(
+            order_id=order_id,
+            symbol=symbol,
+            side=side,
+            qty=qty,
+            price=price,
+            order_type=order_type,
+        )
+
+    def cancel(self, symbol: str) -> List[str]:
+        i = self._sym_index(symbol)
+        target = self._o_sym == i
+        cancelled = [f"{x:010d}" for x in self._o_id[target].tolist()]
+
+        keep = ~target
+        self._o_id = self._o_id[keep]
+        self._o_sym = self._o_sym[keep]
+        self._o_side = self._o_side[keep]
+        self._o_qty = self._o_qty[keep]
+        self._o_price = self._o_price[keep]
+        return cancelled
+
+    def modify(
+        self, order_id: str, price: int = None, qty: int = None, order_type: str = "지정가"
+    ) -> Order:
+        """미체결 주문 정정 (KIS와 같이 새 주문번호 부여, 체결 판정은 다음 봉부터)"""
+        if price is None and qty is None:
+            raise ValueError("정정할 가격 또는 수량을 지정해야 합니다.")
+        pos = np.flatnonzero(self._o_id == int(order_id))
+        if not len(pos):
+            raise ApiError(message=f"정정 가능한 미체결 주문이 없습니다: {order_id}")
+        k = int(pos[0])
+
+        remaining = int(self._o_qty[k])
+        new_qty = remaining if qty is None else min(qty, remaining)
+        if new_qty <= 0:
+            raise ApiError(message="주문수량이 0 이하입니다.")
+        if price is not None:
+            is_limit = order_type in SIM_LIMIT_ORDER_TYPES and price > 0
+            self._o_price[k] = float(price) if is_limit else 0.0
+        self._o_qty[k] = new_qty
+        self._o_id[k] = self._next_id
+        self._next_id += 1
+
+        side = Side.BUY if self._o_side[k] > 0 else Side.SELL
+        return Order(
+            order_id=f"{int(self._o_id[k]):010d}",
+            symbol=self.symbols[int(self._o_sym[k])],
+            side=side,
+            qty=new_qty,
+            price=int(self._o_price[k]),
+            order_type=order_type,
+        )
+
+    def open_orders(self, symbol: Optional[str] = None) -> List[dict]:
+        """미체결 주문 목록 (KIS _fetch_open_orders와 같은 키 사용)"""
+        mask = np.ones(len(self._o_id), dtype=bool)
+        if symbol is not None:
+            mask &= self._o_sym == self._sym_index(symbol)
+        return [
+            {"odno": f"{oid:010d}", "pdno": self.symbols[s], "psbl_qty": str(q)}
+            for oid, s, q in zip(
+                self._o_id[mask].tolist(), self._o_sym[mask].tolist(), self._o_qty[mask].tolist()
+            )
+        ]
@@ -0,0 +1,468 @@
+# src/systock/cli.py
+"""
+systock 명령행 도구 (대량 데이터 조회/내보내기)
+
+사용 예:
+    systock quotes 005930 000660 -o quotes.csv
+    systock quotes --master kospi_code.mst --group ST -o kospi.jsonl --workers 8 --resume
+    systock balance --accounts main,sub -o balance.csv
+    systock history 005930 --start 20240101 --end 20241231 -o daily.parquet
+    systock quotes 005930 --base-url http://127.0.0.1:8080   # 로컬 모의 서버
+"""
+# 기동 속도를 위해 무거운 모듈(requests, 브로커 구현체 등)은 명령 실행 시점에 import
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+QUOTE_COLUMNS = ["symbol", "price", "volume", "change", "ts"]
+BALANCE_COLUMNS = [
+    "account", "symbol", "name", "qty", "avg_price", "profit_rate", "deposit", "total_asset",
+]
+HISTORY_COLUMNS = ["symbol", "date", "open", "high", "low", "close", "volume", "amount"]
+
+
+# -----------------------------------------------------------
+# 출력 (스트리밍 기록기)
+# -----------------------------------------------------------
+class RowWriter(ABC):
+    """행 단위 스트리밍 기록기 기본 클래스"""
+
+    def __init__(self, path: str, columns: List[str], append: bool = False):
+        self.path = path
+        self.columns = columns
+        self.append = append
+        self.rows = 0
+
+    @abstractmethod
+    def write(self, row: dict):
+        """행 1개 기록"""
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class CsvWriter(RowWriter):
+    def __init__(self, path: str, columns: List[str], append: bool = False):
+        super().__init__(path, columns, append)
+        exists = append and os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = sys.stdout if path == "-" else open(
+            path, "a" if append else "w", newline="", encoding="utf-8"
+        )
+        self._writer = csv.DictWriter(self._file, fieldnames=columns, extrasaction="ignore")
+        if not exists:
+            self._writer.writeheader()
+
+    def write(self, row: dict):
+        self._writer.writerow(row)
+        self.rows += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self.flush()
+        if self._file is not sys.stdout:
+            self._file.close()
+
+
+class JsonlWriter(RowWriter):
+    def __init__(self, path: str, columns: List[str], append: bool = False):
+        super().__init__(path, columns, append)
+        self._file = sys.stdout if path == "-" else open(
+            path, "a" if append else "w", encoding="utf-8"
+        )
+
+    def write(self, row: dict):
+        self._file.write(json.dumps({c: row.get(c) for c in self.columns}, ensure_ascii=False))
+        self._file.write("\n")
+        self.rows += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self.flush()
+        if self._file is not sys.stdout:
+            self._file.close()
+
+
+class ParquetWriter(RowWriter):
+    """row_group_size 행마다 Row Group 단위로 기록 (pyarrow 필요, 이어쓰기 미지원)"""
+
+    def __init__(self, path: str, columns: List[str], append: bool = False, row_group_size: int = 10_000):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("pyarrow 라이브러리가 필요합니다. (pip install pyarrow)") from None
+        if append:
+            raise ValueError("Parquet 출력은 이어쓰기를 지원하지 않습니다.")
+
+        super().__init__(path, columns, append)
+        self._pa = pa
+        self._pq = pq
+        self._writer = None
+        self._buffer: Dict[str, list] = {c: [] for c in columns}
+        self.row_group_size = row_group_size
+
+    def write(self, row: dict):
+        for c in self.columns:
+            self._buffer[c].append(row.get(c))
+        self.rows += 1
+        if len(self._buffer[self.columns[0]]) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer[self.columns[0]]:
+            return
+        table = self._pa.table(self._buffer)
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table.cast(self._writer.schema))
+        self._buffer = {c: [] for c in self.columns}
+
+    def close(self):
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+
+
+WRITERS = {"csv": CsvWriter, "jsonl": JsonlWriter, "parquet": ParquetWriter}
+
+
+def resolve_format(path: str, fmt: Optional[str] = None) -> str:
+    """출력 형식 결정 (지정하지 않으면 확장자로 판단, 그 외/표준출력은 csv)"""
+    if fmt is None:
+        ext = os.path.splitext(path)[1].lower().lstrip(".")
+        fmt = {"json": "jsonl", "ndjson": "jsonl", "pq": "parquet"}.get(ext, ext)
+    return fmt if fmt in WRITERS else "csv"
+
+
+# -----------------------------------------------------------
+# 진행 상황 / 재개
+# -----------------------------------------------------------
+class Progress:
+    """진행률/처리량 표시 (stderr, 최대 0.5초에 한 번 갱신)"""
+
+    def __init__(self, label: str, total: int, quiet: bool = False):
+        self.label = label
+        self.total = total
+        self.quiet = quiet
+        self.done = 0
+        self.errors = 0
+        self.rows = 0
+        self.started = time.perf_counter()
+        self._last_draw = 0.0
+
+    def update(self, rows: int = 0, error: bool = False):
+        self.done += 1
+        self.rows += rows
+        self.errors += int(error)
+        now = time.perf_counter()
+        if not self.quiet and (now - self._last_draw >= 0.5 or self.done == self.total):
+            self._last_draw = now
+            elapsed = now - self.started
+            pct = self.done / self.total * 100 if self.total else 100.0
+            sys.stderr.write(
+                f"\r[{self.label}] {self.done}/{self.total} ({pct:.1f}%) "
+                f"{self.done / elapsed if elapsed else 0:.1f}건/s, 행 {self.rows}, 오류 {self.errors}"
+            )
+            sys.stderr.flush()
+
+    def finish(self) -> dict:
+        elapsed = time.perf_counter() - self.started
+        stats = {
+            "items": self.done,
+            "rows": self.rows,
+            "errors": self.errors,
+            "elapsed_s": round(elapsed, 3),
+            "items_per_s": round(self.done / elapsed, 2) if elapsed else 0.0,
+        }
+        if not self.quiet:
+            sys.stderr.write("\n" + json.dumps(stats, ensure_ascii=False) + "\n")
+        return stats
+
+
+class Checkpoint:
+    """
+    재개용 완료 목록 ({출력파일}.done, 한 줄에 키 하나)
+    - 작업 단위(종목/계좌)가 모두 기록된 뒤에만 완료로 표시하므로, 중단 후 재실행 시 누락이 없습니다.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.done: Set[str] = set()
+        self._file = None
+        if path:
+            if os.path.exists(path):
+                with open(path, encoding="utf-8") as f:
+                    self.done = {line.strip() for line in f if line.strip()}
+            self._file = open(path, "a", encoding="utf-8")
+
+    def mark(self, key: str):
+        if self._file:
+            self._file.write(key + "\n")
+            self._file.flush()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+
+
+# -----------------------------------------------------------
+# 실행기
+# -----------------------------------------------------------
+def run_jobs(
+    keys: Sequence[str],
+    fetch: Callable[[str], List[dict]],
+    writer: RowWriter,
+    checkpoint: Checkpoint,
+    progress: Progress,
+    workers: int = 4,
+):
+    """
+    키(종목/계좌)별 조회를 병렬로 수행하고, 완료되는 순서대로 즉시 기록합니다.
+    - 유량 제한은 브로커의 계좌 RateLimiter가 담당합니다.
+    - 동시에 진행 중인 작업 수를 workers * 2로 제한하여 메모리 사용량을 일정하게 유지합니다.
+    """
+    pending = iter(keys)
+    in_flight = {}
+
+    def submit(pool):
+        for key in pending:
+            in_flight[pool.submit(fetch, key)] = key
+            if len(in_flight) >= workers * 2:
+                return
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="systock-cli") as pool:
+        submit(pool)
+        last_flush = time.perf_counter()
+        while in_flight:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                key = in_flight.pop(future)
+                try:
+                    rows = future.result()
+                except Exception as e:
+                    sys.stderr.write(f"\n[오류] {key}: {e}\n")
+                    progress.update(error=True)
+                    continue
+                for row in rows:
+                    writer.write(row)
+                if checkpoint.path:
+                    # 완료 표시 전에 기록을 내려써서 재개 시 중복/누락 방지
+                    writer.flush()
+                    checkpoint.mark(key)
+                progress.update(rows=len(rows))
+            submit(pool)
+
+            if time.perf_counter() - last_flush >= 1.0:
+                writer.flush()
+                last_flush = time.perf_counter()
+
+
+def _make_broker(args, account_name: str = None):
+    from . import create_broker
+
+    if not args.base_url:
+        return create_broker("kis", mode=args.mode, account_name=account_name or None)
+
+    # 로컬 모의 서버 등 다른 주소로 요청
+    # - 실제 서버 토큰과 섞이지 않도록 주소별 토큰 파일 사용
+    # - .env에 계좌 설정이 없으면 임의의 키/계좌로 접속 (모의 서버 테스트용)
+    from urllib.parse import urlparse
+    from .exceptions import ConfigError
+    from .token_store import FileTokenStore
+    from .brokers.kis.client import KisBroker
+
+    host = urlparse(args.base_url).netloc or args.base_url
+    token_store = FileTokenStore(f"kis_token_{host.replace(':', '_')}.json")
+    try:
+        return create_broker(
+            "kis", mode=args.mode, account_name=account_name or None,
+            token_store=token_store, base_url=args.base_url,
+        )
+    except ConfigError:
+        return KisBroker(
+            app_key="local", app_secret="local", acc_no="00000000-01",
+            is_real=args.mode == "real", token_store=token_store, base_url=args.base_url,
+        )
+
+
+def _read_symbols(args) -> List[str]:
+    symbols: List[str] = list(args.symbols or [])
+    if args.symbols_file:
+        with open(args.symbols_file, encoding="utf-8") as f:
+            symbols += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    for path in args.master or []:
+        from .master import parse_master_file
+
+        market = "KOSDAQ" if "kosdaq" in os.path.basename(path).lower() else "KOSPI"
+        symbols += [
+            info.symbol
+            for info in parse_master_file(path, market)
+            if not args.group or info.group in args.group
+        ]
+    # 순서 유지 중복 제거
+    return list(dict.fromkeys(symbols))
+
+
+def _run(args, label: str, keys: List[str], columns: List[str], fetch: Callable[[str], List[dict]]) -> int:
+    fmt = resolve_format(args.output, args.format)
+    if args.resume and (fmt == "parquet" or args.output == "-"):
+        raise ValueError("--resume은 csv/jsonl 파일 출력에서만 사용할 수 있습니다.")
+
+    checkpoint = Checkpoint(f"{args.output}.done" if args.resume else None)
+    todo = [k for k in keys if k not in checkpoint.done]
+    if checkpoint.done:
+        sys.stderr.write(f"[{label}] 재개: 완료 {len(keys) - len(todo)}건 건너뜀\n")
+
+    writer = WRITERS[fmt](args.output, columns, append=bool(checkpoint.done))
+    progress = Progress(label, len(todo), quiet=args.quiet or args.output == "-")
+    try:
+        run_jobs(todo, fetch, writer, checkpoint, progress, workers=args.workers)
+    except KeyboardInterrupt:
+        sys.stderr.write("\n중단되었습니다. --resume으로 이어서 실행할 수 있습니다.\n")
+        return 130
+    finally:
+        writer.close()
+        checkpoint.close()
+        progress.finish()
+    return 1 if progress.errors else 0
+
+
+# -----------------------------------------------------------
+# 명령
+# -----------------------------------------------------------
+def cmd_quotes(args) -> int:
+    symbols = _read_symbols(args)
+    if not symbols:
+        sys.stderr.write("종목을 지정하세요. (인자, --symbols-file, --master)\n")
+        return 2
+    broker = _make_broker(args, args.account)
+    broker.connect()
+
+    def fetch(symbol: str) -> List[dict]:
+        quote = broker._fetch_price(symbol)
+        return [{
+            "symbol": symbol,
+            "price": quote.price,
+            "volume": quote.volume,
+            "change": quote.change,
+            "ts": round(time.time(), 3),
+        }]
+
+    return _run(args, "quotes", symbols, QUOTE_COLUMNS, fetch)
+
+
+def cmd_balance(args) -> int:
+    # 'main'은 기본 계좌 (별칭 없음)
+    names = args.accounts.split(",") if args.accounts else [args.account or "main"]
+    accounts = list(dict.fromkeys(a.strip() or "main" for a in names))
+    brokers = {}
+    lock = threading.Lock()
+
+    def fetch(account: str) -> List[dict]:
+        with lock:
+            if account not in brokers:
+                brokers[account] = _make_broker(args, None if account == "main" else account)
+        balance = brokers[account]._fetch_balance()
+        base = {"account": account, "deposit": balance.deposit, "total_asset": balance.total_asset}
+        if not balance.holdings:
+            return [dict(base)]
+        return [
+            dict(
+                base,
+                symbol=h.symbol,
+                name=h.name,
+                qty=h.qty,
+                avg_price=h.avg_price,
+                profit_rate=h.profit_rate,
+            )
+            for h in balance.holdings
+        ]
+
+    return _run(args, "balance", accounts, BALANCE_COLUMNS, fetch)
+
+
+def cmd_history(args) -> int:
+    symbols = _read_symbols(args)
+    if not symbols:
+        sys.stderr.write("종목을 지정하세요. (인자, --symbols-file, --master)\n")
+        return 2
+    broker = _make_broker(args, args.account)
+    broker.connect()
+    end = args.end or time.strftime("%Y%m%d")
+
+    def fetch(symbol: str) -> List[dict]:
+        rows = broker.fetch_daily_chart(
+            symbol, args.start, end, period=args.period, adjusted=not args.raw_price
+        )
+        for row in rows:
+            row["symbol"] = symbol
+        return rows
+
+    return _run(args, "history", symbols, HISTORY_COLUMNS, fetch)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="systock", description="sy-stock-api 명령행 도구")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--mode", choices=["virtual", "real"], default="virtual", help="실전/모의 (기본: virtual)")
+    common.add_argument("--account", default=None, help=".env 계좌 별칭 (예: sub)")
+    common.add_argument("--base-url", default=None, help="API 주소 변경 (로컬 모의 서버 등)")
+    common.add_argument("-o", "--output", default="-", help="출력 파일 (기본: 표준출력)")
+    common.add_argument("--format", choices=sorted(WRITERS), default=None, help="출력 형식 (기본: 확장자로 판단)")
+    common.add_argument("--workers", type=int, default=4, help="동시 조회 수 (유량 제한은 계좌 단위로 공유)")
+    common.add_argument("--resume", action="store_true", help="{출력파일}.done 기준으로 완료된 항목 건너뛰기")
+    common.add_argument("-q", "--quiet", action="store_true", help="진행 상황 표시 안 함")
+
+    universe = argparse.ArgumentParser(add_help=False)
+    universe.add_argument("symbols", nargs="*", help="종목코드")
+    universe.add_argument("--symbols-file", help="종목코드 목록 파일 (한 줄에 하나)")
+    universe.add_argument("--master", action="append", help="종목 마스터 파일(.mst) 전 종목 (여러 번 지정 가능)")
+    universe.add_argument("--group", action="append", help="마스터 그룹코드 필터 (예: ST=주권, EF=ETF)")
+
+    p = sub.add_parser("quotes", parents=[common, universe], help="현재가 일괄 조회")
+    p.set_defaults(func=cmd_quotes)
+
+    p = sub.add_parser("balance", parents=[common], help="계좌 잔고 내보내기")
+    p.add_argument("--accounts", help="계좌 별칭 목록 (쉼표 구분, main은 기본 계좌. 예: main,sub,mom)")
+    p.set_defaults(func=cmd_balance)
+
+    p = sub.add_parser("history", parents=[common, universe], help="기간별 시세(일/주/월봉) 다운로드")
+    p.add_argument("--start", required=True, help="시작일 (YYYYMMDD)")
+    p.add_argument("--end", help="종료일 (YYYYMMDD, 기본: 오늘)")
+    p.add_argument("--period", choices=["D", "W", "M", "Y"], default="D", help="봉 주기 (기본: D)")
+    p.add_argument("--raw-price", action="store_true", help="수정주가 미적용")
+    p.set_defaults(func=cmd_history)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    from .exceptions import SyStockError
+
+    try:
+        return args.func(args)
+    except (SyStockError, ValueError, ImportError, OSError) as e:
+        sys.stderr.write(f"오류: {e}\n")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
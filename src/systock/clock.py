@@ -0,0 +1,74 @@
+# src/systock/clock.py
+import time
+from abc import ABC, abstractmethod
+
+
+class Clock(ABC):
+    """
+    시계 인터페이스 (RateLimiter, CircuitBreaker, 요청 기한 계산에 주입)
+    - time(): epoch 초 / monotonic(): 경과 시간 측정용 / sleep(): 대기
+    """
+
+    @abstractmethod
+    def time(self) -> float:
+        pass
+
+    @abstractmethod
+    def monotonic(self) -> float:
+        pass
+
+    @abstractmethod
+    def sleep(self, seconds: float):
+        pass
+
+
+class SystemClock(Clock):
+    """실제 시계 (기본값)"""
+
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    """
+    가상 시계 (시뮬레이션/테스트용)
+    - sleep()은 실제로 기다리지 않고 시각만 앞당깁니다.
+    - 단일 스레드에서 사건 순서대로 구동하는 것을 전제로 합니다. (systock.loadsim 참고)
+
+    사용 예:
+        clock = VirtualClock()
+        limiter = RateLimiter(20, 1.0, clock=clock)
+        for _ in range(100):
+            limiter.wait()
+        clock.now                     # 약 4초 (실제 소요 시간은 수 ms)
+    """
+
+    def __init__(self, start: float = 0.0):
+        self.now = float(start)
+        self.slept = 0.0  # sleep()으로 흘려보낸 시간 합계
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            self.now += seconds
+            self.slept += seconds
+
+    def advance_to(self, t: float):
+        """시각을 t로 이동 (과거로는 돌아가지 않음)"""
+        if t > self.now:
+            self.now = t
+
+
+# 기본 시계 (모든 구성 요소가 공유)
+SYSTEM_CLOCK = SystemClock()
@@ -3,4 +3,13 @@ from enum import Enum
 class Side(str, Enum):
     """매수/매도 구분"""
     BUY = "buy"
-    SELL = "sell"
\ No newline at end of file
+    SELL = "sell"
+
+class OrderStatus(str, Enum):
+    """주문 상태 (로컬 주문 추적용)"""
+    OPEN = "open"  # 접수/미체결 (부분체결 포함)
+    FILLED = "filled"  # 전량 체결
+    CANCELLED = "cancelled"  # 취소
+    REJECTED = "rejected"  # 거부
+    REPLACED = "replaced"  # 정정되어 새 주문번호로 대체됨
+    CLOSED = "closed"  # REST 대사 결과 미체결 목록에서 사라짐 (체결/취소 구분 불가)
@@ -1,6 +1,6 @@
 # src/systock/contexts.py
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 from .models import Holding, Quote, Balance
 from .constants import Side
 
@@ -43,15 +43,22 @@ class AccountContext:
     """
     내 계좌 정보를 다루는 컨텍스트 객체
     사용 예: broker.my.deposit
+    - 브로커에 계좌 스냅샷(account_snapshot)이 있으면 공유 스냅샷을 사용합니다.
+      (broker.my를 여러 번 호출해도 max_age 이내라면 잔고를 다시 조회하지 않음)
     """
 
     def __init__(self, broker: Broker):
         self._broker = broker
         self._balance: Optional[Balance] = None
+        self._by_symbol: Optional[Dict[str, Holding]] = None
 
     def _ensure_loaded(self):
         if self._balance is None:
-            self._balance = self._broker._fetch_balance()
+            snapshot = getattr(self._broker, "account_snapshot", None)
+            if snapshot is not None:
+                self._balance = snapshot.get()
+            else:
+                self._balance = self._broker._fetch_balance()
 
     @property
     def deposit(self) -> int:
@@ -68,6 +75,18 @@ class AccountContext:
         self._ensure_loaded()
         return self._balance.holdings
 
+    def holding(self, symbol: str) -> Optional[Holding]:
+        """[추가] 종목별 보유 정보 (미보유 시 None, O(1) 조회)"""
+        self._ensure_loaded()
+        if self._by_symbol is None:
+            self._by_symbol = {h.symbol: h for h in self._balance.holdings}
+        return self._by_symbol.get(symbol)
+
     def refresh(self) -> AccountContext:
         self._balance = None
+        self._by_symbol = None
+        # [추가] 공유 스냅샷도 무효화하여 다음 접근 시 새로 조회
+        snapshot = getattr(self._broker, "account_snapshot", None)
+        if snapshot is not None:
+            snapshot.invalidate()
         return self
@@ -0,0 +1,486 @@
+# src/systock/engine.py
+from __future__ import annotations
+
+import time
+import asyncio
+import inspect
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, List, Optional, Union
+
+from .models import Quote, Order
+from .constants import Side
+from .utils import LatencyStats
+
+if TYPE_CHECKING:
+    from .interfaces.broker import Broker
+
+
+# -----------------------------------------------------------
+# 이벤트
+# -----------------------------------------------------------
+@dataclass
+class QuoteEvent:
+    """시세 이벤트"""
+
+    symbol: str
+    quote: Quote
+    ts: float = field(default_factory=time.perf_counter)  # 이벤트 생성 시각 (지연 측정용)
+
+
+@dataclass
+class ExecutionEvent:
+    """체결/주문 상태 이벤트 (체결통보 등)"""
+
+    symbol: str
+    order_id: str
+    qty: int
+    price: float
+    side: Optional[Side] = None
+    ts: float = field(default_factory=time.perf_counter)
+
+
+Event = Union[QuoteEvent, ExecutionEvent]
+
+
+# -----------------------------------------------------------
+# 전략
+# -----------------------------------------------------------
+class Strategy:
+    """
+    전략 기본 클래스
+    - 필요한 핸들러만 오버라이드합니다. (async def 로 정의해도 됩니다)
+    - symbols가 None이면 모든 종목의 시세 이벤트를 받습니다.
+    """
+
+    name: str = ""
+    symbols: Optional[Iterable[str]] = None
+
+    def on_start(self, ctx: StrategyContext):
+        pass
+
+    def on_quote(self, ctx: StrategyContext, event: QuoteEvent):
+        pass
+
+    def on_execution(self, ctx: StrategyContext, event: ExecutionEvent):
+        pass
+
+    def on_stop(self, ctx: StrategyContext):
+        pass
+
+
+class StrategyContext:
+    """전략 핸들러에 전달되는 실행 컨텍스트 (주문은 반드시 이 객체를 통해 전송)"""
+
+    def __init__(self, engine: Engine, strategy: Strategy):
+        self.engine = engine
+        self.strategy = strategy
+        self.broker = engine.broker
+        self.current_event: Optional[Event] = None
+
+    def order(
+        self,
+        symbol: str,
+        side: Side,
+        qty: int,
+        price: int = 0,
+        order_type: str = "지정가",
+    ) -> Order:
+        """주문 게이트웨이를 통한 주문 전송 (이벤트→주문 지연 자동 측정)"""
+        event_ts = self.current_event.ts if self.current_event else None
+        return self.engine.gateway.submit(
+            self.strategy.name, symbol, side, qty, price, order_type, event_ts
+        )
+
+    def cancel(self, symbol: str) -> List[str]:
+        return self.engine.gateway.cancel(self.strategy.name, symbol)
+
+    async def order_async(
+        self,
+        symbol: str,
+        side: Side,
+        qty: int,
+        price: int = 0,
+        order_type: str = "지정가",
+    ) -> Order:
+        """async 핸들러용 주문 (브로커 호출은 별도 스레드에서 수행하여 이벤트 루프를 막지 않음)"""
+        return await asyncio.to_thread(self.order, symbol, side, qty, price, order_type)
+
+    async def cancel_async(self, symbol: str) -> List[str]:
+        """async 핸들러용 취소"""
+        return await asyncio.to_thread(self.cancel, symbol)
+
+
+# -----------------------------------------------------------
+# 주문 게이트웨이
+# -----------------------------------------------------------
+class OrderGateway:
+    """
+    모든 전략의 주문이 모이는 단일 관문
+    - 브로커 호출은 잠금 없이 병렬로 수행하며, 전략 간 호출 순서는 계좌 RateLimiter가 조율합니다.
+      (잠금은 주문 건수 등 내부 집계에만 사용하므로, 느린 응답 하나가 다른 전략의 주문을 막지 않음)
+    - 전략별 이벤트→주문 접수 지연을 기록합니다.
+    """
+
+    def __init__(self, broker: Broker):
+        self.broker = broker
+        self._lock = threading.Lock()
+        self.latency: Dict[str, LatencyStats] = {}
+        self.order_count = 0
+
+    def _stats(self, strategy_name: str) -> LatencyStats:
+        stats = self.latency.get(strategy_name)
+        if stats is None:
+            stats = self.latency.setdefault(strategy_name, LatencyStats())
+        return stats
+
+    def submit(
+        self,
+        strategy_name: str,
+        symbol: str,
+        side: Side,
+        qty: int,
+        price: int,
+        order_type: str,
+        event_ts: float = None,
+    ) -> Order:
+        order = self.broker.order(
+            symbol=symbol, side=side, qty=qty, price=price, order_type=order_type
+        )
+        with self._lock:
+            self.order_count += 1
+
+        if event_ts is not None:
+            self._stats(strategy_name).add(time.perf_counter() - event_ts)
+        return order
+
+    def cancel(self, strategy_name: str, symbol: str) -> List[str]:
+        return self.broker.cancel(symbol)
+
+
+# -----------------------------------------------------------
+# 엔진
+# -----------------------------------------------------------
+async def _cancel_tasks():
+    """현재 루프의 다른 작업을 모두 취소하고 종료될 때까지 대기"""
+    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _Mailbox:
+    """전략 전용 이벤트 큐 + 실행 상태"""
+
+    def __init__(self, strategy: Strategy, ctx: StrategyContext, size: int):
+        self.strategy = strategy
+        self.ctx = ctx
+        self.size = size
+        self.events: Deque[Event] = deque()
+        self.cond = threading.Condition()
+        self.running = False  # 드레인 작업이 스케줄되어 있는지 여부
+        self.dropped = 0
+        self.symbols = set(strategy.symbols) if strategy.symbols is not None else None
+        self.queue_delay = LatencyStats()
+        self.handler_latency = LatencyStats()
+
+
+class Engine:
+    """
+    이벤트 기반 전략 엔진
+    - 시세/체결 이벤트를 등록된 전략(Strategy)에 전달합니다.
+    - 전략마다 전용 메일박스를 두어 이벤트 순서를 보장하고, 전략 간에는 병렬 실행됩니다.
+    - 모든 주문은 OrderGateway 하나를 거쳐 브로커(및 브로커의 RateLimiter)로 전달됩니다.
+    - Broker 인터페이스만 사용하므로 KisBroker와 시뮬레이션 브로커에서 같은 전략을 실행할 수 있습니다.
+
+    사용 예:
+        engine = Engine(broker, executor="thread")
+        engine.add_strategy(MyStrategy())
+        engine.start()
+        engine.add_source(PollingQuoteSource(broker, ["005930"], interval=1.0))
+    """
+
+    def __init__(
+        self,
+        broker: Broker,
+        executor: str = "thread",
+        workers: int = 4,
+        mailbox_size: int = 10000,
+        overflow: str = "drop_oldest",
+    ):
+        """
+        :param executor: 'thread' (스레드 풀) 또는 'async' (전용 asyncio 루프)
+        :param mailbox_size: 전략별 대기 이벤트 상한 (백프레셔)
+        :param overflow: 상한 초과 시 'drop_oldest' (오래된 시세 폐기) 또는 'block' (발행자 대기)
+        """
+        if executor not in ("thread", "async"):
+            raise ValueError(f"지원하지 않는 executor입니다: {executor}")
+        if overflow not in ("drop_oldest", "block"):
+            raise ValueError(f"지원하지 않는 overflow 정책입니다: {overflow}")
+
+        self.broker = broker
+        self.gateway = OrderGateway(broker)
+        self.executor = executor
+        self.workers = workers
+        self.mailbox_size = mailbox_size
+        self.overflow = overflow
+        self.logger = logging.getLogger("systock.engine")
+
+        self._mailboxes: List[_Mailbox] = []
+        self._sources: list = []
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self.running = False
+
+    def add_strategy(self, strategy: Strategy) -> Strategy:
+        if not strategy.name:
+            strategy.name = type(strategy).__name__
+        ctx = StrategyContext(self, strategy)
+        self._mailboxes.append(_Mailbox(strategy, ctx, self.mailbox_size))
+        return strategy
+
+    def add_source(self, source):
+        """이벤트 소스 연결 (source.start(engine) 호출)"""
+        self._sources.append(source)
+        if self.running:
+            source.start(self)
+
+    # -----------------------------------------------------------
+    # 수명 주기
+    # -----------------------------------------------------------
+    def start(self):
+        if self.running:
+            return
+
+        if self.executor == "thread":
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="systock-engine"
+            )
+        else:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name="systock-engine-loop", daemon=True
+            )
+            self._loop_thread.start()
+
+        self.running = True
+        for box in self._mailboxes:
+            box.strategy.on_start(box.ctx)
+
+        # 시작 전에 발행된 이벤트 처리
+        for box in self._mailboxes:
+            with box.cond:
+                if not box.events or box.running:
+                    continue
+                box.running = True
+            self._schedule(box)
+        for source in self._sources:
+            source.start(self)
+
+    def stop(self):
+        if not self.running:
+            return
+
+        for source in self._sources:
+            source.stop()
+        self.running = False
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self._loop is not None:
+            # 실행 중인 드레인 작업을 취소한 뒤 루프 종료
+            try:
+                asyncio.run_coroutine_threadsafe(_cancel_tasks(), self._loop).result(timeout=5)
+            except Exception as e:
+                self.logger.warning("엔진 작업 취소 실패: %s", e)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=5)
+            self._loop.close()
+            self._loop = None
+
+        # 중단된 드레인 작업 정리 (남은 이벤트는 다음 start()에서 다시 스케줄)
+        for box in self._mailboxes:
+            with box.cond:
+                box.running = False
+
+        for box in self._mailboxes:
+            box.strategy.on_stop(box.ctx)
+
+    # -----------------------------------------------------------
+    # 이벤트 발행/처리
+    # -----------------------------------------------------------
+    def publish(self, event: Event):
+        """이벤트를 관심 있는 전략의 메일박스에 전달 (스레드 안전)"""
+        is_quote = isinstance(event, QuoteEvent)
+
+        for box in self._mailboxes:
+            if is_quote and box.symbols is not None and event.symbol not in box.symbols:
+                continue
+
+            with box.cond:
+                if len(box.events) >= box.size:
+                    if self.overflow == "block":
+                        while len(box.events) >= box.size and self.running:
+                            box.cond.wait(0.1)
+                    else:
+                        # 체결 이벤트는 버리지 않고, 가장 오래된 시세만 폐기
+                        for i, old in enumerate(box.events):
+                            if isinstance(old, QuoteEvent):
+                                del box.events[i]
+                                box.dropped += 1
+                                break
+
+                box.events.append(event)
+                if box.running or not self.running:
+                    continue
+                box.running = True
+
+            self._schedule(box)
+
+    def publish_notice(self, notice: Dict[str, str]):
+        """
+        KIS 체결통보(parse_execution_notice 결과) 중 체결 건을 ExecutionEvent로 발행
+        """
+        if notice.get("CNTG_YN") != "2":
+            return
+        self.publish(
+            ExecutionEvent(
+                symbol=notice.get("STCK_SHRN_ISCD", ""),
+                order_id=notice.get("ODER_NO", ""),
+                qty=int(notice.get("CNTG_QTY") or 0),
+                price=float(notice.get("CNTG_UNPR") or 0),
+                side=Side.SELL if notice.get("SELN_BYOV_CLS") == "01" else Side.BUY,
+            )
+        )
+
+    def _schedule(self, box: _Mailbox):
+        if self._pool is not None:
+            self._pool.submit(self._drain, box)
+        elif self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self._drain_async(box), self._loop)
+
+    def _next_event(self, box: _Mailbox) -> Optional[Event]:
+        with box.cond:
+            if not box.events:
+                box.running = False
+                return None
+            event = box.events.popleft()
+            box.cond.notify()
+            return event
+
+    def _handler(self, box: _Mailbox, event: Event):
+        if isinstance(event, QuoteEvent):
+            return box.strategy.on_quote
+        return box.strategy.on_execution
+
+    def _drain(self, box: _Mailbox):
+        while True:
+            event = self._next_event(box)
+            if event is None:
+                return
+
+            started = time.perf_counter()
+            box.queue_delay.add(started - event.ts)
+            box.ctx.current_event = event
+            try:
+                result = self._handler(box, event)(box.ctx, event)
+                if inspect.isawaitable(result):
+                    asyncio.run(result)
+            except Exception:
+                self.logger.exception("전략 처리 중 오류 (%s)", box.strategy.name)
+            finally:
+                box.ctx.current_event = None
+                box.handler_latency.add(time.perf_counter() - started)
+
+    async def _drain_async(self, box: _Mailbox):
+        while True:
+            event = self._next_event(box)
+            if event is None:
+                return
+
+            started = time.perf_counter()
+            box.queue_delay.add(started - event.ts)
+            box.ctx.current_event = event
+            try:
+                handler = self._handler(box, event)
+                if inspect.iscoroutinefunction(handler):
+                    # 주문은 ctx.order_async()로 보내야 이벤트 루프가 막히지 않음
+                    await handler(box.ctx, event)
+                else:
+                    # 동기 핸들러(ctx.order 등 블로킹 호출 포함)는 별도 스레드에서 실행
+                    result = await asyncio.to_thread(handler, box.ctx, event)
+                    if inspect.isawaitable(result):
+                        await result
+            except Exception:
+                self.logger.exception("전략 처리 중 오류 (%s)", box.strategy.name)
+            finally:
+                box.ctx.current_event = None
+                box.handler_latency.add(time.perf_counter() - started)
+
+    # -----------------------------------------------------------
+    # 모니터링
+    # -----------------------------------------------------------
+    def stats(self) -> Dict[str, dict]:
+        """전략별 대기 이벤트 수, 폐기 수, 큐 지연, 핸들러 지연, 이벤트→주문 지연"""
+        result = {}
+        for box in self._mailboxes:
+            name = box.strategy.name
+            order_latency = self.gateway.latency.get(name)
+            result[name] = {
+                "pending": len(box.events),
+                "dropped": box.dropped,
+                "queue_delay": box.queue_delay.summary(),
+                "handler": box.handler_latency.summary(),
+                "event_to_order": order_latency.summary() if order_latency else {"count": 0},
+            }
+        return result
+
+
+# -----------------------------------------------------------
+# 이벤트 소스
+# -----------------------------------------------------------
+class PollingQuoteSource:
+    """
+    REST 현재가 폴링 소스
+    - 브로커의 _fetch_price를 주기적으로 호출하여 QuoteEvent를 발행합니다.
+    - 호출은 브로커의 RateLimiter를 그대로 따릅니다.
+    """
+
+    def __init__(self, broker: Broker, symbols: Iterable[str], interval: float = 1.0):
+        self.broker = broker
+        self.symbols = list(symbols)
+        self.interval = interval
+        self.logger = logging.getLogger("systock.engine")
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, engine: Engine):
+        self._stop.clear()
+
+        def _loop():
+            while not self._stop.is_set():
+                started = time.time()
+                for symbol in self.symbols:
+                    if self._stop.is_set():
+                        return
+                    try:
+                        engine.publish(QuoteEvent(symbol, self.broker._fetch_price(symbol)))
+                    except Exception as e:
+                        self.logger.warning("시세 폴링 실패 (%s): %s", symbol, e)
+                self._stop.wait(max(0.0, self.interval - (time.time() - started)))
+
+        self._thread = threading.Thread(
+            target=_loop, name="systock-quote-poller", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
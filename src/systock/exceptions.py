@@ -28,3 +28,26 @@ class ApiError(SyStockError):
     def __init__(self, message: str, code: str = None):
         self.code = code  # API 에러 코드 (예: msg1)
         super().__init__(f"[{code}] {message}" if code else message)
+
+
+class ValidationError(SyStockError):
+    """주문 사전 검증 실패 (호가단위 불일치, 가격제한폭 초과 등)"""
+
+    pass
+
+
+class CircuitOpenError(NetworkError):
+    """서킷 브레이커 차단 상태 (장애 감지로 요청을 보내지 않고 즉시 실패)"""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        self.endpoint = endpoint
+        self.retry_after = retry_after  # 다음 복구 확인(half-open)까지 남은 시간(초)
+        super().__init__(
+            f"서킷 차단 중: {endpoint} ({retry_after:.1f}초 후 복구 확인)"
+        )
+
+
+class DeadlineExceededError(NetworkError):
+    """요청 기한 초과 (유량 제한 대기 시간 포함)"""
+
+    pass
@@ -0,0 +1,185 @@
+# src/systock/indicators.py
+"""
+스트리밍 지표 (종목별 상태를 배열로 관리, 갱신당 O(1))
+
+모든 지표는 종목 번호(int) 단위로 상태를 가지며,
+- update(idx, value) : idx에 정수 하나 또는 정수 배열을 넣어 한 번에 여러 종목을 갱신
+- value             : 전 종목의 현재 지표값 배열 (값이 준비되지 않은 종목은 NaN)
+종목 번호는 BarAggregator.index(symbol)로 얻거나 직접 관리합니다.
+"""
+# [선택] 라이브러리가 설치되어 있을 때만 import
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Indicator:
+    """스트리밍 지표 기본 클래스 (종목 수가 늘어나면 상태 배열을 자동 확장)"""
+
+    def __init__(self, capacity: int = 256):
+        if np is None:
+            raise ImportError("numpy 라이브러리가 필요합니다. (pip install numpy)")
+        self.capacity = 0
+        self._grow(max(1, capacity))
+
+    def _grow(self, capacity: int):
+        """상태 배열을 capacity 크기로 확장 (하위 클래스에서 구현)"""
+        self.capacity = capacity
+
+    def _ensure(self, idx):
+        top = int(idx) if np.ndim(idx) == 0 else int(np.max(idx)) if len(idx) else -1
+        if top >= self.capacity:
+            capacity = self.capacity
+            while capacity <= top:
+                capacity *= 2
+            self._grow(capacity)
+
+    @staticmethod
+    def _extend(arr, capacity: int, fill, dtype=None):
+        """기존 상태를 유지한 채 capacity 크기의 배열로 확장 (arr가 None이면 새로 생성)"""
+        new = np.full(capacity, fill, dtype=dtype or (arr.dtype if arr is not None else np.float64))
+        if arr is not None:
+            new[: len(arr)] = arr
+        return new
+
+    def update_bars(self, idx, open_, high, low, close, volume):
+        """완성된 봉으로 갱신 (BarAggregator.add_indicator 연동용, 기본: 종가 사용)"""
+        self.update(idx, close)
+
+
+class EMA(Indicator):
+    """지수이동평균 (첫 값으로 초기화)"""
+
+    def __init__(self, period: int, capacity: int = 256):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self._value = None
+        super().__init__(capacity)
+
+    def _grow(self, capacity: int):
+        self._value = self._extend(self._value, capacity, np.nan)
+        self.capacity = capacity
+
+    def update(self, idx, value):
+        self._ensure(idx)
+        prev = self._value[idx]
+        self._value[idx] = np.where(np.isnan(prev), value, prev + self.alpha * (value - prev))
+
+    @property
+    def value(self):
+        return self._value
+
+
+class VWAP(Indicator):
+    """거래량가중평균가 (reset() 전까지 누적, 보통 장 시작 시 초기화)"""
+
+    def __init__(self, capacity: int = 256):
+        self._pv = self._v = None
+        super().__init__(capacity)
+
+    def _grow(self, capacity: int):
+        self._pv = self._extend(self._pv, capacity, 0.0)
+        self._v = self._extend(self._v, capacity, 0.0)
+        self.capacity = capacity
+
+    def update(self, idx, price, volume):
+        """:param volume: 이번 갱신분 거래량 (누적 거래량이 아님)"""
+        self._ensure(idx)
+        self._pv[idx] += np.asarray(price, dtype=np.float64) * volume
+        self._v[idx] += volume
+
+    def update_bars(self, idx, open_, high, low, close, volume):
+        # 봉 단위는 대표가격 (고가+저가+종가)/3 사용
+        self.update(idx, (high + low + close) / 3.0, volume)
+
+    def reset(self, idx=None):
+        if idx is None:
+            self._pv[:] = 0.0
+            self._v[:] = 0.0
+        else:
+            self._pv[idx] = 0.0
+            self._v[idx] = 0.0
+
+    @property
+    def value(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self._v > 0, self._pv / self._v, np.nan)
+
+
+class RollingStd(Indicator):
+    """이동 표준편차 (최근 period개, 표본 표준편차)"""
+
+    def __init__(self, period: int, capacity: int = 256):
+        self.period = period
+        self._window = self._sum = self._sumsq = self._count = None
+        super().__init__(capacity)
+
+    def _grow(self, capacity: int):
+        window = np.zeros((capacity, self.period))
+        if self._window is not None:
+            window[: len(self._window)] = self._window
+        self._sum = self._extend(self._sum, capacity, 0.0)
+        self._sumsq = self._extend(self._sumsq, capacity, 0.0)
+        self._count = self._extend(self._count, capacity, 0, np.int64)
+        self._window = window
+        self.capacity = capacity
+
+    def update(self, idx, value):
+        self._ensure(idx)
+        value = np.asarray(value, dtype=np.float64)
+        pos = self._count[idx] % self.period
+        # 창이 가득 찼으면 가장 오래된 값을 빼고 새 값을 더함 (O(1))
+        old = np.where(self._count[idx] >= self.period, self._window[idx, pos], 0.0)
+        self._window[idx, pos] = value
+        self._sum[idx] += value - old
+        self._sumsq[idx] += value * value - old * old
+        self._count[idx] += 1
+
+    @property
+    def value(self):
+        n = np.minimum(self._count, self.period).astype(np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var = (self._sumsq - self._sum * self._sum / n) / (n - 1)
+        return np.where(n >= 2, np.sqrt(np.maximum(var, 0.0)), np.nan)
+
+
+class RSI(Indicator):
+    """상대강도지수 (Wilder 평활, 처음 period개 변화량은 단순평균으로 시작)"""
+
+    def __init__(self, period: int = 14, capacity: int = 256):
+        self.period = period
+        self._prev = self._gain = self._loss = self._count = None
+        super().__init__(capacity)
+
+    def _grow(self, capacity: int):
+        self._prev = self._extend(self._prev, capacity, np.nan)
+        self._gain = self._extend(self._gain, capacity, 0.0)
+        self._loss = self._extend(self._loss, capacity, 0.0)
+        self._count = self._extend(self._count, capacity, 0, np.int64)
+        self.capacity = capacity
+
+    def update(self, idx, value):
+        self._ensure(idx)
+        value = np.asarray(value, dtype=np.float64)
+        prev = self._prev[idx]
+        has_prev = ~np.isnan(prev)
+        diff = np.where(has_prev, value - prev, 0.0)
+        gain = np.maximum(diff, 0.0)
+        loss = np.maximum(-diff, 0.0)
+
+        # 변화량 개수(count)가 period 이하이면 누적 평균, 이후 Wilder 평활
+        count = self._count[idx] + has_prev
+        weight = np.where(count <= self.period, 1.0 / np.maximum(count, 1), 1.0 / self.period)
+        self._gain[idx] += np.where(has_prev, (gain - self._gain[idx]) * weight, 0.0)
+        self._loss[idx] += np.where(has_prev, (loss - self._loss[idx]) * weight, 0.0)
+        self._count[idx] = count
+        self._prev[idx] = value
+
+    @property
+    def value(self):
+        gain, loss = self._gain, self._loss
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rsi = np.where(loss > 0, 100.0 - 100.0 / (1.0 + gain / loss), 100.0)
+        rsi = np.where((gain == 0) & (loss == 0), 50.0, rsi)
+        return np.where(self._count >= self.period, rsi, np.nan)
@@ -1,7 +1,7 @@
 # src/systock/interfaces/broker.py
 from __future__ import annotations  # [중요] 타입 힌트 지연 평가 (Python 3.7+)
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List  # [수정] List 추가
+from typing import TYPE_CHECKING, Dict, List  # [수정] List 추가
 
 # 런타임에 필요한 공통 모듈 (순환 참조 위험 없음)
 from ..models import Order, Quote, Balance
@@ -48,6 +48,31 @@ class Broker(ABC):
         """
         pass
 
+    # [추가] 주문 정정
+    @abstractmethod
+    def modify(self, order_id: str, price: int = None, qty: int = None, order_type: str = "지정가") -> Order:
+        """
+        미체결 주문의 가격/수량 정정
+        :param price: 정정 가격 (생략 시 원주문 가격 유지)
+        :param qty: 정정 수량 (생략 시 미체결 잔량 전부)
+        :return: 정정 주문 (증권사에 따라 새 주문번호)
+        """
+        pass
+
+    def modify_many(self, changes, order_type: str = "지정가") -> Dict[str, Order]:
+        """
+        여러 미체결 주문 일괄 정정 (기본 구현: modify() 순차 호출)
+        :param changes: {원주문번호: 정정가격} 또는 [(원주문번호, 정정가격[, 정정수량]), ...]
+        :return: {원주문번호: 정정 주문}
+        """
+        items = changes.items() if isinstance(changes, dict) else changes
+        modified = {}
+        for item in items:
+            order_id, price = item[0], item[1]
+            qty = item[2] if len(item) > 2 else None
+            modified[order_id] = self.modify(order_id, price, qty, order_type)
+        return modified
+
     # [내부 구현용 추상 메서드]
     @abstractmethod
     def _fetch_price(self, symbol: str) -> Quote:
@@ -0,0 +1,301 @@
+# src/systock/loadsim.py
+import time
+import heapq
+import random
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Union
+
+from .clock import VirtualClock
+from .utils import RateLimiter, AdaptiveRateLimiter
+
+# 지연 시간: 고정값(초) 또는 rng를 받아 초를 돌려주는 함수
+Latency = Union[float, Callable[[random.Random], float]]
+
+
+@dataclass
+class Workload:
+    """시뮬레이션 부하 정의 (add_polling/add_burst/add_paging으로 생성)"""
+
+    name: str
+    kind: str  # 'polling', 'burst', 'paging'
+    account: str
+    process: int = 0
+    latency: Latency = 0.05
+    timeout: Optional[float] = None  # 요청 기한 (유량 제한 대기 포함, None이면 무제한)
+    retry: bool = True  # 유량 초과 시 재시도 (조회성 요청)
+    workers: int = 1  # polling: 동시 작업자 수
+    think: float = 0.0  # polling: 응답 후 다음 요청까지 간격
+    every: float = 60.0  # burst/paging: 반복 주기
+    offset: float = 0.0  # burst/paging: 첫 발생 시각
+    count: int = 1  # burst: 한 번에 보내는 요청 수 / paging: 페이지 수
+
+    # 집계
+    delays: List[float] = field(default_factory=list, repr=False)
+    completed: int = 0
+    misses: int = 0
+    throttled: int = 0
+
+
+@dataclass
+class _Request:
+    workload: Workload
+    arrival: float
+    on_done: Optional[Callable[[float], None]] = None
+    attempts: int = 0
+    throttled: bool = False
+
+
+class _Account:
+    """계좌 = 서버 측 유량 한도 1개 + 프로세스별 RateLimiter"""
+
+    def __init__(self, limiters: List[RateLimiter], server_limit: int, period: float):
+        self.limiters = limiters
+        self.free_at = [0.0] * len(limiters)  # 프로세스별 limiter 락이 풀리는 시각
+        self.server_limit = server_limit
+        self.period = period
+        self.window: Deque[float] = deque()  # 서버가 받아들인 호출 시각 (슬라이딩 윈도)
+        self.calls = 0
+        self.violations = 0
+
+
+def _percentile(sorted_values: List[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, int(round(p / 100 * (len(sorted_values) - 1)))))
+    return sorted_values[k]
+
+
+class LoadSimulator:
+    """
+    가상 시계 기반 유량 제한 시뮬레이터 (용량 계획용)
+    - 실제 RateLimiter/AdaptiveRateLimiter 코드를 VirtualClock으로 구동하므로
+      1시간 분량의 부하도 수 초 안에 재현합니다.
+    - 사건(요청 도착/전송/응답)을 시각 순으로 처리하는 이산 사건 시뮬레이션입니다.
+      같은 limiter를 기다리는 요청들은 도착 순서대로 처리됩니다. (락 대기를 FIFO로 근사)
+    - 서버 측 한도(server_limit/period)를 넘는 호출은 유량 초과(EGW00201)로 처리되어
+      limiter.on_throttle()이 호출되고, 조회성 요청은 period(+지터)만큼 쉰 뒤 최대 THROTTLE_RETRIES회 재시도합니다.
+      (KisBroker.request()와 같은 방식)
+
+    사용 예:
+        sim = LoadSimulator(duration=3600)
+        sim.add_account("main", max_calls=20)
+        sim.add_polling("quotes", "main", workers=8, latency=0.05)
+        sim.add_burst("orders", "main", every=60, count=10, timeout=1.0, retry=False)
+        sim.add_paging("balance", "main", every=30, count=5)
+        report = sim.run()
+        report["workloads"]["orders"]["delay_p99"]
+    """
+
+    THROTTLE_RETRIES = 3
+    THROTTLE_JITTER = 0.5
+
+    def __init__(self, duration: float = 3600.0, seed: int = 0):
+        """
+        :param duration: 시뮬레이션 시간 (초, 이후 새 요청은 만들지 않음)
+        :param seed: 지연 시간 난수 시드
+        """
+        self.duration = float(duration)
+        self.clock = VirtualClock()
+        self.rng = random.Random(seed)
+        self.accounts: Dict[str, _Account] = {}
+        self.workloads: Dict[str, Workload] = {}
+
+        self._events: list = []
+        self._seq = 0
+
+    # -----------------------------------------------------------
+    # 구성
+    # -----------------------------------------------------------
+    def add_account(
+        self,
+        name: str,
+        max_calls: int = 20,
+        period: float = 1.0,
+        server_limit: int = None,
+        processes: int = 1,
+        adaptive: bool = True,
+    ):
+        """
+        :param max_calls: 프로세스별 limiter 설정값 (KisBroker 실전 기본값 20)
+        :param server_limit: 서버가 허용하는 period당 호출 수 (기본값: max_calls)
+        :param processes: 같은 계좌를 쓰는 프로세스 수 (프로세스마다 limiter가 따로 있음)
+        :param adaptive: AdaptiveRateLimiter 사용 여부 (KisBroker 기본값)
+        """
+        cls = AdaptiveRateLimiter if adaptive else RateLimiter
+        limiters = [cls(max_calls, period, clock=self.clock) for _ in range(processes)]
+        self.accounts[name] = _Account(
+            limiters, server_limit if server_limit is not None else max_calls, period
+        )
+
+    def _add(self, workload: Workload) -> Workload:
+        if workload.account not in self.accounts:
+            raise ValueError(f"등록되지 않은 계좌입니다: {workload.account}")
+        if workload.process >= len(self.accounts[workload.account].limiters):
+            raise ValueError(f"프로세스 번호가 범위를 벗어났습니다: {workload.process}")
+        self.workloads[workload.name] = workload
+        return workload
+
+    def add_polling(self, name: str, account: str, workers: int = 1, think: float = 0.0, **options) -> Workload:
+        """작업자 workers개가 응답을 받을 때마다 think초 후 다음 요청 (시세 폴링 등)"""
+        return self._add(Workload(name, "polling", account, workers=workers, think=think, **options))
+
+    def add_burst(self, name: str, account: str, every: float = 60.0, count: int = 10, **options) -> Workload:
+        """every초마다 count건을 동시에 요청 (주문 몰림 등)"""
+        return self._add(Workload(name, "burst", account, every=every, count=count, **options))
+
+    def add_paging(self, name: str, account: str, every: float = 60.0, count: int = 5, **options) -> Workload:
+        """every초마다 count페이지를 순차 조회 (잔고/미체결 연속 조회 등)"""
+        return self._add(Workload(name, "paging", account, every=every, count=count, **options))
+
+    # -----------------------------------------------------------
+    # 사건 처리
+    # -----------------------------------------------------------
+    def _push(self, t: float, fn: Callable[[float], None]):
+        self._seq += 1
+        heapq.heappush(self._events, (t, self._seq, fn))
+
+    def _latency(self, workload: Workload) -> float:
+        latency = workload.latency
+        return latency(self.rng) if callable(latency) else latency
+
+    def _submit(self, t: float, workload: Workload, on_done: Callable[[float], None] = None):
+        req = _Request(workload, t, on_done)
+        self._push(t, lambda now: self._arrive(now, req))
+
+    def _arrive(self, now: float, req: _Request):
+        w = req.workload
+        account = self.accounts[w.account]
+        limiter = account.limiters[w.process]
+
+        # 앞선 요청이 limiter 락을 잡고 대기 중이면 그 이후에 차례가 옴
+        start = max(now, account.free_at[w.process])
+        self.clock.now = start
+        timeout = None if w.timeout is None else w.timeout - (start - req.arrival)
+        ok = timeout is None or timeout > 0
+        if ok:
+            ok = limiter.wait(timeout=timeout)
+        granted = self.clock.now
+        account.free_at[w.process] = granted
+
+        if not ok:
+            w.misses += 1
+            self._finish(granted, req)
+            return
+        w.delays.append(granted - req.arrival)
+        self._push(granted, lambda t: self._send(t, req))
+
+    def _send(self, now: float, req: _Request):
+        account = self.accounts[req.workload.account]
+        window = account.window
+        while window and window[0] <= now - account.period:
+            window.popleft()
+        account.calls += 1
+        req.throttled = len(window) >= account.server_limit
+        if req.throttled:
+            account.violations += 1
+        else:
+            window.append(now)
+        self._push(now + self._latency(req.workload), lambda t: self._respond(t, req))
+
+    def _respond(self, now: float, req: _Request):
+        w = req.workload
+        account = self.accounts[w.account]
+        limiter = account.limiters[w.process]
+        self.clock.now = now
+        if req.throttled:
+            w.throttled += 1
+            limiter.on_throttle()
+            if w.retry and req.attempts < self.THROTTLE_RETRIES:
+                req.attempts += 1
+                req.throttled = False
+                backoff = account.period * (1 + self.rng.random() * self.THROTTLE_JITTER)
+                self._push(now + backoff, lambda t: self._arrive(t, req))
+                return
+        else:
+            limiter.on_success()
+            w.completed += 1
+        self._finish(now, req)
+
+    def _finish(self, now: float, req: _Request):
+        if req.on_done is not None:
+            req.on_done(now)
+
+    # -----------------------------------------------------------
+    # 부하 생성
+    # -----------------------------------------------------------
+    def _schedule(self, w: Workload):
+        if w.kind == "polling":
+            def _loop(t: float):
+                if t < self.duration:
+                    self._submit(t, w, on_done=lambda done: _loop(done + w.think))
+
+            for _ in range(w.workers):
+                _loop(w.offset)
+
+        elif w.kind == "burst":
+            t = w.offset
+            while t < self.duration:
+                for _ in range(w.count):
+                    self._submit(t, w)
+                t += w.every
+
+        elif w.kind == "paging":
+            def _page(t: float, remaining: int):
+                if remaining > 0:
+                    self._submit(t, w, on_done=lambda done: _page(done, remaining - 1))
+
+            t = w.offset
+            while t < self.duration:
+                _page(t, w.count)
+                t += w.every
+
+    def run(self) -> dict:
+        """
+        시뮬레이션 실행
+        :return: {'wall_ms', 'sim_seconds', 'accounts': {...}, 'workloads': {...}}
+          - accounts: calls(서버 도달 호출 수), rate(초당), violations(서버 한도 초과 건수), limiter 지표
+          - workloads: completed, throughput(초당), delay_p50/p95/p99/max(유량 제한 대기, 초),
+            misses(기한 초과), throttled(유량 초과 응답)
+        """
+        started = time.perf_counter()
+        for w in self.workloads.values():
+            self._schedule(w)
+
+        events = self._events
+        end = 0.0
+        while events:
+            t, _, fn = heapq.heappop(events)
+            end = max(end, t)
+            fn(t)
+
+        sim_seconds = max(end, self.duration)
+        report = {
+            "wall_ms": (time.perf_counter() - started) * 1000,
+            "sim_seconds": sim_seconds,
+            "accounts": {},
+            "workloads": {},
+        }
+        for name, account in self.accounts.items():
+            info = {
+                "calls": account.calls,
+                "rate": account.calls / sim_seconds if sim_seconds else 0.0,
+                "violations": account.violations,
+            }
+            if isinstance(account.limiters[0], AdaptiveRateLimiter):
+                info["limiters"] = [limiter.metrics() for limiter in account.limiters]
+            report["accounts"][name] = info
+
+        for name, w in self.workloads.items():
+            delays = sorted(w.delays)
+            report["workloads"][name] = {
+                "completed": w.completed,
+                "throughput": w.completed / sim_seconds if sim_seconds else 0.0,
+                "delay_p50": _percentile(delays, 50),
+                "delay_p95": _percentile(delays, 95),
+                "delay_p99": _percentile(delays, 99),
+                "delay_max": delays[-1] if delays else 0.0,
+                "misses": w.misses,
+                "throttled": w.throttled,
+            }
+        return report
@@ -1,14 +1,61 @@
 import os
+import json
+import queue
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime
 
+# 구조화 로그(JSON)에 포함할 extra 필드
+# 예: logger.info("주문 접수", extra={"tr_id": "TTTC0802U", "order_id": "0001", "latency_ms": 12.3})
+STRUCTURED_FIELDS = ("tr_id", "order_id", "symbol", "latency_ms")
 
-def setup_logger(name: str = "systock") -> logging.Logger:
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 하나의 JSON 객체로 기록하는 포맷터"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created).strftime(
+                "%Y-%m-%d %H:%M:%S.%f"
+            )[:-3],
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key in STRUCTURED_FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                data[key] = value
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    호출 스레드에서 메시지 포맷팅을 하지 않는 QueueHandler
+    - 기본 QueueHandler.prepare()는 호출 스레드에서 format()을 수행하므로,
+      레코드를 그대로 넘겨 포맷팅까지 백그라운드 스레드에서 처리합니다.
+    - 같은 프로세스 내 큐 전용이므로 레코드 직렬화가 필요 없습니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logger(
+    name: str = "systock",
+    use_queue: bool = False,
+    json_format: bool = False,
+    log_dir: str = "logs",
+) -> logging.Logger:
     """
     애플리케이션 전역 로거 설정
     - 콘솔: INFO 레벨 (간단한 정보)
     - 파일: DEBUG 레벨 (상세 정보, 날짜별 자동 회전)
+    :param use_queue: True면 호출 스레드는 큐에 넣기만 하고, 백그라운드 스레드가 콘솔/파일에 기록
+    :param json_format: True면 파일 로그를 JSON(tr_id, order_id, latency_ms 등 포함)으로 기록
     """
     logger = logging.getLogger(name)
 
@@ -28,17 +75,16 @@ def setup_logger(name: str = "systock") -> logging.Logger:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
     # 3. 파일 핸들러 (기록 저장용)
     # logs 폴더가 없으면 생성
-    log_dir = "logs"
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
 
     # 날짜별로 파일 분리 (매일 자정에 새로운 파일 생성)
     today = datetime.now().strftime("%Y-%m-%d")
-    filename = f"{log_dir}/systock_{today}.log"
+    ext = "jsonl" if json_format else "log"
+    filename = f"{log_dir}/systock_{today}.{ext}"
 
     file_handler = TimedRotatingFileHandler(
         filename=filename,
@@ -48,7 +94,27 @@ def setup_logger(name: str = "systock") -> logging.Logger:
         encoding="utf-8",
     )
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    file_handler.setFormatter(JsonFormatter() if json_format else formatter)
+
+    if not use_queue:
+        logger.addHandler(console_handler)
+        logger.addHandler(file_handler)
+        return logger
+
+    # 4. [추가] 큐 모드: 포맷팅/파일 I/O를 백그라운드 스레드로 분리
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+
+    def _stop_listener():
+        # 이미 수동으로 stop()한 경우 중복 종료 방지
+        if listener._thread is not None:
+            listener.stop()
+
+    atexit.register(_stop_listener)  # 종료 시 남은 로그 기록
 
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+    logger.listener = listener  # 필요 시 logger.listener.stop()으로 수동 종료
     return logger
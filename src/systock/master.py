@@ -0,0 +1,367 @@
+# src/systock/master.py
+import os
+import io
+import json
+import mmap
+import struct
+import bisect
+import hashlib
+import logging
+import zipfile
+from typing import Dict, List, Optional, Tuple
+
+from .models import StockInfo
+from .exceptions import ValidationError
+
+# KIS 종목 마스터 파일 다운로드 주소
+KIS_MASTER_URLS = {
+    "KOSPI": "https://new.real.download.dws.co.kr/common/master/kospi_code.mst.zip",
+    "KOSDAQ": "https://new.real.download.dws.co.kr/common/master/kosdaq_code.mst.zip",
+}
+
+# 마스터 파일 한 줄의 뒷부분 고정폭 영역 길이 (줄바꿈 포함, KIS 샘플 코드 기준)
+KIS_MASTER_TAIL_LEN = {"KOSPI": 228, "KOSDAQ": 222}
+
+# 인덱스 파일 포맷
+# - 헤더: MAGIC(4) + VERSION(2) + 레코드 수(4) + 메타 길이(4) + 메타(JSON)
+# - 본문: 종목코드 순으로 정렬된 고정폭 레코드
+# - 꼬리: 종목명 순 정렬 인덱스 (레코드 번호 uint32 배열)
+_MAGIC = b"SYMS"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHII")
+_NAME_BYTES = 96
+_RECORD = struct.Struct(f"<9s1s2s4s{_NAME_BYTES}s")
+_MARKET_CODES = {"KOSPI": b"K", "KOSDAQ": b"Q"}
+_MARKET_NAMES = {v: k for k, v in _MARKET_CODES.items()}
+
+# 가격제한폭 (전일 기준가 대비 ±30%)
+PRICE_LIMIT_RATE = 0.30
+
+# 주권 호가단위 (2023년 이후 유가/코스닥 공통) - (가격 상한 미만, 호가단위)
+_STOCK_TICKS = [
+    (2_000, 1),
+    (5_000, 5),
+    (20_000, 10),
+    (50_000, 50),
+    (200_000, 100),
+    (500_000, 500),
+]
+# ETF/ETN 등 상장지수상품 그룹코드 (2,000원 미만 1원, 이상 5원)
+_ETP_GROUPS = {"EF", "EN", "FE"}
+
+
+def tick_size(price: int, group: str = "ST") -> int:
+    """가격대별 호가단위"""
+    if group in _ETP_GROUPS:
+        return 1 if price < 2_000 else 5
+    for upper, tick in _STOCK_TICKS:
+        if price < upper:
+            return tick
+    return 1_000
+
+
+def round_to_tick(price: float, group: str = "ST", up: bool = False) -> int:
+    """가격을 호가단위에 맞춰 내림(기본) 또는 올림"""
+    price = int(price)
+    tick = tick_size(price, group)
+    rem = price % tick
+    if rem == 0:
+        return price
+    return price - rem + tick if up else price - rem
+
+
+def price_limits(base_price: int, group: str = "ST") -> Tuple[int, int]:
+    """
+    가격제한폭 계산 (하한가, 상한가)
+    - 기준가 ±30%를 호가단위로 안쪽 반올림합니다.
+    """
+    lower = round_to_tick(base_price * (1 - PRICE_LIMIT_RATE), group, up=True)
+    upper = round_to_tick(base_price * (1 + PRICE_LIMIT_RATE), group)
+    return lower, upper
+
+
+def parse_master_file(path: str, market: str) -> List[StockInfo]:
+    """KIS 종목 마스터 파일(.mst) 파싱"""
+    tail = KIS_MASTER_TAIL_LEN[market]
+    items = []
+
+    with open(path, "r", encoding="cp949") as f:
+        for row in f:
+            if len(row) <= tail:
+                continue
+            head, body = row[: len(row) - tail], row[-tail:]
+            items.append(
+                StockInfo(
+                    symbol=head[0:9].rstrip(),
+                    name=head[21:].strip(),
+                    market=market,
+                    group=body[0:2],
+                    sector=body[3:7].strip(),
+                )
+            )
+    return items
+
+
+def download_master_files(dest_dir: str = ".") -> Dict[str, str]:
+    """
+    KIS 종목 마스터 파일 다운로드 및 압축 해제
+    :return: {'KOSPI': 'dest/kospi_code.mst', 'KOSDAQ': ...}
+    """
+    import requests
+
+    os.makedirs(dest_dir, exist_ok=True)
+    paths = {}
+    for market, url in KIS_MASTER_URLS.items():
+        resp = requests.get(url, timeout=30)
+        resp.raise_for_status()
+        with zipfile.ZipFile(io.BytesIO(resp.content)) as zf:
+            name = zf.namelist()[0]
+            zf.extract(name, dest_dir)
+        paths[market] = os.path.join(dest_dir, name)
+    return paths
+
+
+class StockMaster:
+    """
+    종목 마스터 인덱스
+    - .mst 원본을 고정폭 바이너리 인덱스로 변환하여 메모리 맵(mmap)으로 읽습니다.
+    - 원본 파일 내용(SHA1)이 바뀐 경우에만 인덱스를 재생성합니다.
+    - 종목코드 조회 O(1), 코드/종목명 접두어 검색 O(log n)
+
+    사용 예:
+        master = StockMaster({"KOSPI": "kospi_code.mst", "KOSDAQ": "kosdaq_code.mst"})
+        master.get("005930").name
+    """
+
+    def __init__(self, sources: Dict[str, str], index_path: str = "systock_master.idx"):
+        """
+        :param sources: {'KOSPI': 파일경로, 'KOSDAQ': 파일경로}
+        :param index_path: 바이너리 인덱스 저장 경로
+        """
+        for market in sources:
+            if market not in KIS_MASTER_TAIL_LEN:
+                raise ValueError(f"지원하지 않는 시장입니다: {market}")
+
+        self.sources = dict(sources)
+        self.index_path = index_path
+        self.logger = logging.getLogger("systock.master")
+
+        self._file = None
+        self._mm: Optional[mmap.mmap] = None
+        self._count = 0
+        self._body_offset = 0
+        self._name_offset = 0
+        self._codes: List[str] = []
+        self._positions: Dict[str, int] = {}
+
+        self._open()
+
+    # -----------------------------------------------------------
+    # 인덱스 생성/로드
+    # -----------------------------------------------------------
+    def _signature(self) -> Dict[str, str]:
+        sig = {}
+        for market, path in sorted(self.sources.items()):
+            h = hashlib.sha1()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+            sig[market] = h.hexdigest()
+        return sig
+
+    def _read_meta(self) -> Optional[dict]:
+        if not os.path.exists(self.index_path):
+            return None
+        try:
+            with open(self.index_path, "rb") as f:
+                magic, version, _, meta_len = _HEADER.unpack(f.read(_HEADER.size))
+                if magic != _MAGIC or version != _VERSION:
+                    return None
+                return json.loads(f.read(meta_len))
+        except (OSError, struct.error, ValueError):
+            return None
+
+    def _build(self, signature: Dict[str, str]):
+        items: Dict[str, StockInfo] = {}
+        for market, path in self.sources.items():
+            for info in parse_master_file(path, market):
+                items[info.symbol] = info
+
+        ordered = sorted(items.values(), key=lambda x: x.symbol)
+        by_name = sorted(range(len(ordered)), key=lambda i: ordered[i].name)
+
+        meta = json.dumps({"sources": signature}).encode()
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(ordered), len(meta)))
+            f.write(meta)
+            for info in ordered:
+                name = info.name.encode("utf-8")[:_NAME_BYTES]
+                f.write(
+                    _RECORD.pack(
+                        info.symbol.encode("ascii", "ignore"),
+                        _MARKET_CODES[info.market],
+                        info.group.encode("ascii", "ignore"),
+                        info.sector.encode("ascii", "ignore"),
+                        name.decode("utf-8", "ignore").encode("utf-8"),
+                    )
+                )
+            f.write(struct.pack(f"<{len(by_name)}I", *by_name))
+        os.replace(tmp_path, self.index_path)
+
+        self.logger.info(f"종목 마스터 인덱스 생성 완료 ({len(ordered)}종목)")
+
+    def _open(self):
+        signature = self._signature()
+        meta = self._read_meta()
+        if meta is None or meta.get("sources") != signature:
+            self._build(signature)
+
+        self.close()
+        self._file = open(self.index_path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        _, _, self._count, meta_len = _HEADER.unpack_from(self._mm, 0)
+        self._body_offset = _HEADER.size + meta_len
+        self._name_offset = self._body_offset + self._count * _RECORD.size
+
+        # 종목코드 -> 레코드 번호 (O(1) 조회용)
+        size = _RECORD.size
+        base = self._body_offset
+        self._codes = [
+            self._mm[base + i * size : base + i * size + 9].rstrip(b"\x00").decode()
+            for i in range(self._count)
+        ]
+        self._positions = {code: i for i, code in enumerate(self._codes)}
+
+    def reload(self) -> bool:
+        """원본이 바뀌었으면 인덱스를 재생성합니다. (재생성 여부 반환)"""
+        before = self._read_meta()
+        self._open()
+        return before != self._read_meta()
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # -----------------------------------------------------------
+    # 조회
+    # -----------------------------------------------------------
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._positions
+
+    def _record(self, i: int) -> StockInfo:
+        code, market, group, sector, name = _RECORD.unpack_from(
+            self._mm, self._body_offset + i * _RECORD.size
+        )
+        return StockInfo(
+            symbol=code.rstrip(b"\x00").decode(),
+            name=name.rstrip(b"\x00").decode("utf-8", "ignore"),
+            market=_MARKET_NAMES.get(market, ""),
+            group=group.decode(),
+            sector=sector.rstrip(b"\x00").decode(),
+        )
+
+    def _name_at(self, rank: int) -> str:
+        (i,) = struct.unpack_from("<I", self._mm, self._name_offset + rank * 4)
+        start = self._body_offset + i * _RECORD.size + _RECORD.size - _NAME_BYTES
+        return self._mm[start : start + _NAME_BYTES].rstrip(b"\x00").decode("utf-8", "ignore")
+
+    def get(self, symbol: str) -> Optional[StockInfo]:
+        """종목코드로 조회 (O(1))"""
+        i = self._positions.get(symbol)
+        return None if i is None else self._record(i)
+
+    def name(self, symbol: str) -> str:
+        """종목명 조회 (없으면 빈 문자열)"""
+        info = self.get(symbol)
+        return info.name if info else ""
+
+    def search_code(self, prefix: str, limit: int = 20) -> List[StockInfo]:
+        """종목코드 접두어 검색"""
+        start = bisect.bisect_left(self._codes, prefix)
+        result = []
+        for i in range(start, min(start + limit, self._count)):
+            if not self._codes[i].startswith(prefix):
+                break
+            result.append(self._record(i))
+        return result
+
+    def search(self, query: str, limit: int = 20) -> List[StockInfo]:
+        """
+        종목명 검색
+        - 접두어 일치 종목을 먼저(이진 탐색), 이후 부분 일치 종목을 반환합니다.
+        """
+        # 1. 접두어 일치 (종목명 정렬 인덱스 이진 탐색)
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._name_at(mid) < query:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        result, seen = [], set()
+        rank = lo
+        while rank < self._count and len(result) < limit:
+            if not self._name_at(rank).startswith(query):
+                break
+            (i,) = struct.unpack_from("<I", self._mm, self._name_offset + rank * 4)
+            result.append(self._record(i))
+            seen.add(i)
+            rank += 1
+
+        # 2. 부분 일치 (mmap 바이트 검색)
+        needle = query.encode("utf-8")
+        name_start = _RECORD.size - _NAME_BYTES
+        pos = self._mm.find(needle, self._body_offset, self._name_offset)
+        while pos != -1 and len(result) < limit:
+            i = (pos - self._body_offset) // _RECORD.size
+            offset_in_record = (pos - self._body_offset) % _RECORD.size
+            if offset_in_record >= name_start and i not in seen:
+                result.append(self._record(i))
+                seen.add(i)
+            next_record = self._body_offset + (i + 1) * _RECORD.size
+            pos = self._mm.find(needle, next_record, self._name_offset)
+
+        return result
+
+    # -----------------------------------------------------------
+    # 가격 검증
+    # -----------------------------------------------------------
+    def tick_size(self, symbol: str, price: int) -> int:
+        info = self.get(symbol)
+        return tick_size(price, info.group if info else "ST")
+
+    def price_limits(self, symbol: str, base_price: int) -> Tuple[int, int]:
+        info = self.get(symbol)
+        return price_limits(base_price, info.group if info else "ST")
+
+    def validate_price(self, symbol: str, price: int, base_price: int = None):
+        """
+        주문 가격 사전 검증 (API 호출 전)
+        - 호가단위 불일치, 가격제한폭(base_price 지정 시) 초과 시 ValidationError
+        """
+        info = self.get(symbol)
+        if info is None:
+            raise ValidationError(f"종목 마스터에 없는 종목코드입니다: {symbol}")
+
+        tick = tick_size(price, info.group)
+        if price <= 0 or price % tick != 0:
+            raise ValidationError(
+                f"호가단위 오류: {symbol} {price}원 (호가단위 {tick}원)"
+            )
+
+        if base_price:
+            lower, upper = price_limits(base_price, info.group)
+            if not lower <= price <= upper:
+                raise ValidationError(
+                    f"가격제한폭 초과: {symbol} {price}원 (허용 {lower}~{upper}원)"
+                )
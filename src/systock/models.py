@@ -1,12 +1,13 @@
-from dataclasses import dataclass
-from .constants import Side
+from dataclasses import dataclass, field
+from typing import List, Optional, Union
+from .constants import Side, OrderStatus
 
 
 @dataclass
 class Quote:
     """호가/현재가 정보 (symbol 제거됨)"""
 
-    price: int
+    price: Union[int, float]  # 국내주식은 원(int), 해외주식은 현지 통화 기준 float
     volume: int
     change: float  # 등락률
 
@@ -30,6 +31,7 @@ class Holding:
     name: str
     qty: int
     profit_rate: float
+    avg_price: float = 0.0  # [추가] 매입평균가격 (해외주식은 현지 통화 기준)
 
 
 @dataclass
@@ -39,3 +41,79 @@ class Balance:
     deposit: int
     total_asset: int
     holdings: list[Holding]
+
+
+@dataclass
+class OrderState:
+    """로컬에서 추적 중인 주문 상태"""
+
+    order_id: str
+    symbol: str
+    side: Optional[Side]
+    qty: int
+    price: int
+    filled_qty: int = 0
+    avg_fill_price: float = 0.0
+    status: OrderStatus = OrderStatus.OPEN
+    org_no: str = ""  # 한국거래소전송주문조직번호 (정정/취소 시 필요)
+    updated_at: float = field(default=0.0, repr=False)
+
+    @property
+    def remaining(self) -> int:
+        """미체결 잔량"""
+        return max(self.qty - self.filled_qty, 0)
+
+
+@dataclass
+class StockInfo:
+    """종목 마스터 정보"""
+
+    symbol: str
+    name: str
+    market: str  # 'KOSPI' / 'KOSDAQ'
+    group: str  # 증권그룹구분코드 (ST: 주권, EF: ETF, EN: ETN 등)
+    sector: str  # 지수업종 대분류 코드
+
+
+@dataclass
+class ScanResult:
+    """순위/스크리닝 조회 결과 (컬럼 단위로 보관, 같은 위치가 같은 종목)"""
+
+    kind: str  # 스캔 종류 (예: 'volume', 'fluctuation')
+    symbol: List[str] = field(default_factory=list)
+    name: List[str] = field(default_factory=list)
+    rank: List[int] = field(default_factory=list)
+    price: List[int] = field(default_factory=list)
+    change: List[float] = field(default_factory=list)  # 등락률
+    volume: List[int] = field(default_factory=list)
+    ts: float = 0.0  # 조회 시각 (epoch 초)
+
+    def __len__(self) -> int:
+        return len(self.symbol)
+
+    def take(self, indices: List[int]) -> "ScanResult":
+        """지정한 위치의 항목만 추린 결과"""
+        return ScanResult(
+            kind=self.kind,
+            symbol=[self.symbol[i] for i in indices],
+            name=[self.name[i] for i in indices],
+            rank=[self.rank[i] for i in indices],
+            price=[self.price[i] for i in indices],
+            change=[self.change[i] for i in indices],
+            volume=[self.volume[i] for i in indices],
+            ts=self.ts,
+        )
+
+    def rows(self) -> List[dict]:
+        """행 단위 변환 [{'symbol', 'name', 'rank', 'price', 'change', 'volume'}, ...]"""
+        return [
+            {
+                "symbol": self.symbol[i],
+                "name": self.name[i],
+                "rank": self.rank[i],
+                "price": self.price[i],
+                "change": self.change[i],
+                "volume": self.volume[i],
+            }
+            for i in range(len(self.symbol))
+        ]
@@ -0,0 +1,327 @@
+# src/systock/order_tracker.py
+import time
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Set
+
+from .models import Order, OrderState
+from .constants import Side, OrderStatus
+
+# KIS 실시간 체결통보(H0STCNI0) 필드 순서 ('^' 구분, 복호화된 본문 기준)
+KIS_EXECUTION_NOTICE_FIELDS = [
+    "CUST_ID", "ACNT_NO", "ODER_NO", "OODER_NO", "SELN_BYOV_CLS", "RCTF_CLS",
+    "ODER_KIND", "ODER_COND", "STCK_SHRN_ISCD", "CNTG_QTY", "CNTG_UNPR",
+    "STCK_CNTG_HOUR", "RFUS_YN", "CNTG_YN", "ACPT_YN", "BRNC_NO", "ODER_QTY",
+    "ACNT_NAME", "CNTG_ISNM", "CRDT_CLS", "CRDT_LOAN_DATE", "CNTG_ISNM40",
+    "ODER_PRC",
+]
+
+
+def parse_execution_notice(message: str) -> Dict[str, str]:
+    """체결통보 본문('^' 구분 문자열)을 필드명 딕셔너리로 변환"""
+    values = message.split("^")
+    return dict(zip(KIS_EXECUTION_NOTICE_FIELDS, values))
+
+
+class OrderTracker:
+    """
+    메모리 기반 주문 상태 추적기
+    - order()/cancel()/modify() 결과와 실시간 체결통보로 상태를 갱신합니다.
+    - 주문번호/종목코드 양쪽으로 인덱싱되어 조회가 O(1)입니다.
+    - 주기적으로 REST 미체결 조회 결과와 대사(reconcile)하여 누락을 보정합니다.
+    - 마지막 대사가 max_sync_age(초) 이내일 때만 로컬 상태를 신뢰합니다. (synced)
+    - 멀티 스레드 환경 안전 (Thread-Safe)
+    """
+
+    def __init__(self, max_sync_age: float = 60.0):
+        """
+        :param max_sync_age: 대사 결과를 신뢰하는 최대 경과 시간 (초, 주기 대사 시 주기의 2배 이상으로 자동 조정)
+        """
+        self.max_sync_age = max_sync_age
+        self._orders: Dict[str, OrderState] = {}
+        self._open_by_symbol: Dict[str, Set[str]] = {}
+        self._lock = threading.RLock()
+        self.logger = logging.getLogger("systock.orders")
+
+        self.version = 0  # 주문 상태가 바뀔 때마다 증가 (저장소의 변경 감지용)
+        self.last_synced_at: Optional[float] = None
+        self._sync_thread: Optional[threading.Thread] = None
+        self._sync_stop = threading.Event()
+
+    # -----------------------------------------------------------
+    # 조회
+    # -----------------------------------------------------------
+    @property
+    def synced(self) -> bool:
+        """최근(max_sync_age 이내)에 REST 대사를 수행하여 로컬 상태를 신뢰할 수 있는지 여부"""
+        synced_at = self.last_synced_at
+        return synced_at is not None and time.time() - synced_at <= self.max_sync_age
+
+    def get(self, order_id: str) -> Optional[OrderState]:
+        with self._lock:
+            return self._orders.get(order_id)
+
+    def open_orders(self, symbol: str = None) -> List[OrderState]:
+        """미체결 주문 목록 (symbol 지정 시 해당 종목만)"""
+        with self._lock:
+            if symbol is not None:
+                ids = self._open_by_symbol.get(symbol, ())
+            else:
+                ids = [i for s in self._open_by_symbol.values() for i in s]
+            return [self._orders[i] for i in ids]
+
+    # -----------------------------------------------------------
+    # 내부 상태 전이
+    # -----------------------------------------------------------
+    def _touch(self, state: OrderState):
+        state.updated_at = time.time()
+        self.version += 1
+
+    def _upsert(self, state: OrderState):
+        self._touch(state)
+        self._orders[state.order_id] = state
+        if state.status == OrderStatus.OPEN:
+            self._open_by_symbol.setdefault(state.symbol, set()).add(state.order_id)
+
+    def _close(self, order_id: str, status: OrderStatus) -> Optional[OrderState]:
+        state = self._orders.get(order_id)
+        if state is None:
+            return None
+        state.status = status
+        self._touch(state)
+        ids = self._open_by_symbol.get(state.symbol)
+        if ids is not None:
+            ids.discard(order_id)
+            if not ids:
+                del self._open_by_symbol[state.symbol]
+        return state
+
+    # -----------------------------------------------------------
+    # 갱신 (주문/취소/체결)
+    # -----------------------------------------------------------
+    def record_order(self, order: Order, org_no: str = ""):
+        """신규 주문 접수 기록"""
+        with self._lock:
+            if order.order_id in self._orders:
+                return
+            self._upsert(
+                OrderState(
+                    order_id=order.order_id,
+                    symbol=order.symbol,
+                    side=order.side,
+                    qty=order.qty,
+                    price=order.price,
+                    org_no=org_no,
+                )
+            )
+
+    def restore(self, states: List[OrderState]):
+        """
+        [추가] 저장된 주문 상태 복원 (재시작 직후 warm start용)
+        - 이미 추적 중인 주문은 덮어쓰지 않습니다.
+        - REST 대사 전까지는 synced가 False이므로 cancel()은 미체결 조회로 확인합니다.
+        """
+        with self._lock:
+            for state in states:
+                if state.order_id not in self._orders:
+                    self._upsert(state)
+
+    def record_cancel(self, order_id: str):
+        """취소 접수 기록"""
+        with self._lock:
+            self._close(order_id, OrderStatus.CANCELLED)
+
+    def record_replace(self, orig_id: str, order: Order, org_no: str = "", partial: bool = False):
+        """
+        정정 접수 기록 (정정 주문은 새 주문번호로 등록)
+        :param partial: 잔량 일부만 정정한 경우 True
+            - 전부 정정: 원주문은 REPLACED
+            - 일부 정정: 정정하지 않은 잔량이 원주문번호로 남으므로 원주문 수량만 줄이고 OPEN 유지
+        """
+        with self._lock:
+            if partial:
+                orig = self._orders.get(orig_id)
+                if orig is not None:
+                    orig.qty = max(orig.qty - order.qty, orig.filled_qty)
+                    self._touch(orig)
+                    if orig.remaining == 0:
+                        self._close(orig_id, OrderStatus.REPLACED)
+            else:
+                orig = self._close(orig_id, OrderStatus.REPLACED)
+            if order.order_id in self._orders:
+                return
+            self._upsert(
+                OrderState(
+                    order_id=order.order_id,
+                    symbol=order.symbol,
+                    side=order.side,
+                    qty=order.qty,
+                    price=order.price,
+                    org_no=org_no or (orig.org_no if orig else ""),
+                )
+            )
+
+    def apply_fill(self, order_id: str, qty: int, price: float):
+        """체결 반영 (부분체결 누적, 잔량 0이면 FILLED)"""
+        with self._lock:
+            state = self._orders.get(order_id)
+            if state is None:
+                self.logger.debug("알 수 없는 주문의 체결 통보 무시: %s", order_id)
+                return
+
+            total = state.filled_qty + qty
+            if total > 0:
+                state.avg_fill_price = (
+                    state.avg_fill_price * state.filled_qty + price * qty
+                ) / total
+            state.filled_qty = total
+            self._touch(state)
+
+            if state.remaining == 0:
+                self._close(order_id, OrderStatus.FILLED)
+
+    def apply_notice(self, notice: Dict[str, str]):
+        """
+        KIS 실시간 체결통보 반영
+        :param notice: parse_execution_notice() 결과
+        """
+        order_id = notice.get("ODER_NO", "")
+        if not order_id:
+            return
+
+        with self._lock:
+            # 1. 체결 (CNTG_YN: 2)
+            if notice.get("CNTG_YN") == "2":
+                self.apply_fill(
+                    order_id,
+                    int(notice.get("CNTG_QTY") or 0),
+                    float(notice.get("CNTG_UNPR") or 0),
+                )
+                return
+
+            # 2. 거부
+            if notice.get("RFUS_YN") == "1":
+                self._close(order_id, OrderStatus.REJECTED)
+                return
+
+            rctf_cls = notice.get("RCTF_CLS", "0")
+            orig_id = notice.get("OODER_NO", "")
+
+            # 3. 취소 확인: 원주문 종료
+            if rctf_cls == "2":
+                self._close(orig_id or order_id, OrderStatus.CANCELLED)
+                return
+
+            # 4. 정정 확인: 원주문은 대체 처리, 새 주문번호로 등록
+            orig = None
+            if rctf_cls == "1" and orig_id:
+                if order_id in self._orders:
+                    # modify()에서 이미 기록한 정정 (일부 정정이면 원주문 잔량이 남아 있으므로 그대로 둠)
+                    return
+                orig = self._close(orig_id, OrderStatus.REPLACED)
+
+            # 5. 접수 확인: 로컬에 없으면 통보 내용으로 등록
+            if order_id not in self._orders:
+                side_cd = notice.get("SELN_BYOV_CLS")
+                self._upsert(
+                    OrderState(
+                        order_id=order_id,
+                        symbol=notice.get("STCK_SHRN_ISCD", ""),
+                        side=Side.SELL if side_cd == "01" else Side.BUY,
+                        qty=int(notice.get("ODER_QTY") or 0),
+                        price=int(notice.get("ODER_PRC") or 0),
+                        org_no=orig.org_no if orig else notice.get("BRNC_NO", ""),
+                    )
+                )
+
+    # -----------------------------------------------------------
+    # REST 대사 (Reconciliation)
+    # -----------------------------------------------------------
+    def reconcile(self, rest_orders: List[dict], fetched_at: float = None):
+        """
+        REST 미체결 조회 결과(_fetch_open_orders)와 로컬 상태를 맞춥니다.
+        - 로컬에만 있는 미체결 주문: CLOSED 처리 (체결/취소 여부는 알 수 없음)
+        - REST에만 있는 주문: 로컬에 추가 (다른 프로세스/HTS 주문 등)
+        - 양쪽에 있는 주문: 잔량을 서버 기준으로 보정
+        - 조회 시작(fetched_at) 이후 로컬에서 생성/갱신된 주문은 조회 결과가 더 오래된 것이므로 건드리지 않습니다.
+        :param fetched_at: 미체결 조회를 시작한 시각 (time.time(), 생략 시 지금)
+        """
+        if fetched_at is None:
+            fetched_at = time.time()
+
+        with self._lock:
+            remote_ids = set()
+
+            for item in rest_orders:
+                order_id = item["odno"]
+                remaining = int(item["psbl_qty"])
+                remote_ids.add(order_id)
+
+                state = self._orders.get(order_id)
+                if state is not None and state.updated_at > fetched_at:
+                    continue
+                if state is None or state.status != OrderStatus.OPEN:
+                    side_cd = item.get("sll_buy_dvsn_cd")
+                    qty = int(item.get("ord_qty") or remaining)
+                    state = OrderState(
+                        order_id=order_id,
+                        symbol=item["pdno"],
+                        side=Side.SELL if side_cd == "01" else Side.BUY,
+                        qty=qty,
+                        price=int(float(item.get("ord_unpr") or 0)),
+                        filled_qty=qty - remaining,
+                        org_no=item.get("ord_gno_brno", ""),
+                    )
+                    self._upsert(state)
+                else:
+                    state.filled_qty = state.qty - remaining
+                    self._touch(state)
+
+            stale = [
+                order_id
+                for ids in self._open_by_symbol.values()
+                for order_id in ids
+                if order_id not in remote_ids and self._orders[order_id].updated_at <= fetched_at
+            ]
+            for order_id in stale:
+                self._close(order_id, OrderStatus.CLOSED)
+
+            # 로컬 상태는 조회 시작 시점 기준으로 확정됨
+            if self.last_synced_at is None or fetched_at > self.last_synced_at:
+                self.last_synced_at = fetched_at
+
+        if stale:
+            self.logger.debug("대사 결과 종료 처리된 주문: %s", stale)
+
+    def start_reconcile(
+        self, fetch_open_orders: Callable[[], List[dict]], interval: float = 30.0
+    ):
+        """백그라운드 스레드에서 주기적으로 REST 대사 수행 (즉시 1회 실행 후 반복)"""
+        if self._sync_thread and self._sync_thread.is_alive():
+            return
+
+        # 대사 주기보다 짧으면 주기 사이마다 synced가 풀리므로 조정
+        self.max_sync_age = max(self.max_sync_age, interval * 2)
+        self._sync_stop.clear()
+
+        def _loop():
+            while True:
+                try:
+                    fetched_at = time.time()
+                    self.reconcile(fetch_open_orders(), fetched_at=fetched_at)
+                except Exception as e:
+                    self.logger.warning("주문 대사 실패: %s", e)
+                if self._sync_stop.wait(interval):
+                    break
+
+        self._sync_thread = threading.Thread(
+            target=_loop, name="systock-order-sync", daemon=True
+        )
+        self._sync_thread.start()
+
+    def stop_reconcile(self):
+        """주기적 대사 중지"""
+        self._sync_stop.set()
+        if self._sync_thread:
+            self._sync_thread.join(timeout=5)
+            self._sync_thread = None
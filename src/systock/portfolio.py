@@ -0,0 +1,234 @@
+# src/systock/portfolio.py
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+
+# [선택] 라이브러리가 설치되어 있을 때만 import
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .models import Balance, Quote
+from .constants import Side
+
+
+class Portfolio:
+    """
+    실시간 포트폴리오 평가기
+    - 보유 수량/평균단가/최근가를 종목별 배열로 보관하고, 시세가 들어올 때마다 평가합니다.
+    - 평가손익, 익스포저, 집중도를 전 종목에 대해 벡터 연산으로 계산하므로
+      위험 점검에 API 호출이 필요 없습니다.
+    - 시세 반영/체결 시 change_listeners에 등록한 콜백을 호출합니다.
+
+    사용 예:
+        pf = Portfolio()
+        pf.sync(broker)                     # 잔고로 초기화 (보유수량, 매입평균가)
+        pf.attach(broker)                   # 시세 조회 결과로 자동 평가
+        pf.apply_fill("005930", Side.BUY, 10, 60000)
+        pf.summary()                        # 평가금액, 손익, 익스포저, 집중도
+    """
+
+    def __init__(self, capacity: int = 256):
+        if np is None:
+            raise ImportError("numpy 라이브러리가 필요합니다. (pip install numpy)")
+
+        self.symbols: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._qty = np.zeros(capacity)
+        self._avg = np.zeros(capacity)
+        self._price = np.full(capacity, np.nan)  # 최근가 (시세 수신 전에는 NaN → 평균단가로 평가)
+        self._size = 0
+
+        self.cash = 0.0
+        self.realized_pnl = 0.0
+        # 변경 콜백: callback(symbol, position_dict)
+        self.change_listeners: List[Callable[[str, dict], None]] = []
+        self._lock = threading.Lock()
+
+    # -----------------------------------------------------------
+    # 종목 관리
+    # -----------------------------------------------------------
+    def index(self, symbol: str) -> int:
+        """종목 번호 (처음 보는 종목이면 등록)"""
+        i = self._index.get(symbol)
+        if i is None:
+            i = self._size
+            if i >= len(self._qty):
+                n = len(self._qty) * 2
+                self._qty = np.concatenate([self._qty, np.zeros(n - len(self._qty))])
+                self._avg = np.concatenate([self._avg, np.zeros(n - len(self._avg))])
+                self._price = np.concatenate([self._price, np.full(n - len(self._price), np.nan)])
+            self._index[symbol] = i
+            self.symbols.append(symbol)
+            self._size += 1
+        return i
+
+    def load(self, balance: Balance):
+        """잔고로 보유 현황 초기화 (기존 보유 정보는 덮어씀, 최근가는 유지)"""
+        with self._lock:
+            self._qty[:] = 0.0
+            self._avg[:] = 0.0
+            for h in balance.holdings:
+                i = self.index(h.symbol)
+                self._qty[i] = h.qty
+                self._avg[i] = h.avg_price
+            self.cash = float(balance.deposit)
+
+    def sync(self, broker):
+        """브로커 잔고로 초기화 (계좌 스냅샷이 있으면 재사용)"""
+        snapshot = getattr(broker, "account_snapshot", None)
+        self.load(snapshot.get() if snapshot is not None else broker._fetch_balance())
+
+    def set_position(self, symbol: str, qty: float, avg_price: float):
+        with self._lock:
+            i = self.index(symbol)
+            self._qty[i] = qty
+            self._avg[i] = avg_price
+        self._notify(symbol)
+
+    # -----------------------------------------------------------
+    # 갱신
+    # -----------------------------------------------------------
+    def apply_fill(self, symbol: str, side: Side, qty: int, price: float, fee: float = 0.0):
+        """체결 반영 (매수: 평균단가 갱신, 매도: 실현손익 누적)"""
+        with self._lock:
+            i = self.index(symbol)
+            held, avg = self._qty[i], self._avg[i]
+            if side == Side.BUY:
+                new_qty = held + qty
+                self._avg[i] = (held * avg + qty * price) / new_qty if new_qty else 0.0
+                self._qty[i] = new_qty
+                self.cash -= float(qty * price + fee)
+            else:
+                self.realized_pnl += float((price - avg) * qty - fee)
+                self._qty[i] = held - qty
+                if self._qty[i] == 0:
+                    self._avg[i] = 0.0
+                self.cash += float(qty * price - fee)
+            self._price[i] = price
+        self._notify(symbol)
+
+    def mark(self, symbol: str, price: float):
+        """최근가 반영"""
+        with self._lock:
+            i = self.index(symbol)
+            self._price[i] = price
+            held = self._qty[i] != 0
+        if self.change_listeners and held:
+            self._notify(symbol)
+
+    def mark_many(self, symbols, prices: Sequence[float]):
+        """
+        여러 종목 최근가를 한 번에 반영
+        :param symbols: 종목코드 목록 또는 index()로 얻은 종목 번호 배열
+        """
+        with self._lock:
+            if len(symbols) and isinstance(symbols[0], str):
+                idx = np.fromiter((self.index(s) for s in symbols), dtype=np.int64, count=len(symbols))
+            else:
+                idx = np.asarray(symbols, dtype=np.int64)
+            self._price[idx] = prices
+            changed = [self.symbols[i] for i in idx[self._qty[idx] != 0]] if self.change_listeners else []
+        # 콜백은 잠금 밖에서 호출 (콜백 안에서 position()/summary() 호출 가능)
+        for symbol in changed:
+            self._notify(symbol)
+
+    def on_quote(self, symbol: str, quote: Quote):
+        """quote_listeners 콜백 형식 (callback(symbol, quote))"""
+        self.mark(symbol, quote.price)
+
+    def attach(self, broker):
+        """브로커의 시세 조회 결과(quote_listeners)로 자동 평가"""
+        broker.quote_listeners.append(self.on_quote)
+
+    def _notify(self, symbol: str):
+        if not self.change_listeners:
+            return
+        position = self.position(symbol)
+        for listener in self.change_listeners:
+            listener(symbol, position)
+
+    # -----------------------------------------------------------
+    # 평가 (벡터 연산)
+    # -----------------------------------------------------------
+    def _arrays(self):
+        """(qty, avg, price) 사본 (호출부에서 self._lock을 잡은 상태로 호출)"""
+        n = self._size
+        qty, avg = self._qty[:n].copy(), self._avg[:n].copy()
+        price = np.where(np.isnan(self._price[:n]), avg, self._price[:n])
+        return qty, avg, price
+
+    @property
+    def market_values(self):
+        """종목별 평가금액 배열 (self.symbols 순서)"""
+        with self._lock:
+            qty, _, price = self._arrays()
+        return qty * price
+
+    @property
+    def unrealized_pnls(self):
+        """종목별 평가손익 배열 (self.symbols 순서)"""
+        with self._lock:
+            qty, avg, price = self._arrays()
+        return qty * (price - avg)
+
+    def position(self, symbol: str) -> Optional[dict]:
+        """종목별 평가 정보 (미보유 종목이면 None)"""
+        with self._lock:
+            i = self._index.get(symbol)
+            if i is None:
+                return None
+            qty, avg, last = float(self._qty[i]), float(self._avg[i]), float(self._price[i])
+        price = last if not np.isnan(last) else avg
+        return {
+            "qty": qty,
+            "avg_price": avg,
+            "price": price,
+            "market_value": qty * price,
+            "unrealized_pnl": qty * (price - avg),
+            "return_rate": (price / avg - 1) * 100 if avg else 0.0,
+        }
+
+    def summary(self) -> dict:
+        """
+        포트폴리오 전체 평가
+        - gross_exposure: 보유 평가금액 절대값 합 / net_exposure: 보유 평가금액 합
+        - max_weight: 단일 종목 최대 비중 (총자산 대비)
+        - hhi: 허핀달 지수 (보유 종목 비중 제곱합, 1에 가까울수록 집중)
+        """
+        with self._lock:
+            qty, avg, price = self._arrays()
+            cash, realized = self.cash, self.realized_pnl
+        value = qty * price
+        gross = float(np.abs(value).sum())
+        net = float(value.sum())
+        equity = cash + net
+        weights = value / gross if gross else np.zeros_like(value)
+
+        return {
+            "cash": cash,
+            "equity": equity,
+            "market_value": net,
+            "unrealized_pnl": float((qty * (price - avg)).sum()),
+            "realized_pnl": realized,
+            "gross_exposure": gross,
+            "net_exposure": net,
+            "gross_leverage": gross / equity if equity else 0.0,
+            "max_weight": float(np.abs(value).max() / equity) if len(value) and equity else 0.0,
+            "hhi": float((weights * weights).sum()),
+            "positions": int(np.count_nonzero(qty)),
+        }
+
+    def top(self, n: int = 5) -> List[tuple]:
+        """비중 상위 n개 종목 [(종목코드, 평가금액, 총자산 대비 비중), ...]"""
+        with self._lock:
+            qty, _, price = self._arrays()
+            cash = self.cash
+        value = qty * price
+        equity = cash + float(value.sum())
+        order = np.argsort(-np.abs(value))[:n]
+        return [
+            (self.symbols[i], float(value[i]), float(value[i] / equity) if equity else 0.0)
+            for i in order
+            if value[i] != 0
+        ]
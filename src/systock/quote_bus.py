@@ -0,0 +1,235 @@
+# src/systock/quote_bus.py
+from __future__ import annotations
+
+import sys
+import time
+import struct
+import logging
+import threading
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from .models import Quote
+
+if TYPE_CHECKING:
+    from .interfaces.broker import Broker
+
+# 공유 메모리 레이아웃
+# - 헤더(64B): MAGIC(4) + VERSION(2) + 예약(2) + 용량(4) + 레코드 크기(4) + 예약(8) + 마지막 시퀀스(8)
+# - 슬롯(64B): 슬롯 시퀀스(8) + 종목코드(12) + 예약(4) + 가격(8) + 거래량(8) + 등락률(8) + 시각(8) + 예약(8)
+_MAGIC = b"SYQB"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHxxII8xQ")
+_HEADER_SIZE = 64
+_SEQ_OFFSET = 24  # 헤더 내 마지막 시퀀스 위치
+_SLOT = struct.Struct("<Q12s4xdqdd8x")
+_SLOT_SEQ = struct.Struct("<Q")
+_SLOT_BODY = struct.Struct("<12s4xdqdd")
+
+_attach_lock = threading.Lock()
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    기존 공유 메모리에 연결 (구독자용)
+    Python 3.13 미만에서는 연결만 한 프로세스가 종료될 때 resource_tracker가
+    세그먼트를 삭제해 버리므로 추적 대상에서 제외합니다.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    from multiprocessing import resource_tracker
+
+    # 연결하는 동안만 등록을 건너뜀 (fork된 자식이 부모의 tracker를 공유하는 경우에도 안전)
+    with _attach_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+class QuoteBusPublisher:
+    """
+    공유 메모리 시세 버스 (발행자)
+    - 실시간 연결/폴링을 한 프로세스만 소유하고, 시세를 링 버퍼에 기록합니다.
+    - 슬롯마다 시퀀스 번호를 기록(seqlock)하여 구독자가 락 없이 읽고 덮어쓰기를 감지합니다.
+    - 발행자는 하나여야 합니다. (단일 작성자 전제)
+
+    사용 예:
+        bus = QuoteBusPublisher("systock_quotes", capacity=65536)
+        bus.start_polling(broker, ["005930", "000660"], interval=1.0)
+    """
+
+    def __init__(self, name: str = "systock_quotes", capacity: int = 65536):
+        self.name = name
+        self.capacity = capacity
+        self.logger = logging.getLogger("systock.bus")
+
+        size = _HEADER_SIZE + capacity * _SLOT.size
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # 이전 실행에서 남은 세그먼트 재사용 (크기가 다르면 다시 생성)
+            old = shared_memory.SharedMemory(name=name)
+            if old.size >= size:
+                self.shm = old
+            else:
+                old.close()
+                old.unlink()
+                self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        self._buf = self.shm.buf
+
+        # 같은 형식의 세그먼트를 재사용하면 시퀀스를 이어서 발행 (기존 구독자 유지)
+        magic, version, old_capacity, slot_size, seq = _HEADER.unpack_from(self._buf, 0)
+        if (magic, version, old_capacity, slot_size) != (_MAGIC, _VERSION, capacity, _SLOT.size):
+            seq = 0
+        _HEADER.pack_into(self._buf, 0, _MAGIC, _VERSION, capacity, _SLOT.size, seq)
+        self._seq = seq
+        self._lock = threading.Lock()  # 같은 프로세스 내 여러 스레드의 발행 직렬화
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def seq(self) -> int:
+        """마지막으로 발행된 시퀀스 번호"""
+        return self._seq
+
+    def publish(self, symbol: str, quote: Quote, ts: float = None):
+        """시세 1건 기록"""
+        with self._lock:
+            seq = self._seq + 1
+            offset = _HEADER_SIZE + ((seq - 1) % self.capacity) * _SLOT.size
+
+            # 1. 기록 중 표시 (홀수) → 2. 본문 기록 → 3. 완료 표시 (짝수) → 4. 헤더 시퀀스 갱신
+            _SLOT_SEQ.pack_into(self._buf, offset, 2 * seq - 1)
+            _SLOT_BODY.pack_into(
+                self._buf,
+                offset + 8,
+                symbol.encode("ascii"),
+                float(quote.price),
+                int(quote.volume),
+                float(quote.change),
+                ts if ts is not None else time.time(),
+            )
+            _SLOT_SEQ.pack_into(self._buf, offset, 2 * seq)
+            struct.pack_into("<Q", self._buf, _SEQ_OFFSET, seq)
+            self._seq = seq
+
+    def start_polling(self, broker: Broker, symbols: Iterable[str], interval: float = 1.0):
+        """REST 현재가를 주기적으로 조회하여 버스에 발행 (백그라운드 스레드)"""
+        symbols = list(symbols)
+        self._stop.clear()
+
+        def _loop():
+            while not self._stop.is_set():
+                started = time.time()
+                for symbol in symbols:
+                    if self._stop.is_set():
+                        return
+                    try:
+                        self.publish(symbol, broker._fetch_price(symbol))
+                    except Exception as e:
+                        self.logger.warning("시세 폴링 실패 (%s): %s", symbol, e)
+                self._stop.wait(max(0.0, interval - (time.time() - started)))
+
+        self._thread = threading.Thread(target=_loop, name="systock-bus-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def close(self, unlink: bool = True):
+        """종료 (unlink=True면 공유 메모리 세그먼트 삭제)"""
+        self.stop()
+        self._buf = None
+        self.shm.close()
+        if unlink:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class QuoteBusSubscriber:
+    """
+    공유 메모리 시세 버스 (구독자)
+    - 다른 프로세스에서 락 없이 읽습니다. 발행자보다 늦어 덮어쓰인 구간은 dropped로 집계합니다.
+    - 처음 연결 시 현재 시점부터 읽습니다. (from_start=True면 버퍼에 남은 가장 오래된 시세부터)
+
+    사용 예:
+        sub = QuoteBusSubscriber("systock_quotes")
+        for symbol, quote, ts in sub.poll():
+            ...
+        sub.latest["005930"]
+    """
+
+    def __init__(self, name: str = "systock_quotes", from_start: bool = False):
+        self.shm = _attach(name)
+        self._buf = self.shm.buf
+
+        magic, version, capacity, slot_size, seq = _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC or version != _VERSION or slot_size != _SLOT.size:
+            self.shm.close()
+            raise ValueError(f"시세 버스 형식이 맞지 않습니다: {name}")
+
+        self.capacity = capacity
+        self.dropped = 0
+        self.latest: Dict[str, Tuple[Quote, float]] = {}
+        self._next = max(1, seq - capacity + 1) if from_start else seq + 1
+
+    def _head(self) -> int:
+        return struct.unpack_from("<Q", self._buf, _SEQ_OFFSET)[0]
+
+    def poll(self, max_items: int = 10000) -> List[Tuple[str, Quote, float]]:
+        """
+        새로 발행된 시세를 읽습니다.
+        :return: [(종목코드, Quote, 발행시각), ...]
+        """
+        head = self._head()
+        result = []
+        buf = self._buf
+        slot_size = _SLOT.size
+
+        while self._next <= head and len(result) < max_items:
+            seq = self._next
+
+            # 발행자가 한 바퀴 이상 앞서 나간 경우: 남아 있는 가장 오래된 위치로 이동
+            oldest = head - self.capacity + 1
+            if seq < oldest:
+                self.dropped += oldest - seq
+                self._next = seq = oldest
+
+            offset = _HEADER_SIZE + ((seq - 1) % self.capacity) * slot_size
+            before = _SLOT_SEQ.unpack_from(buf, offset)[0]
+            symbol, price, volume, change, ts = _SLOT_BODY.unpack_from(buf, offset + 8)
+            after = _SLOT_SEQ.unpack_from(buf, offset)[0]
+
+            if before != 2 * seq or after != before:
+                # 읽는 도중 덮어쓰임 → 유실 처리 후 최신 헤더 기준으로 재시도
+                self.dropped += 1
+                self._next += 1
+                head = self._head()
+                continue
+
+            code = symbol.rstrip(b"\x00").decode("ascii")
+            quote = Quote(
+                price=int(price) if price.is_integer() else price,
+                volume=volume,
+                change=change,
+            )
+            self.latest[code] = (quote, ts)
+            result.append((code, quote, ts))
+            self._next += 1
+
+        return result
+
+    def close(self):
+        self._buf = None
+        self.shm.close()
@@ -0,0 +1,260 @@
+# src/systock/recorder.py
+import os
+import time
+import struct
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# [선택] 라이브러리가 설치되어 있을 때만 import (TickReader에서 사용)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .models import Quote
+
+# 틱 레코드 (32B): 수신시각(ns, int64) + 가격(f64) + 누적거래량(i64) + 등락률(f64)
+_RECORD = struct.Struct("<qdqd")
+# 희소 인덱스 엔트리 (16B): 시각(ns) + 레코드 번호
+_INDEX = struct.Struct("<qq")
+
+# numpy 구조화 dtype (_RECORD와 동일한 레이아웃)
+TICK_DTYPE = (
+    np.dtype([("ts", "<i8"), ("price", "<f8"), ("volume", "<i8"), ("change", "<f8")])
+    if np is not None
+    else None
+)
+_INDEX_DTYPE = np.dtype([("ts", "<i8"), ("pos", "<i8")]) if np is not None else None
+
+TimeLike = Union[int, float, datetime]
+
+
+def _to_ns(value: TimeLike) -> int:
+    """datetime / epoch 초(float) / ns(int) → epoch ns"""
+    if isinstance(value, datetime):
+        return int(value.timestamp() * 1e9)
+    if isinstance(value, float):
+        return int(value * 1e9)
+    return int(value)
+
+
+class _SymbolWriter:
+    """종목/일자별 append-only 파일 작성기"""
+
+    def __init__(self, path: str, index_every: int):
+        self.path = path
+        self.index_every = index_every
+        self.data = open(f"{path}.bin", "ab")
+        self.index = open(f"{path}.idx", "ab")
+        self.count = self.data.tell() // _RECORD.size  # 이어쓰기 대비
+        self.buf = bytearray()
+        self.index_buf = bytearray()
+
+    def append(self, ts_ns: int, quote: Quote):
+        if self.count % self.index_every == 0:
+            self.index_buf += _INDEX.pack(ts_ns, self.count)
+        self.buf += _RECORD.pack(ts_ns, float(quote.price), int(quote.volume), float(quote.change))
+        self.count += 1
+
+    def flush(self):
+        if self.buf:
+            self.data.write(self.buf)
+            self.data.flush()
+            self.buf.clear()
+        if self.index_buf:
+            self.index.write(self.index_buf)
+            self.index.flush()
+            self.index_buf.clear()
+
+    def close(self):
+        self.flush()
+        self.data.close()
+        self.index.close()
+
+
+class TickRecorder:
+    """
+    틱/시세 기록기
+    - 종목별·일자별 고정폭 바이너리 파일({root}/{YYYYMMDD}/{종목코드}.bin)에 이어쓰기합니다.
+    - index_every 건마다 (시각, 레코드 번호)를 희소 인덱스(.idx)에 기록합니다.
+    - 메모리 버퍼에 모아 flush_bytes 단위로 기록하므로 전 종목 실시간 시세도 감당합니다.
+
+    사용 예:
+        recorder = TickRecorder("ticks")
+        recorder.attach(broker)       # _fetch_price 결과 자동 기록
+        recorder.record("005930", quote)
+        recorder.close()
+    """
+
+    def __init__(
+        self,
+        root: str = "ticks",
+        index_every: int = 1024,
+        flush_bytes: int = 1 << 16,
+        flush_interval: float = 1.0,
+    ):
+        """
+        :param flush_bytes: 버퍼가 이 크기를 넘으면 디스크에 기록
+        :param flush_interval: 버퍼가 작아도 이 주기(초)마다 디스크에 기록 (0이면 사용 안 함)
+        """
+        self.root = root
+        self.index_every = index_every
+        self.flush_bytes = flush_bytes
+        self.logger = logging.getLogger("systock.recorder")
+
+        self._writers: Dict[Tuple[str, str], _SymbolWriter] = {}
+        self._day: Optional[str] = None
+        self._day_name = ""
+        self._day_start_ns = self._day_end_ns = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self.count = 0
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if flush_interval > 0:
+            self._thread = threading.Thread(
+                target=self._flush_loop, args=(flush_interval,), name="systock-recorder", daemon=True
+            )
+            self._thread.start()
+
+    def _writer(self, day: str, symbol: str) -> _SymbolWriter:
+        writer = self._writers.get((day, symbol))
+        if writer is None:
+            if day != self._day:
+                # 날짜가 바뀌면 이전 날짜 파일은 닫음
+                for key in [k for k in self._writers if k[0] != day]:
+                    self._writers.pop(key).close()
+                self._day = day
+                os.makedirs(os.path.join(self.root, day), exist_ok=True)
+            writer = _SymbolWriter(os.path.join(self.root, day, symbol), self.index_every)
+            self._writers[(day, symbol)] = writer
+        return writer
+
+    def record(self, symbol: str, quote: Quote, ts: TimeLike = None):
+        """시세 1건 기록 (ts 생략 시 현재 시각)"""
+        ts_ns = time.time_ns() if ts is None else _to_ns(ts)
+
+        with self._lock:
+            # 일자 문자열은 날짜가 바뀔 때만 다시 계산
+            if self._day_start_ns <= ts_ns < self._day_end_ns:
+                day = self._day_name
+            else:
+                day = self._locate_day(ts_ns)
+            self._writer(day, symbol).append(ts_ns, quote)
+            self.count += 1
+            self._pending += _RECORD.size
+            if self._pending >= self.flush_bytes:
+                self._flush_locked()
+
+    def _locate_day(self, ts_ns: int) -> str:
+        dt = datetime.fromtimestamp(ts_ns / 1e9)
+        midnight = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+        start_ns = int(midnight.timestamp() * 1e9)
+        self._day_name = midnight.strftime("%Y%m%d")
+        self._day_start_ns = start_ns
+        self._day_end_ns = start_ns + 86_400 * 10**9
+        return self._day_name
+
+    def attach(self, broker):
+        """브로커의 시세 조회 결과(quote_listeners)를 자동으로 기록"""
+        broker.quote_listeners.append(self.record)
+
+    def _flush_locked(self):
+        for writer in self._writers.values():
+            writer.flush()
+        self._pending = 0
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_loop(self, interval: float):
+        while not self._stop.wait(interval):
+            try:
+                self.flush()
+            except OSError as e:
+                self.logger.warning("틱 기록 실패: %s", e)
+
+    def close(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        with self._lock:
+            for writer in self._writers.values():
+                writer.close()
+            self._writers.clear()
+
+
+class TickReader:
+    """
+    틱 파일 리더
+    - 파일을 메모리 맵(numpy.memmap)으로 열고, 희소 인덱스로 구간을 좁혀
+      요청한 시간 범위의 NumPy 뷰만 반환합니다. (하루치 전체를 읽지 않음)
+    """
+
+    def __init__(self, root: str = "ticks"):
+        if np is None:
+            raise ImportError("numpy 라이브러리가 필요합니다. (pip install numpy)")
+        self.root = root
+
+    def days(self, symbol: str = None) -> List[str]:
+        """기록된 일자 목록 (symbol 지정 시 해당 종목이 있는 일자만)"""
+        if not os.path.isdir(self.root):
+            return []
+        result = []
+        for day in sorted(os.listdir(self.root)):
+            if symbol is None or os.path.exists(os.path.join(self.root, day, f"{symbol}.bin")):
+                result.append(day)
+        return result
+
+    def read(self, symbol: str, day: str, start: TimeLike = None, end: TimeLike = None):
+        """
+        하루치 파일에서 [start, end) 구간의 레코드 뷰 반환
+        :return: TICK_DTYPE 구조화 배열 (memmap 뷰, 복사 없음)
+        """
+        path = os.path.join(self.root, day, symbol)
+        size = os.path.getsize(f"{path}.bin") if os.path.exists(f"{path}.bin") else 0
+        n = size // _RECORD.size
+        if n == 0:
+            return np.zeros(0, dtype=TICK_DTYPE)
+
+        data = np.memmap(f"{path}.bin", dtype=TICK_DTYPE, mode="r", shape=(n,))
+        lo, hi = 0, n
+
+        # 1. 희소 인덱스로 후보 구간 축소
+        index = (
+            np.fromfile(f"{path}.idx", dtype=_INDEX_DTYPE)
+            if os.path.exists(f"{path}.idx")
+            else np.zeros(0, dtype=_INDEX_DTYPE)
+        )
+        if start is not None and len(index):
+            k = int(np.searchsorted(index["ts"], _to_ns(start), side="right")) - 1
+            if k > 0:
+                lo = int(index["pos"][k])
+        if end is not None and len(index):
+            k = int(np.searchsorted(index["ts"], _to_ns(end), side="left"))
+            if k < len(index):
+                hi = min(n, int(index["pos"][k]) + 1)
+
+        # 2. 후보 구간 안에서 정확한 경계 탐색
+        ts = data["ts"]
+        if start is not None:
+            lo += int(np.searchsorted(ts[lo:hi], _to_ns(start), side="left"))
+        if end is not None:
+            hi = lo + int(np.searchsorted(ts[lo:hi], _to_ns(end), side="left"))
+
+        return data[lo:hi]
+
+    def iter_range(self, symbol: str, start: TimeLike, end: TimeLike) -> Iterator:
+        """여러 날짜에 걸친 구간을 일자별 뷰로 순회"""
+        start_day = datetime.fromtimestamp(_to_ns(start) / 1e9).strftime("%Y%m%d")
+        end_day = datetime.fromtimestamp(_to_ns(end) / 1e9).strftime("%Y%m%d")
+        for day in self.days(symbol):
+            if start_day <= day <= end_day:
+                view = self.read(symbol, day, start, end)
+                if len(view):
+                    yield view
@@ -0,0 +1,259 @@
+# src/systock/scanner.py
+from __future__ import annotations
+
+import time
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from .models import ScanResult
+from .exceptions import ApiError
+
+if TYPE_CHECKING:
+    from .brokers.kis.client import KisBroker
+
+# KIS 순위분석 TR 정의
+# - path/tr_id: 요청 주소와 TR ID
+# - params: 기본 요청 파라미터 (scan() 호출 시 덮어쓸 수 있음)
+# - symbol_field: 응답의 종목코드 필드명 (TR마다 다름)
+KIS_RANKING_SPECS: Dict[str, dict] = {
+    # 거래량 순위 (FID_BLNG_CLS_CODE 0:평균거래량 1:거래증가율 2:평균거래회전율 3:거래금액순 4:평균거래금액회전율)
+    "volume": {
+        "path": "/uapi/domestic-stock/v1/quotations/volume-rank",
+        "tr_id": "FHPST01710000",
+        "symbol_field": "mksc_shrn_iscd",
+        "params": {
+            "FID_COND_MRKT_DIV_CODE": "J",
+            "FID_COND_SCR_DIV_CODE": "20171",
+            "FID_INPUT_ISCD": "0000",
+            "FID_DIV_CLS_CODE": "0",
+            "FID_BLNG_CLS_CODE": "0",
+            "FID_TRGT_CLS_CODE": "111111111",
+            "FID_TRGT_EXLS_CLS_CODE": "0000000000",
+            "FID_INPUT_PRICE_1": "",
+            "FID_INPUT_PRICE_2": "",
+            "FID_VOL_CNT": "",
+            "FID_INPUT_DATE_1": "",
+        },
+    },
+    # 등락률 순위 (fid_rank_sort_cls_code 0:상승율 1:하락율 2:시가대비상승 3:시가대비하락 4:변동율)
+    "fluctuation": {
+        "path": "/uapi/domestic-stock/v1/ranking/fluctuation",
+        "tr_id": "FHPST01700000",
+        "symbol_field": "stck_shrn_iscd",
+        "params": {
+            "fid_cond_mrkt_div_code": "J",
+            "fid_cond_scr_div_code": "20170",
+            "fid_input_iscd": "0000",
+            "fid_rank_sort_cls_code": "0",
+            "fid_input_cnt_1": "0",
+            "fid_prc_cls_code": "0",
+            "fid_input_price_1": "",
+            "fid_input_price_2": "",
+            "fid_vol_cnt": "",
+            "fid_trgt_cls_code": "0",
+            "fid_trgt_exls_cls_code": "0",
+            "fid_div_cls_code": "0",
+            "fid_rsfl_rate1": "",
+            "fid_rsfl_rate2": "",
+        },
+    },
+    # 체결강도 상위
+    "volume_power": {
+        "path": "/uapi/domestic-stock/v1/ranking/volume-power",
+        "tr_id": "FHPST01680000",
+        "symbol_field": "stck_shrn_iscd",
+        "params": {
+            "fid_trgt_exls_cls_code": "0",
+            "fid_cond_mrkt_div_code": "J",
+            "fid_cond_scr_div_code": "20168",
+            "fid_input_iscd": "0000",
+            "fid_div_cls_code": "0",
+            "fid_input_price_1": "",
+            "fid_input_price_2": "",
+            "fid_vol_cnt": "",
+            "fid_trgt_cls_code": "0",
+        },
+    },
+}
+
+
+@dataclass
+class ScanDiff:
+    """직전 스캔 대비 변경 사항"""
+
+    added: ScanResult  # 새로 순위에 든 종목
+    changed: ScanResult  # 순위 또는 가격이 바뀐 종목
+    removed: List[str] = field(default_factory=list)  # 순위에서 빠진 종목코드
+
+    def __bool__(self) -> bool:
+        return bool(len(self.added) or len(self.changed) or self.removed)
+
+
+class MarketScanner:
+    """
+    KIS 순위분석 TR 기반 시장 스캐너
+    - 종목별 시세 폴링 대신 순위 TR 한 번으로 급등/거래량 상위 종목을 찾습니다.
+    - 같은 조건의 조회는 ttl(초) 동안 캐시하여 API를 다시 호출하지 않습니다.
+    - diff()는 직전 스캔과 비교하여 새로 들어온/바뀐/빠진 종목만 돌려줍니다.
+
+    사용 예:
+        scanner = MarketScanner(broker, ttl=3.0)
+        top = scanner.scan("volume")                        # ScanResult (컬럼 단위)
+        up = scanner.scan("fluctuation", fid_rank_sort_cls_code="0")
+        changes = scanner.diff("fluctuation")
+        for row in changes.added.rows(): ...
+    """
+
+    def __init__(self, broker: KisBroker, ttl: float = 3.0, max_pages: int = 1):
+        """
+        :param ttl: 같은 조건 조회 결과 재사용 시간 (초)
+        :param max_pages: 연속 조회 최대 페이지 수 (TR별 1페이지 최대 30건 내외, 연속조회 키를 주는 TR만 해당)
+        """
+        self.broker = broker
+        self.ttl = ttl
+        self.max_pages = max_pages
+        self.specs = dict(KIS_RANKING_SPECS)
+        self.logger = logging.getLogger("systock.scanner")
+
+        self._cache: Dict[Tuple, ScanResult] = {}
+        self._previous: Dict[Tuple, ScanResult] = {}
+        self._lock = threading.Lock()
+        self._watchers: List[Tuple[threading.Thread, threading.Event]] = []
+
+    @staticmethod
+    def _key(kind: str, params: dict) -> Tuple:
+        return (kind, tuple(sorted(params.items())))
+
+    # -----------------------------------------------------------
+    # 조회
+    # -----------------------------------------------------------
+    def scan(self, kind: str = "volume", max_age: float = None, **params) -> ScanResult:
+        """
+        순위 조회 (캐시 우선)
+        :param kind: KIS_RANKING_SPECS의 키 ('volume', 'fluctuation', 'volume_power')
+        :param max_age: 이번 호출에 허용할 캐시 경과 시간 (기본값: ttl)
+        :param params: 기본 요청 파라미터 덮어쓰기 (예: FID_BLNG_CLS_CODE="3")
+        """
+        if kind not in self.specs:
+            raise ValueError(f"지원하지 않는 스캔 종류입니다: {kind} (지원: {', '.join(self.specs)})")
+
+        key = self._key(kind, params)
+        max_age = self.ttl if max_age is None else max_age
+        cached = self._cache.get(key)
+        if cached is not None and time.time() - cached.ts <= max_age:
+            return cached
+
+        result = self._fetch(kind, params)
+        with self._lock:
+            self._cache[key] = result
+        return result
+
+    def _fetch(self, kind: str, params: dict) -> ScanResult:
+        broker = self.broker
+        spec = self.specs[kind]
+        if not broker.access_token:
+            broker.connect()
+
+        url = f"{broker.base_url}{spec['path']}"
+        query = dict(spec["params"], **params)
+        symbol_field = spec["symbol_field"]
+        result = ScanResult(kind=kind, ts=time.time())
+
+        tr_cont = None
+        for _ in range(max(1, self.max_pages)):
+            headers = broker._get_headers(tr_id=spec["tr_id"], tr_cont=tr_cont)
+            resp = broker.request("GET", url, headers=headers, params=query)
+            resp.raise_for_status()
+            data = resp.json()
+
+            if data["rt_cd"] != "0":
+                raise ApiError(message=data["msg1"], code=data.get("msg_cd"))
+
+            for item in data.get("output") or []:
+                symbol = item.get(symbol_field, "")
+                if not symbol:
+                    continue
+                result.symbol.append(symbol)
+                result.name.append(item.get("hts_kor_isnm", ""))
+                result.rank.append(int(item.get("data_rank") or len(result.symbol)))
+                result.price.append(int(item.get("stck_prpr") or 0))
+                result.change.append(float(item.get("prdy_ctrt") or 0))
+                result.volume.append(int(item.get("acml_vol") or 0))
+
+            # 응답 헤더 tr_cont: F/M이면 다음 데이터 있음
+            if resp.headers.get("tr_cont", "") not in ("F", "M"):
+                break
+            # 연속조회 키(CTX_AREA_*)를 다음 요청에 그대로 전달 (키가 없는 TR은 같은 페이지가 반복되므로 중단)
+            ctx = {k.upper(): v for k, v in data.items() if k.lower().startswith("ctx_area_")}
+            if not ctx:
+                break
+            query.update(ctx)
+            tr_cont = "N"
+
+        return result
+
+    # -----------------------------------------------------------
+    # 변경 감지
+    # -----------------------------------------------------------
+    def diff(self, kind: str = "volume", **params) -> ScanDiff:
+        """직전 diff() 호출 대비 새로 들어온/바뀐/빠진 종목 (첫 호출은 전부 added)"""
+        key = self._key(kind, params)
+        current = self.scan(kind, **params)
+
+        with self._lock:
+            previous = self._previous.get(key)
+            self._previous[key] = current
+
+        if previous is None:
+            return ScanDiff(added=current, changed=current.take([]))
+        if previous is current:
+            # 캐시된 같은 결과 → 변경 없음
+            return ScanDiff(added=current.take([]), changed=current.take([]))
+
+        before = {
+            s: (previous.rank[i], previous.price[i]) for i, s in enumerate(previous.symbol)
+        }
+        added, changed = [], []
+        for i, symbol in enumerate(current.symbol):
+            old = before.pop(symbol, None)
+            if old is None:
+                added.append(i)
+            elif old != (current.rank[i], current.price[i]):
+                changed.append(i)
+
+        return ScanDiff(
+            added=current.take(added), changed=current.take(changed), removed=list(before)
+        )
+
+    def watch(
+        self,
+        kind: str,
+        callback: Callable[[ScanDiff], None],
+        interval: float = 5.0,
+        **params,
+    ):
+        """백그라운드에서 주기적으로 diff()를 수행하고 변경이 있을 때만 callback 호출"""
+        stop = threading.Event()
+
+        def _loop():
+            while not stop.is_set():
+                try:
+                    changes = self.diff(kind, **params)
+                    if changes:
+                        callback(changes)
+                except Exception as e:
+                    self.logger.warning("스캔 실패 (%s): %s", kind, e)
+                stop.wait(interval)
+
+        thread = threading.Thread(target=_loop, name=f"systock-scanner-{kind}", daemon=True)
+        thread.start()
+        self._watchers.append((thread, stop))
+
+    def stop(self):
+        for thread, stop in self._watchers:
+            stop.set()
+        for thread, _ in self._watchers:
+            thread.join(timeout=5)
+        self._watchers.clear()
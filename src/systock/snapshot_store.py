@@ -0,0 +1,302 @@
+# src/systock/snapshot_store.py
+import json
+import time
+import sqlite3
+import logging
+import threading
+from dataclasses import asdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .models import Quote, Balance, Holding, OrderState
+from .constants import Side, OrderStatus
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quotes (
+    symbol TEXT PRIMARY KEY,
+    price REAL NOT NULL,
+    volume INTEGER NOT NULL,
+    change REAL NOT NULL,
+    ts REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS balances (
+    account TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    ts REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS orders (
+    account TEXT NOT NULL,
+    order_id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    ts REAL NOT NULL,
+    PRIMARY KEY (account, order_id)
+);
+"""
+
+
+def _account_key(broker) -> str:
+    prefix = getattr(broker, "acc_no_prefix", None)
+    if prefix is None:
+        return type(broker).__name__
+    return f"{prefix}-{broker.acc_no_suffix}"
+
+
+class SnapshotStore:
+    """
+    재시작 대비 로컬 스냅샷 저장소 (SQLite)
+    - 마지막 시세, 계좌 잔고, 미체결 주문 상태를 저장 시각과 함께 보관합니다.
+    - attach() 시점에 즉시 불러와 '오래됐지만 쓸 수 있는' 데이터로 제공하고,
+      실제 API 갱신은 백그라운드에서 수행합니다. (장 시작 직후 동시 조회 폭주 방지)
+    - 시세는 메모리에 모았다가 flush_interval 주기로 한 번에 기록합니다.
+
+    사용 예:
+        store = SnapshotStore("systock_snapshot.db")
+        broker = create_broker("kis", snapshot_store=store)   # 또는 store.attach(broker)
+        store.quote("005930")                 # (Quote, 저장 시각) - 재시작 직후에도 즉시 반환
+        broker.account_snapshot.get(stale=True)
+        store.wait_ready(timeout=10)          # 백그라운드 갱신 완료 대기
+        store.report                          # {'계좌': {'load_ms', 'ready_ms', ...}}
+    """
+
+    def __init__(self, path: str = "systock_snapshot.db", flush_interval: float = 1.0):
+        """
+        :param path: SQLite 파일 경로
+        :param flush_interval: 메모리의 변경분을 기록하는 주기 (초, 0이면 flush() 호출 시에만 기록)
+        """
+        self.path = path
+        self.logger = logging.getLogger("systock.snapshot")
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()  # SQLite 연결
+        # 메모리 시세 (시세 콜백이 DB 기록을 기다리지 않도록 별도 잠금)
+        self._quotes_lock = threading.Lock()
+
+        # 시세: 저장소에서 불러온 값 + 이후 수신한 값 {종목코드: (Quote, 수신 시각)}
+        self._quotes: Dict[str, Tuple[Quote, float]] = self._load_quotes()
+        self._dirty: Dict[str, Tuple[Quote, float]] = {}
+        self._brokers: list = []
+        self._saved_fetch_count: Dict[str, int] = {}
+        self._saved_order_version: Dict[str, int] = {}
+
+        self.report: Dict[str, dict] = {}
+        self._refreshers: List[threading.Thread] = []
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if flush_interval > 0:
+            self._thread = threading.Thread(
+                target=self._flush_loop, args=(flush_interval,), name="systock-snapshot", daemon=True
+            )
+            self._thread.start()
+
+    # -----------------------------------------------------------
+    # 시세
+    # -----------------------------------------------------------
+    def _load_quotes(self) -> Dict[str, Tuple[Quote, float]]:
+        rows = self._conn.execute("SELECT symbol, price, volume, change, ts FROM quotes").fetchall()
+        return {
+            # 국내주식 가격은 정수로 복원 (해외주식은 소수 유지)
+            symbol: (Quote(price=int(price) if price.is_integer() else price, volume=volume, change=change), ts)
+            for symbol, price, volume, change, ts in rows
+        }
+
+    def quote(self, symbol: str, max_age: float = None) -> Optional[Tuple[Quote, float]]:
+        """마지막 시세와 수신 시각 (없거나 max_age초보다 오래됐으면 None)"""
+        item = self._quotes.get(symbol)
+        if item is None or (max_age is not None and time.time() - item[1] > max_age):
+            return None
+        return item
+
+    def quotes(self) -> Dict[str, Tuple[Quote, float]]:
+        with self._quotes_lock:
+            return dict(self._quotes)
+
+    def on_quote(self, symbol: str, quote: Quote):
+        """quote_listeners 콜백 형식 (callback(symbol, quote), 여러 조회 스레드에서 동시 호출)"""
+        item = (quote, time.time())
+        with self._quotes_lock:
+            self._quotes[symbol] = item
+            self._dirty[symbol] = item
+
+    # -----------------------------------------------------------
+    # 잔고 / 주문
+    # -----------------------------------------------------------
+    def save_balance(self, account: str, balance: Balance):
+        data = json.dumps(asdict(balance), ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO balances VALUES (?, ?, ?)", (account, data, time.time())
+            )
+
+    def load_balance(self, account: str) -> Optional[Tuple[Balance, float]]:
+        """저장된 잔고와 저장 시각 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, ts FROM balances WHERE account = ?", (account,)
+            ).fetchone()
+        if row is None:
+            return None
+        data = json.loads(row[0])
+        data["holdings"] = [Holding(**h) for h in data["holdings"]]
+        return Balance(**data), row[1]
+
+    def save_orders(self, account: str, states: Iterable[OrderState]):
+        """미체결 주문 상태 저장 (해당 계좌의 기존 기록은 교체)"""
+        now = time.time()
+        rows = []
+        for state in states:
+            data = asdict(state)
+            data["side"] = state.side.value if state.side is not None else None
+            data["status"] = state.status.value
+            rows.append((account, state.order_id, json.dumps(data), now))
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM orders WHERE account = ?", (account,))
+            self._conn.executemany("INSERT INTO orders VALUES (?, ?, ?, ?)", rows)
+            self._conn.execute("COMMIT")
+
+    def load_orders(self, account: str) -> List[OrderState]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM orders WHERE account = ?", (account,)
+            ).fetchall()
+        states = []
+        for (raw,) in rows:
+            data = json.loads(raw)
+            data["side"] = Side(data["side"]) if data["side"] else None
+            data["status"] = OrderStatus(data["status"])
+            states.append(OrderState(**data))
+        return states
+
+    # -----------------------------------------------------------
+    # 브로커 연결 (warm start)
+    # -----------------------------------------------------------
+    def attach(self, broker, refresh: bool = True) -> dict:
+        """
+        저장된 스냅샷을 브로커에 즉시 적용하고 (잔고 스냅샷, 주문 추적기),
+        이후 시세/잔고/주문 변경을 자동으로 저장합니다.
+        :param refresh: True면 백그라운드에서 잔고/미체결/저장된 종목 시세를 API로 갱신
+        :return: 계좌별 warm start 리포트 (load_ms: 로드 시간, ready_ms: 갱신 완료까지 시간)
+        """
+        started = time.perf_counter()
+        account = _account_key(broker)
+        now = time.time()
+        report = {"quotes": len(self._quotes), "balance_age": None, "orders": 0}
+
+        snapshot = getattr(broker, "account_snapshot", None)
+        saved = self.load_balance(account)
+        if snapshot is not None and saved is not None:
+            snapshot.seed(saved[0])
+            report["balance_age"] = now - saved[1]
+
+        tracker = getattr(broker, "order_tracker", None)
+        if tracker is not None:
+            states = self.load_orders(account)
+            tracker.restore(states)
+            report["orders"] = len(states)
+
+        if hasattr(broker, "quote_listeners"):
+            broker.quote_listeners.append(self.on_quote)
+        with self._lock:
+            self._brokers.append(broker)
+            if snapshot is not None:
+                self._saved_fetch_count[account] = snapshot.fetch_count
+            if tracker is not None:
+                self._saved_order_version[account] = tracker.version
+
+        report["load_ms"] = (time.perf_counter() - started) * 1000
+        self.report[account] = report
+        self.logger.info(
+            "스냅샷 로드 완료 (%s): 시세 %d종목, 주문 %d건, %.1fms",
+            account, report["quotes"], report["orders"], report["load_ms"],
+        )
+
+        if refresh:
+            thread = threading.Thread(
+                target=self._refresh, args=(broker, report, started),
+                name="systock-snapshot-refresh", daemon=True,
+            )
+            thread.start()
+            self._refreshers.append(thread)
+        return report
+
+    def _refresh(self, broker, report: dict, started: float):
+        """저장된 데이터를 API로 갱신 (실패해도 저장된 데이터는 계속 사용)"""
+        steps = []
+        snapshot = getattr(broker, "account_snapshot", None)
+        if snapshot is not None:
+            steps.append(("balance", lambda: snapshot.get(max_age=0)))
+        if hasattr(broker, "sync_orders"):
+            # 1회 대사 (조회 시작 이후 접수된 주문은 유지, 로컬 신뢰는 max_sync_age 동안만)
+            steps.append(("orders", broker.sync_orders))
+        symbols = list(self.quotes())
+        if symbols and hasattr(broker, "fetch_prices"):
+            steps.append(("quotes", lambda: broker.fetch_prices(symbols)))
+
+        for name, step in steps:
+            try:
+                step()
+            except Exception as e:
+                self.logger.warning("스냅샷 갱신 실패 (%s): %s", name, e)
+        report["ready_ms"] = (time.perf_counter() - started) * 1000
+        self.logger.info("스냅샷 갱신 완료 (%s): %.1fms", _account_key(broker), report["ready_ms"])
+
+    def wait_ready(self, timeout: float = None) -> bool:
+        """백그라운드 갱신이 모두 끝날 때까지 대기 (시간 초과 시 False)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in list(self._refreshers):
+            thread.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+            if thread.is_alive():
+                return False
+        return True
+
+    # -----------------------------------------------------------
+    # 기록
+    # -----------------------------------------------------------
+    def flush(self):
+        """메모리의 변경분(시세, 잔고, 미체결 주문)을 기록"""
+        with self._quotes_lock:
+            dirty, self._dirty = self._dirty, {}
+        if dirty:
+            rows = [
+                (symbol, float(q.price), int(q.volume), float(q.change), ts)
+                for symbol, (q, ts) in dirty.items()
+            ]
+            with self._lock:
+                self._conn.execute("BEGIN")
+                self._conn.executemany("INSERT OR REPLACE INTO quotes VALUES (?, ?, ?, ?, ?)", rows)
+                self._conn.execute("COMMIT")
+
+        for broker in list(self._brokers):
+            account = _account_key(broker)
+            snapshot = getattr(broker, "account_snapshot", None)
+            # 새로 조회된 잔고가 있을 때만 기록
+            if snapshot is not None and snapshot.fetch_count != self._saved_fetch_count.get(account):
+                balance = snapshot.balance
+                if balance is not None:
+                    self.save_balance(account, balance)
+                self._saved_fetch_count[account] = snapshot.fetch_count
+            tracker = getattr(broker, "order_tracker", None)
+            # 주문 상태가 바뀐 경우에만 기록 (매 주기 테이블을 다시 쓰지 않음)
+            if tracker is not None and tracker.version != self._saved_order_version.get(account):
+                version = tracker.version
+                self.save_orders(account, tracker.open_orders())
+                self._saved_order_version[account] = version
+
+    def _flush_loop(self, interval: float):
+        while not self._stop.wait(interval):
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                self.logger.warning("스냅샷 기록 실패: %s", e)
+
+    def close(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+        with self._lock:
+            self._conn.close()
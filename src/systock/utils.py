@@ -1,6 +1,9 @@
-import time
 import threading
 from collections import deque  # [추가] 가장 빠른 큐 자료구조
+from typing import Deque
+
+from .clock import Clock, SYSTEM_CLOCK
+from .exceptions import CircuitOpenError
 
 
 class RateLimiter:
@@ -10,17 +13,31 @@ class RateLimiter:
     - deque를 사용하여 오래된 기록 제거 속도 최적화 O(1)
     """
 
-    def __init__(self, max_calls: int, period: float = 1.0):
+    def __init__(self, max_calls: int, period: float = 1.0, clock: Clock = None):
+        """
+        :param clock: 시계 (기본값: 실제 시계, 시뮬레이션 시 VirtualClock 주입)
+        """
         self.max_calls = max_calls
         self.period = period
         self.calls = deque()  # [변경] list 대신 deque 사용
         self.lock = threading.Lock()
+        self.clock = clock or SYSTEM_CLOCK
 
-    def wait(self):
-        """호출 가능할 때까지 대기(Sleep)하는 메서드"""
-        with self.lock:
+    def wait(self, timeout: float = None) -> bool:
+        """
+        호출 가능할 때까지 대기(Sleep)하는 메서드
+        :param timeout: 최대 대기 시간(초). 이 시간 안에 호출할 수 없으면 기다리지 않고 False 반환
+        :return: 호출 허용 여부 (timeout 미지정 시 항상 True)
+        """
+        clock = self.clock
+        started = clock.time()
+        # [추가] 다른 스레드가 대기 중인 시간도 timeout에 포함
+        if not self.lock.acquire(timeout=-1 if timeout is None else max(0.0, timeout)):
+            return False
+
+        try:
             while True:
-                current_time = time.time()
+                current_time = clock.time()
 
                 # 1. [최적화] 기간이 지난 오래된 기록을 앞에서부터 제거
                 # filter나 리스트 컴프리헨션처럼 전체를 훑지 않고, 만료된 것만 쏙 빼냅니다.
@@ -30,12 +47,236 @@ class RateLimiter:
                 # 2. 아직 여유가 있다면 통과
                 if len(self.calls) < self.max_calls:
                     self.calls.append(current_time)
-                    return  # 대기 없이 리턴
+                    return True  # 대기 없이 리턴
 
                 # 3. 꽉 찼다면, 가장 오래된 호출이 만료될 때까지 대기
                 # (period - (현재시간 - 가장오래된시간))
                 earliest_call = self.calls[0]
                 sleep_time = self.period - (current_time - earliest_call)
 
+                # [추가] 기한 안에 차례가 오지 않으면 슬롯을 쓰지 않고 거절
+                if timeout is not None and current_time + sleep_time - started > timeout:
+                    return False
+
                 if sleep_time > 0:
-                    time.sleep(sleep_time + 0.01)  # 0.01초 여유 버퍼
+                    clock.sleep(sleep_time + 0.01)  # 0.01초 여유 버퍼
+        finally:
+            self.lock.release()
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    서버의 유량 초과 응답에 반응하는 AIMD 속도 제한기
+    - 유량 초과(Throttle) 감지 시: 허용 호출 수를 곱셈 감소 (Multiplicative Decrease)
+    - 일정 시간 초과 응답이 없으면: 허용 호출 수를 1씩 증가 (Additive Increase)
+    - 최초 설정값(max_calls)을 상한으로 사용합니다.
+    """
+
+    def __init__(
+        self,
+        max_calls: int,
+        period: float = 1.0,
+        min_calls: int = 1,
+        decrease_factor: float = 0.5,
+        increase_interval: float = None,
+        clock: Clock = None,
+    ):
+        super().__init__(max_calls, period, clock)
+        self.ceiling = max_calls
+        self.min_calls = min(min_calls, max_calls)
+        self.decrease_factor = decrease_factor
+        # 증가 간격 기본값: 제한 주기의 5배 동안 초과가 없으면 1 증가
+        self.increase_interval = increase_interval or period * 5
+
+        self.throttle_count = 0
+        self._last_change = self.clock.time()
+        self._last_decrease = 0.0
+        # wait()가 sleep 중에도 조정할 수 있도록 별도 락 사용
+        self._adjust_lock = threading.Lock()
+
+    @property
+    def current_rate(self) -> float:
+        """현재 학습된 초당 허용 호출 수"""
+        return self.max_calls / self.period
+
+    def on_throttle(self):
+        """유량 초과 응답 수신 시 호출 (곱셈 감소)"""
+        with self._adjust_lock:
+            now = self.clock.time()
+            self.throttle_count += 1
+
+            # 같은 주기 안에 동시에 도착한 초과 응답은 한 번만 반영
+            if now - self._last_decrease < self.period:
+                return
+
+            self.max_calls = max(
+                self.min_calls, int(self.max_calls * self.decrease_factor)
+            )
+            self._last_decrease = now
+            self._last_change = now
+
+    def on_success(self):
+        """정상 응답 수신 시 호출 (덧셈 증가)"""
+        if self.max_calls >= self.ceiling:
+            return
+
+        with self._adjust_lock:
+            now = self.clock.time()
+            if now - self._last_change >= self.increase_interval:
+                self.max_calls = min(self.ceiling, self.max_calls + 1)
+                self._last_change = now
+
+    def metrics(self) -> dict:
+        """모니터링용 지표"""
+        return {
+            "current_rate": self.current_rate,
+            "max_calls": self.max_calls,
+            "ceiling": self.ceiling,
+            "throttle_count": self.throttle_count,
+        }
+
+
+class CircuitBreaker:
+    """
+    엔드포인트 단위 서킷 브레이커
+    - CLOSED: 정상. 최근 window건 중 실패(예외/5xx) 또는 지연(slow_call_threshold 초과) 비율이
+      임계치를 넘으면 OPEN으로 전환
+    - OPEN: open_duration 동안 요청을 보내지 않고 CircuitOpenError로 즉시 실패
+    - HALF_OPEN: 시험 요청을 half_open_calls건만 허용하여 모두 성공하면 CLOSED, 하나라도 실패하면 다시 OPEN
+    """
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        slow_call_threshold: float = 3.0,
+        slow_call_rate: float = 0.8,
+        open_duration: float = 10.0,
+        half_open_calls: int = 1,
+        clock: Clock = None,
+    ):
+        self.name = name
+        self.clock = clock or SYSTEM_CLOCK
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_rate = slow_call_rate
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+
+        self.state = self.CLOSED
+        self.open_count = 0
+        # 최근 결과: (실패 여부, 지연 여부)
+        self._outcomes: Deque[tuple] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probes = 0  # HALF_OPEN에서 진행 중인 시험 요청 수
+        self._probe_successes = 0
+        self.lock = threading.Lock()
+
+    def allow(self):
+        """요청 전 호출. 차단 상태면 CircuitOpenError"""
+        with self.lock:
+            if self.state == self.OPEN:
+                remaining = self._opened_at + self.open_duration - self.clock.time()
+                if remaining > 0:
+                    raise CircuitOpenError(self.name, remaining)
+                # 차단 시간이 지나면 시험 요청 허용
+                self.state = self.HALF_OPEN
+                self._probes = 0
+                self._probe_successes = 0
+
+            if self.state == self.HALF_OPEN:
+                if self._probes >= self.half_open_calls:
+                    raise CircuitOpenError(self.name, 0.0)
+                self._probes += 1
+
+    def release(self):
+        """allow() 후 요청을 보내지 못한 경우 호출 (시험 요청 슬롯 반환)"""
+        with self.lock:
+            if self.state == self.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record(self, elapsed: float, failed: bool = False):
+        """요청 결과 기록"""
+        slow = elapsed > self.slow_call_threshold
+        with self.lock:
+            if self.state == self.HALF_OPEN:
+                if failed or slow:
+                    self._trip()
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_calls:
+                    self.state = self.CLOSED
+                    self._outcomes.clear()
+                return
+
+            self._outcomes.append((failed, slow))
+            total = len(self._outcomes)
+            if total < self.min_calls:
+                return
+
+            failures = sum(1 for f, _ in self._outcomes if f)
+            slows = sum(1 for _, s in self._outcomes if s)
+            if failures / total >= self.failure_rate or slows / total >= self.slow_call_rate:
+                self._trip()
+
+    def _trip(self):
+        self.state = self.OPEN
+        self._opened_at = self.clock.time()
+        self._outcomes.clear()
+        self.open_count += 1
+
+    def metrics(self) -> dict:
+        """모니터링용 지표"""
+        with self.lock:
+            total = len(self._outcomes)
+            return {
+                "state": self.state,
+                "open_count": self.open_count,
+                "recent_calls": total,
+                "failure_rate": sum(1 for f, _ in self._outcomes if f) / total if total else 0.0,
+            }
+
+
+class LatencyStats:
+    """최근 N개 샘플 기반 지연 통계 (단위: 초 입력, ms 출력)"""
+
+    def __init__(self, window: int = 4096):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float):
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+            self._samples.append(seconds)
+
+    def summary(self) -> dict:
+        with self._lock:
+            samples = sorted(self._samples)
+            count, total, max_ = self.count, self.total, self.max
+
+        if not samples:
+            return {"count": 0}
+
+        def pct(p: float) -> float:
+            return samples[min(len(samples) - 1, int(len(samples) * p))] * 1000
+
+        return {
+            "count": count,
+            "mean_ms": total / count * 1000,
+            "p50_ms": pct(0.50),
+            "p99_ms": pct(0.99),
+            "max_ms": max_ * 1000,
+        }
@@ -0,0 +1,67 @@
+# src/systock/warmup.py
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable
+
+logger = logging.getLogger("systock.warmup")
+
+
+def _account_key(broker) -> str:
+    prefix = getattr(broker, "acc_no_prefix", None)
+    if prefix is None:
+        return f"{type(broker).__name__}-{id(broker):x}"
+    return f"{prefix}-{broker.acc_no_suffix}"
+
+
+def warmup_brokers(brokers: Iterable, max_workers: int = None, **options) -> Dict[str, dict]:
+    """
+    여러 브로커(계좌) 동시 예열
+    - 브로커마다 warmup()을 병렬로 실행합니다. (토큰 발급은 전역 제한기로 자동 직렬화)
+    - 같은 계좌의 브로커가 여럿이면 잔고/미체결 대사는 첫 번째 브로커에서만 수행합니다.
+      (잔고 스냅샷과 주문 추적기는 계좌 단위로 공유됨)
+    - warmup()이 없는 브로커(SimBroker 등)는 connect()만 호출합니다.
+
+    사용 예:
+        report = warmup_brokers([main, sub], watchlist=["005930", "000660"])
+        report["12345678-01"]["timings"]   # 계좌별 단계 소요 시간 (ms)
+        report["_total"]["total"]      # 전체 소요 시간 (ms)
+
+    :param options: KisBroker.warmup() 옵션 (watchlist, master, connections, fast_lane, account, orders)
+    :return: {계좌: KisBroker.warmup() 리포트, ..., '_total': {'total': ms, 'brokers': n}}
+    """
+    brokers = list(brokers)
+    started = time.perf_counter()
+
+    counts: Dict[str, int] = {}
+    jobs = []
+    for broker in brokers:
+        key = _account_key(broker)
+        opts = dict(options)
+        n = counts.get(key, 0)
+        counts[key] = n + 1
+        if n:
+            # 같은 계좌의 두 번째 이후 브로커 ('계좌#1', '계좌#2', ...)
+            opts.update(account=False, orders=False)
+            key = f"{key}#{n}"
+        jobs.append((key, broker, opts))
+
+    def _run(job):
+        key, broker, opts = job
+        warmup = getattr(broker, "warmup", None)
+        if warmup is not None:
+            return key, warmup(**opts)
+        t = time.perf_counter()
+        broker.connect()
+        return key, {"timings": {"token": (time.perf_counter() - t) * 1000}, "counts": {}}
+
+    report: Dict[str, dict] = {}
+    if jobs:
+        with ThreadPoolExecutor(max_workers=max_workers or len(jobs)) as pool:
+            for key, result in pool.map(_run, jobs):
+                report[key] = result
+
+    total = (time.perf_counter() - started) * 1000
+    report["_total"] = {"total": total, "brokers": len(jobs)}
+    logger.info("브로커 %d개 예열 완료: %.0fms", len(jobs), total)
+    return report